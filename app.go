@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bytes"
 	"context"
 	"encoding/base64"
 	"encoding/json"
@@ -11,6 +12,7 @@ import (
 	"os"
 
 	"path/filepath"
+	goruntime "runtime"
 
 	"net/http"
 	"strings"
@@ -160,7 +162,7 @@ func fetchCurrentIPInfo() (CurrentIPInfo, error) {
 		Reason      string `json:"reason"`
 	}
 
-	client := &http.Client{Timeout: 8 * time.Second}
+	client := backend.NewAPIHTTPClient(8 * time.Second)
 	tryFetch := func(source, reqURL string, parse func(body []byte) (CurrentIPInfo, error)) (CurrentIPInfo, error) {
 		req, err := http.NewRequest(http.MethodGet, reqURL, nil)
 		if err != nil {
@@ -287,6 +289,8 @@ func (a *App) shutdown(ctx context.Context) {
 	backend.CloseHistoryDB()
 	backend.CloseISRCCacheDB()
 	backend.CloseProviderPriorityDB()
+	backend.FlushTidalAPIUsage()
+	backend.FlushConsole()
 }
 
 type SpotifyMetadataRequest struct {
@@ -382,6 +386,7 @@ func (a *App) GetStreamingURLs(spotifyTrackID string, region string) (string, er
 }
 
 func (a *App) GetSpotifyMetadata(req SpotifyMetadataRequest) (string, error) {
+	req.URL = strings.TrimSpace(req.URL)
 	if req.URL == "" {
 		return "", fmt.Errorf("URL parameter is required")
 	}
@@ -411,6 +416,11 @@ func (a *App) GetSpotifyMetadata(req SpotifyMetadataRequest) (string, error) {
 		}
 	}
 
+	cacheKey := backend.SpotifyMetadataCacheKey(req.URL, req.Batch, separator)
+	if cached, ok := backend.GetCachedSpotifyMetadata(cacheKey); ok {
+		return cached, nil
+	}
+
 	data, err := backend.GetFilteredSpotifyData(ctx, req.URL, req.Batch, time.Duration(req.Delay*float64(time.Second)), separator, func(tracks interface{}) {
 		runtime.EventsEmit(a.ctx, "metadata-stream", tracks)
 	})
@@ -423,6 +433,10 @@ func (a *App) GetSpotifyMetadata(req SpotifyMetadataRequest) (string, error) {
 		return "", fmt.Errorf("failed to encode response: %v", err)
 	}
 
+	if err := backend.PutCachedSpotifyMetadata(cacheKey, jsonData); err != nil {
+		fmt.Printf("Warning: failed to cache Spotify metadata: %v\n", err)
+	}
+
 	return string(jsonData), nil
 }
 
@@ -508,8 +522,14 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 		req.FilenameFormat = "title-artist"
 	}
 	shouldResolveISRC := strings.Contains(req.FilenameFormat, "{isrc}") || backend.GetExistingFileCheckModeSetting() == "isrc"
+	var resolvedISRC chan string
 	if req.ISRC == "" && shouldResolveISRC && req.SpotifyID != "" {
-		req.ISRC = backend.ResolveTrackISRC(req.SpotifyID)
+		// Resolve the ISRC while the Spotify metadata below is being fetched
+		// instead of paying for both round trips one after the other.
+		resolvedISRC = make(chan string, 1)
+		go func(spotifyID string) {
+			resolvedISRC <- backend.ResolveTrackISRC(spotifyID)
+		}(req.SpotifyID)
 	}
 
 	itemID := req.ItemID
@@ -525,7 +545,6 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 	}
 
 	backend.SetDownloading(true)
-	backend.StartDownloadItem(itemID)
 	defer backend.SetDownloading(false)
 
 	spotifyURL := ""
@@ -536,7 +555,7 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 	metadataSeparator := req.Separator
 	if metadataSeparator == "" {
 		metadataSeparator = ", "
-		metadataSettings, _ := a.LoadSettings()
+		metadataSettings, _ := backend.LoadConfigSettings()
 		if metadataSettings != nil {
 			if sep, ok := metadataSettings["separator"].(string); ok {
 				if sep == "semicolon" {
@@ -596,6 +615,10 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 		}
 	}
 
+	if resolvedISRC != nil {
+		req.ISRC = <-resolvedISRC
+	}
+
 	if req.TrackName != "" && req.ArtistName != "" {
 		expectedFilename := backend.BuildExpectedFilename(req.TrackName, req.ArtistName, req.AlbumName, req.AlbumArtist, req.ReleaseDate, req.FilenameFormat, req.PlaylistName, req.PlaylistOwner, req.TrackNumber, req.Position, req.SpotifyDiscNumber, req.UseAlbumTrackNumber, req.ISRC)
 		expectedPath := filepath.Join(req.OutputDir, expectedFilename)
@@ -651,10 +674,20 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 		close(isrcChan)
 	}
 
+	// The slot is released as soon as the transfer ends so validation and
+	// metadata work don't hold it; the deferred call covers every other exit.
+	// The item only shows as downloading once it holds the slot.
+	var releaseOnce sync.Once
+	acquiredSlot := backend.AcquireServiceSlot(req.Service)
+	releaseServiceSlot := func() { releaseOnce.Do(acquiredSlot) }
+	defer releaseServiceSlot()
+	backend.StartDownloadItem(itemID)
+
 	switch req.Service {
 	case "amazon":
 
 		downloader := backend.NewAmazonDownloader()
+		downloader.SetItemID(itemID)
 		if req.ServiceURL != "" {
 			filename, err = downloader.DownloadByURL(req.ServiceURL, req.OutputDir, req.AudioFormat, req.FilenameFormat, req.PlaylistName, req.PlaylistOwner, req.TrackNumber, req.Position, req.TrackName, req.ArtistName, req.AlbumName, req.AlbumArtist, req.ReleaseDate, req.CoverURL, req.SpotifyTrackNumber, req.SpotifyDiscNumber, req.SpotifyTotalTracks, req.EmbedMaxQualityCover, req.SpotifyTotalDiscs, req.Copyright, req.Publisher, req.Composer, metadataSeparator, req.ISRC, spotifyURL, req.UseFirstArtistOnly, req.UseSingleGenre, req.EmbedGenre)
 		} else {
@@ -664,6 +697,7 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 	case "tidal":
 		if req.TidalAPIURL == "" || req.TidalAPIURL == "auto" {
 			downloader := backend.NewTidalDownloader("")
+			downloader.SetItemID(itemID)
 			if req.ServiceURL != "" {
 				filename, err = downloader.DownloadByURLWithFallback(req.ServiceURL, req.OutputDir, req.AudioFormat, req.FilenameFormat, req.TrackNumber, req.Position, req.TrackName, req.ArtistName, req.AlbumName, req.AlbumArtist, req.ReleaseDate, req.UseAlbumTrackNumber, req.CoverURL, req.EmbedMaxQualityCover, req.SpotifyTrackNumber, req.SpotifyDiscNumber, req.SpotifyTotalTracks, req.SpotifyTotalDiscs, req.Copyright, req.Publisher, req.Composer, metadataSeparator, req.ISRC, spotifyURL, req.AllowFallback, req.UseFirstArtistOnly, req.UseSingleGenre, req.EmbedGenre)
 			} else {
@@ -671,6 +705,7 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 			}
 		} else {
 			downloader := backend.NewTidalDownloader(req.TidalAPIURL)
+			downloader.SetItemID(itemID)
 			if req.ServiceURL != "" {
 				filename, err = downloader.DownloadByURL(req.ServiceURL, req.OutputDir, req.AudioFormat, req.FilenameFormat, req.TrackNumber, req.Position, req.TrackName, req.ArtistName, req.AlbumName, req.AlbumArtist, req.ReleaseDate, req.UseAlbumTrackNumber, req.CoverURL, req.EmbedMaxQualityCover, req.SpotifyTrackNumber, req.SpotifyDiscNumber, req.SpotifyTotalTracks, req.SpotifyTotalDiscs, req.Copyright, req.Publisher, req.Composer, metadataSeparator, req.ISRC, spotifyURL, req.AllowFallback, req.UseFirstArtistOnly, req.UseSingleGenre, req.EmbedGenre)
 			} else {
@@ -686,6 +721,7 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 			isrc = <-isrcChan
 		}
 		downloader := backend.NewQobuzDownloader()
+		downloader.SetItemID(itemID)
 		quality := req.AudioFormat
 		if quality == "" {
 			quality = "6"
@@ -698,17 +734,17 @@ func (a *App) DownloadTrack(req DownloadRequest) (DownloadResponse, error) {
 			Error:   fmt.Sprintf("Unknown service: %s", req.Service),
 		}, fmt.Errorf("unknown service: %s", req.Service)
 	}
+	releaseServiceSlot()
 
 	if err != nil {
 		backend.FailDownloadItem(itemID, fmt.Sprintf("Download failed: %v", err))
 
 		if filename != "" && !strings.HasPrefix(filename, "EXISTS:") {
 
-			if _, statErr := os.Stat(filename); statErr == nil {
-				fmt.Printf("Removing corrupted/partial file after failed download: %s\n", filename)
-				if removeErr := os.Remove(filename); removeErr != nil {
-					fmt.Printf("Warning: Failed to remove corrupted file %s: %v\n", filename, removeErr)
-				}
+			if removeErr := os.Remove(filename); removeErr == nil {
+				fmt.Printf("Removed corrupted/partial file after failed download: %s\n", filename)
+			} else if !os.IsNotExist(removeErr) {
+				fmt.Printf("Warning: Failed to remove corrupted file %s: %v\n", filename, removeErr)
 			}
 		}
 
@@ -892,6 +928,17 @@ func (a *App) GetDownloadQueue() backend.DownloadQueueInfo {
 	return backend.GetDownloadQueue()
 }
 
+func (a *App) GetDownloadQueueSummary() backend.DownloadQueueInfo {
+	return backend.GetDownloadQueueSummary()
+}
+
+func (a *App) WaitForDownloadQueueChange(lastVersion int64, timeoutMs int) int64 {
+	if timeoutMs <= 0 {
+		timeoutMs = 5000
+	}
+	return backend.WaitForDownloadQueueChange(lastVersion, time.Duration(timeoutMs)*time.Millisecond)
+}
+
 func (a *App) ClearCompletedDownloads() {
 	backend.ClearDownloadQueue()
 }
@@ -906,6 +953,30 @@ func (a *App) AddToDownloadQueue(spotifyID, trackName, artistName, albumName str
 	return itemID
 }
 
+type DownloadQueueEntry struct {
+	SpotifyID  string `json:"spotify_id"`
+	TrackName  string `json:"track_name"`
+	ArtistName string `json:"artist_name"`
+	AlbumName  string `json:"album_name"`
+}
+
+func (a *App) AddToDownloadQueueBatch(entries []DownloadQueueEntry) []string {
+	itemIDs := make([]string, len(entries))
+	items := make([]backend.DownloadItem, len(entries))
+	now := time.Now().UnixNano()
+	for i, entry := range entries {
+		itemIDs[i] = fmt.Sprintf("%s-%d", entry.SpotifyID, now+int64(i))
+		items[i] = backend.DownloadItem{
+			ID:         itemIDs[i],
+			TrackName:  entry.TrackName,
+			ArtistName: entry.ArtistName,
+			AlbumName:  entry.AlbumName,
+		}
+	}
+	backend.AddBatchToQueue(items)
+	return itemIDs
+}
+
 func (a *App) MarkDownloadItemFailed(itemID, errorMsg string) {
 	backend.FailDownloadItem(itemID, errorMsg)
 }
@@ -915,45 +986,30 @@ func (a *App) CancelAllQueuedItems() {
 }
 
 func (a *App) ExportFailedDownloads() (string, error) {
-	queueInfo := backend.GetDownloadQueue()
-	var failedItems []string
-
-	hasFailed := false
-	for _, item := range queueInfo.Queue {
-		if item.Status == backend.StatusFailed {
-			hasFailed = true
-			break
-		}
-	}
-
-	if !hasFailed {
+	failedItems := backend.GetFailedDownloadItems()
+	if len(failedItems) == 0 {
 		return "No failed downloads to export.", nil
 	}
 
-	failedItems = append(failedItems, fmt.Sprintf("Failed Downloads Report - %s", time.Now().Format("2006-01-02 15:04:05")))
-	failedItems = append(failedItems, strings.Repeat("-", 50))
-	failedItems = append(failedItems, "")
-
-	count := 0
-	for _, item := range queueInfo.Queue {
-		if item.Status == backend.StatusFailed {
-			count++
-			line := fmt.Sprintf("%d. %s - %s", count, item.TrackName, item.ArtistName)
-			if item.AlbumName != "" {
-				line += fmt.Sprintf(" (%s)", item.AlbumName)
-			}
-			failedItems = append(failedItems, line)
-			failedItems = append(failedItems, fmt.Sprintf("   Error: %s", item.ErrorMessage))
-
-			if item.SpotifyID != "" {
-				failedItems = append(failedItems, fmt.Sprintf("   ID: %s", item.SpotifyID))
-				failedItems = append(failedItems, fmt.Sprintf("   URL: https://open.spotify.com/track/%s", item.SpotifyID))
-			}
-			failedItems = append(failedItems, "")
+	var report strings.Builder
+	report.WriteString("Failed Downloads Report - " + time.Now().Format("2006-01-02 15:04:05") + "\n")
+	report.WriteString(strings.Repeat("-", 50) + "\n\n")
+	for i, item := range failedItems {
+		fmt.Fprintf(&report, "%d. %s - %s", i+1, item.TrackName, item.ArtistName)
+		if item.AlbumName != "" {
+			report.WriteString(" (" + item.AlbumName + ")")
+		}
+		report.WriteString("\n   Error: " + item.ErrorMessage + "\n")
+		if item.SpotifyID != "" {
+			report.WriteString("   ID: " + item.SpotifyID + "\n")
+			report.WriteString("   URL: https://open.spotify.com/track/" + item.SpotifyID + "\n")
+		}
+		if i < len(failedItems)-1 {
+			report.WriteString("\n")
 		}
 	}
 
-	content := strings.Join(failedItems, "\n")
+	content := report.String()
 	defaultFilename := fmt.Sprintf("SpotiFLAC_%s_Failed.txt", time.Now().Format("20060102_150405"))
 
 	path, err := runtime.SaveFileDialog(a.ctx, runtime.SaveDialogOptions{
@@ -979,32 +1035,37 @@ func (a *App) ExportFailedDownloads() (string, error) {
 		return "", fmt.Errorf("failed to write file: %v", err)
 	}
 
-	return fmt.Sprintf("Successfully exported %d failed downloads to %s", count, path), nil
+	return fmt.Sprintf("Successfully exported %d failed downloads to %s", len(failedItems), path), nil
 }
 
 func (a *App) CheckAPIStatus(apiType string, apiURL string) bool {
+	// Probes share the check's deadline so that, once it times out, the ones
+	// still running are cancelled and give their slots back.
+	ctx, cancel := context.WithTimeout(context.Background(), checkOperationTimeout)
+	defer cancel()
+
 	isOnline, err := runWithTimeout(checkOperationTimeout, func() (bool, error) {
 		switch apiType {
 		case "tidal":
-			if checkGroupedAPIStatus("tidal", buildTidalStatusCheckURLs(apiURL)) {
+			if checkGroupedAPIStatus(ctx, "tidal", buildTidalStatusCheckURLs(apiURL)) {
 				return true, nil
 			}
 			if strings.TrimSpace(apiURL) == "" {
-				if _, refreshErr := backend.RefreshTidalAPIList(true); refreshErr == nil && checkGroupedAPIStatus("tidal", buildTidalStatusCheckURLs("")) {
+				if _, refreshErr := backend.RefreshTidalAPIList(true); refreshErr == nil && checkGroupedAPIStatus(ctx, "tidal", buildTidalStatusCheckURLs("")) {
 					return true, nil
 				}
 			}
 			return false, nil
 		case "qobuz", "qbz":
-			return checkGroupedAPIStatus("qobuz", buildQobuzStatusCheckURLs(apiURL)), nil
+			return checkGroupedAPIStatus(ctx, "qobuz", buildQobuzStatusCheckURLs(apiURL)), nil
 		case "amazon":
-			return checkGroupedAPIStatus("amazon", buildAmazonStatusCheckURLs(apiURL)), nil
+			return checkGroupedAPIStatus(ctx, "amazon", buildAmazonStatusCheckURLs(apiURL)), nil
 		case "lrclib":
-			return checkGroupedAPIStatus("lrclib", buildLRCLIBStatusCheckURLs(apiURL)), nil
+			return checkGroupedAPIStatus(ctx, "lrclib", buildLRCLIBStatusCheckURLs(apiURL)), nil
 		case "musicbrainz":
-			return checkGroupedAPIStatus("musicbrainz", buildMusicBrainzStatusCheckURLs(apiURL)), nil
+			return checkGroupedAPIStatus(ctx, "musicbrainz", buildMusicBrainzStatusCheckURLs(apiURL)), nil
 		default:
-			return checkGroupedAPIStatus(apiType, []string{strings.TrimSpace(apiURL)}), nil
+			return checkGroupedAPIStatus(ctx, apiType, []string{strings.TrimSpace(apiURL)}), nil
 		}
 	})
 	if err != nil {
@@ -1022,6 +1083,26 @@ func (a *App) CheckAPIStatus(apiType string, apiURL string) bool {
 	return isOnline
 }
 
+func (a *App) CheckAPIStatuses(sources map[string]string) map[string]bool {
+	results := make(map[string]bool, len(sources))
+	var resultsMu sync.Mutex
+	var wg sync.WaitGroup
+
+	for apiType, apiURL := range sources {
+		wg.Add(1)
+		go func(apiType, apiURL string) {
+			defer wg.Done()
+			isOnline := a.CheckAPIStatus(apiType, apiURL)
+			resultsMu.Lock()
+			results[apiType] = isOnline
+			resultsMu.Unlock()
+		}(apiType, apiURL)
+	}
+
+	wg.Wait()
+	return results
+}
+
 func (a *App) CheckCustomTidalAPI(apiURL string) bool {
 	type tidalProbeResponse struct {
 		Version string `json:"version"`
@@ -1052,7 +1133,7 @@ func (a *App) CheckCustomTidalAPI(apiURL string) bool {
 	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36")
 	req.Header.Set("Accept", "application/json")
 
-	client := &http.Client{Timeout: 12 * time.Second}
+	client := backend.NewAPIHTTPClient(12 * time.Second)
 	resp, err := client.Do(req)
 	if err != nil {
 		fmt.Printf("[CheckCustomTidalAPI] Probe request failed for %s: %v\n", apiURL, err)
@@ -1174,7 +1255,7 @@ func buildMusicBrainzStatusCheckURLs(apiURL string) []string {
 	return []string{fmt.Sprintf("%s/ws/2/recording?query=%s&fmt=json&limit=1", baseURL, url.QueryEscape(`recording:"Hello" AND artist:"Adele"`))}
 }
 
-func checkGroupedAPIStatus(apiType string, checkURLs []string) bool {
+func checkGroupedAPIStatus(parent context.Context, apiType string, checkURLs []string) bool {
 	filtered := make([]string, 0, len(checkURLs))
 	for _, rawURL := range checkURLs {
 		url := strings.TrimSpace(rawURL)
@@ -1188,6 +1269,9 @@ func checkGroupedAPIStatus(apiType string, checkURLs []string) bool {
 		return false
 	}
 
+	ctx, cancel := context.WithCancel(parent)
+	defer cancel()
+
 	results := make(chan bool, len(filtered))
 	var wg sync.WaitGroup
 
@@ -1195,7 +1279,7 @@ func checkGroupedAPIStatus(apiType string, checkURLs []string) bool {
 		wg.Add(1)
 		go func(target string) {
 			defer wg.Done()
-			results <- checkSingleAPIStatus(apiType, target)
+			results <- checkSingleAPIStatus(ctx, apiType, target)
 		}(checkURL)
 	}
 
@@ -1213,10 +1297,41 @@ func checkGroupedAPIStatus(apiType string, checkURLs []string) bool {
 	return false
 }
 
-func checkSingleAPIStatus(apiType string, checkURL string) bool {
-	client := &http.Client{Timeout: 4 * time.Second}
+var apiStatusHTTPClient = backend.NewAPIHTTPClient(4 * time.Second)
+
+const maxConcurrentAPIStatusChecks = 6
+
+// apiStatusCheckSlots caps concurrent probes per service, so a long mirror
+// list for one service cannot hold up the checks of the others.
+var (
+	apiStatusCheckSlots     = make(map[string]chan struct{})
+	apiStatusCheckSlotsLock sync.Mutex
+)
+
+func apiStatusCheckSlot(apiType string) chan struct{} {
+	apiStatusCheckSlotsLock.Lock()
+	defer apiStatusCheckSlotsLock.Unlock()
+
+	slot, ok := apiStatusCheckSlots[apiType]
+	if !ok {
+		slot = make(chan struct{}, maxConcurrentAPIStatusChecks)
+		apiStatusCheckSlots[apiType] = slot
+	}
+	return slot
+}
+
+func checkSingleAPIStatus(ctx context.Context, apiType string, checkURL string) bool {
+	slot := apiStatusCheckSlot(apiType)
+	select {
+	case slot <- struct{}{}:
+	case <-ctx.Done():
+		return false
+	}
+	defer func() { <-slot }()
+
+	client := apiStatusHTTPClient
 	if (apiType == "qobuz" || apiType == "qbz") && strings.EqualFold(strings.TrimSpace(checkURL), strings.TrimSpace(backend.GetQobuzMusicDLDownloadAPIURL())) {
-		return backend.CheckQobuzMusicDLStatus(client)
+		return backend.CheckQobuzMusicDLStatus(ctx, client)
 	}
 
 	req, err := backend.NewRequestWithDefaultHeaders(http.MethodGet, checkURL, nil)
@@ -1224,7 +1339,7 @@ func checkSingleAPIStatus(apiType string, checkURL string) bool {
 		return false
 	}
 
-	resp, err := client.Do(req)
+	resp, err := client.Do(req.WithContext(ctx))
 	if err != nil {
 		return false
 	}
@@ -1255,10 +1370,21 @@ func (a *App) Quit() {
 	panic("quit")
 }
 
+func (a *App) ClearMetadataCache() error {
+	return backend.ClearMetadataCache()
+}
+
 func (a *App) GetDownloadHistory() ([]backend.HistoryItem, error) {
 	return backend.GetHistoryItems("SpotiFLAC")
 }
 
+func (a *App) WaitForHistoryChange(kind string, lastVersion int64, timeoutMs int) int64 {
+	if timeoutMs <= 0 {
+		timeoutMs = 30000
+	}
+	return backend.WaitForHistoryChange(kind, lastVersion, time.Duration(timeoutMs)*time.Millisecond)
+}
+
 func (a *App) ClearDownloadHistory() error {
 	return backend.ClearHistory("SpotiFLAC")
 }
@@ -1832,6 +1958,93 @@ func normalizeExistingFileIdentifier(value string) string {
 	return strings.ToUpper(strings.TrimSpace(value))
 }
 
+type directoryFileSizeCache struct {
+	mu      sync.Mutex
+	entries map[string]*directoryFileSizeEntry
+}
+
+type directoryFileSizeEntry struct {
+	once  sync.Once
+	sizes map[string]int64
+}
+
+func newDirectoryFileSizeCache() *directoryFileSizeCache {
+	return &directoryFileSizeCache{entries: make(map[string]*directoryFileSizeEntry)}
+}
+
+func directoryFileSizeKey(name string) string {
+	if goruntime.GOOS == "windows" || goruntime.GOOS == "darwin" {
+		return strings.ToLower(name)
+	}
+	return name
+}
+
+func (c *directoryFileSizeCache) fileSize(path string) int64 {
+	dir := filepath.Dir(path)
+
+	c.mu.Lock()
+	entry, ok := c.entries[dir]
+	if !ok {
+		entry = &directoryFileSizeEntry{}
+		c.entries[dir] = entry
+	}
+	c.mu.Unlock()
+
+	entry.once.Do(func() {
+		entry.sizes = make(map[string]int64)
+		dirEntries, err := os.ReadDir(dir)
+		if err != nil {
+			return
+		}
+		for _, dirEntry := range dirEntries {
+			if dirEntry.IsDir() {
+				continue
+			}
+			info, err := dirEntry.Info()
+			if err == nil && info.Mode()&os.ModeSymlink != 0 {
+				info, err = os.Stat(filepath.Join(dir, dirEntry.Name()))
+			}
+			if err != nil || info.IsDir() {
+				continue
+			}
+			entry.sizes[directoryFileSizeKey(dirEntry.Name())] = info.Size()
+		}
+	})
+
+	return entry.sizes[directoryFileSizeKey(filepath.Base(path))]
+}
+
+const existingFileLookupIndexTTL = time.Minute
+
+var existingFileLookupCache struct {
+	sync.Mutex
+	scanRoot string
+	mode     string
+	builtAt  time.Time
+	index    existingFileLookupIndex
+}
+
+func cachedExistingFileLookupIndex(scanRoot string, mode string) existingFileLookupIndex {
+	c := &existingFileLookupCache
+	c.Lock()
+	defer c.Unlock()
+
+	if c.index.byFilename != nil && c.scanRoot == scanRoot && c.mode == mode && time.Since(c.builtAt) < existingFileLookupIndexTTL {
+		return c.index
+	}
+
+	c.index = buildExistingFileLookupIndex(scanRoot, mode)
+	c.scanRoot = scanRoot
+	c.mode = mode
+	c.builtAt = time.Now()
+	return c.index
+}
+
+func isExistingAudioFile(path string) bool {
+	info, err := os.Stat(path)
+	return err == nil && !info.IsDir() && info.Size() > 100*1024
+}
+
 func buildExistingFileLookupIndex(scanRoot string, mode string) existingFileLookupIndex {
 	index := existingFileLookupIndex{
 		byFilename: make(map[string]string),
@@ -1900,11 +2113,12 @@ func (a *App) CheckFilesExistence(outputDir string, rootDir string, tracks []Che
 	}
 
 	resultsChan := make(chan result, len(tracks))
+	dirSizes := newDirectoryFileSizeCache()
 	var lookupIndex existingFileLookupIndex
 	var lookupIndexOnce sync.Once
 	getLookupIndex := func() existingFileLookupIndex {
 		lookupIndexOnce.Do(func() {
-			lookupIndex = buildExistingFileLookupIndex(scanRoot, existingFileCheckMode)
+			lookupIndex = cachedExistingFileLookupIndex(scanRoot, existingFileCheckMode)
 		})
 		return lookupIndex
 	}
@@ -1971,7 +2185,6 @@ func (a *App) CheckFilesExistence(outputDir string, rootDir string, tracks []Che
 
 			expectedPath := filepath.Join(targetDir, expectedFilename)
 			if redownloadWithSuffix {
-				expectedPath, _ = backend.ResolveOutputPathForDownload(expectedPath, true)
 				resultsChan <- result{index: idx, result: res}
 				return
 			}
@@ -1984,15 +2197,15 @@ func (a *App) CheckFilesExistence(outputDir string, rootDir string, tracks []Che
 
 			switch effectiveMode {
 			case "isrc":
-				if path, ok := getLookupIndex().byISRC[normalizedISRC]; ok {
+				if path, ok := getLookupIndex().byISRC[normalizedISRC]; ok && isExistingAudioFile(path) {
 					res.Exists = true
 					res.FilePath = path
 				}
 			default:
-				if fileInfo, err := os.Stat(expectedPath); err == nil && fileInfo.Size() > 100*1024 {
+				if dirSizes.fileSize(expectedPath) > 100*1024 {
 					res.Exists = true
 					res.FilePath = expectedPath
-				} else if path, ok := getLookupIndex().byFilename[filepath.Base(expectedPath)]; ok {
+				} else if path, ok := getLookupIndex().byFilename[filepath.Base(expectedPath)]; ok && isExistingAudioFile(path) {
 					res.Exists = true
 					res.FilePath = path
 				}
@@ -2016,6 +2229,10 @@ func (a *App) SkipDownloadItem(itemID, filePath string) {
 	backend.SkipDownloadItem(itemID, filePath)
 }
 
+func (a *App) SkipDownloadItems(filePaths map[string]string) {
+	backend.SkipDownloadItems(filePaths)
+}
+
 func (a *App) GetTrackISRC(spotifyTrackID string) string {
 	return backend.ResolveTrackISRC(spotifyTrackID)
 }
@@ -2046,18 +2263,16 @@ func (a *App) SaveSettings(settings map[string]interface{}) error {
 		return err
 	}
 
-	dir := filepath.Dir(configPath)
-	if _, err := os.Stat(dir); os.IsNotExist(err) {
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			return err
-		}
-	}
-
 	data, err := json.MarshalIndent(settings, "", "  ")
 	if err != nil {
 		return err
 	}
 
+	if existing, err := os.ReadFile(configPath); err == nil && bytes.Equal(existing, data) {
+		return nil
+	}
+
+	defer backend.InvalidateConfigSettingsCache()
 	return os.WriteFile(configPath, data, 0644)
 }
 
@@ -2067,13 +2282,6 @@ func (a *App) SaveFonts(fonts []map[string]interface{}) error {
 		return err
 	}
 
-	dir := filepath.Dir(fontsPath)
-	if _, err := os.Stat(dir); os.IsNotExist(err) {
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			return err
-		}
-	}
-
 	data, err := json.MarshalIndent(fonts, "", "  ")
 	if err != nil {
 		return err
@@ -2088,11 +2296,10 @@ func (a *App) LoadSettings() (map[string]interface{}, error) {
 		return nil, err
 	}
 
-	if _, err := os.Stat(configPath); os.IsNotExist(err) {
+	data, err := os.ReadFile(configPath)
+	if os.IsNotExist(err) {
 		return nil, nil
 	}
-
-	data, err := os.ReadFile(configPath)
 	if err != nil {
 		return nil, err
 	}
@@ -2111,11 +2318,10 @@ func (a *App) LoadFonts() ([]map[string]interface{}, error) {
 		return nil, err
 	}
 
-	if _, err := os.Stat(fontsPath); os.IsNotExist(err) {
+	data, err := os.ReadFile(fontsPath)
+	if os.IsNotExist(err) {
 		return nil, nil
 	}
-
-	data, err := os.ReadFile(fontsPath)
 	if err != nil {
 		return nil, err
 	}
@@ -20,6 +20,7 @@ import (
 type AmazonDownloader struct {
 	client  *http.Client
 	regions []string
+	itemID  string
 }
 
 type AmazonStreamResponse struct {
@@ -33,6 +34,8 @@ var (
 	amazonMusicDebugKeyErr  error
 )
 
+var amazonASINPattern = regexp.MustCompile(`(B[0-9A-Z]{9})`)
+
 var amazonMusicDebugKeySeedParts = [][]byte{
 	[]byte("spotif"),
 	[]byte("lac:am"),
@@ -99,13 +102,15 @@ func getAmazonMusicDebugKey() (string, error) {
 
 func NewAmazonDownloader() *AmazonDownloader {
 	return &AmazonDownloader{
-		client: &http.Client{
-			Timeout: 120 * time.Second,
-		},
+		client:  NewDownloadHTTPClient(120 * time.Second),
 		regions: []string{"us", "eu"},
 	}
 }
 
+func (a *AmazonDownloader) SetItemID(itemID string) {
+	a.itemID = itemID
+}
+
 func (a *AmazonDownloader) GetAmazonURLFromSpotify(spotifyTrackID string) (string, error) {
 	fmt.Println("Getting Amazon URL...")
 	client := NewSongLinkClient()
@@ -123,9 +128,7 @@ func (a *AmazonDownloader) GetAmazonURLFromSpotify(spotifyTrackID string) (strin
 }
 
 func (a *AmazonDownloader) DownloadFromAfkarXYZ(amazonURL, outputDir, quality string) (string, error) {
-
-	asinRegex := regexp.MustCompile(`(B[0-9A-Z]{9})`)
-	asin := asinRegex.FindString(amazonURL)
+	asin := amazonASINPattern.FindString(amazonURL)
 	if asin == "" {
 		return "", fmt.Errorf("failed to extract ASIN from URL: %s", amazonURL)
 	}
@@ -143,7 +146,7 @@ func (a *AmazonDownloader) DownloadFromAfkarXYZ(amazonURL, outputDir, quality st
 	req.Header.Set("X-Debug-Key", debugKey)
 
 	fmt.Printf("Fetching from Amazon API (ASIN: %s)...\n", asin)
-	resp, err := a.client.Do(req)
+	resp, err := DoWithRateLimitRetry(a.client, req)
 	if err != nil {
 		return "", err
 	}
@@ -171,33 +174,24 @@ func (a *AmazonDownloader) DownloadFromAfkarXYZ(amazonURL, outputDir, quality st
 	fileName := fmt.Sprintf("%s.m4a", asin)
 	filePath := filepath.Join(outputDir, fileName)
 
-	out, err := os.Create(filePath)
-	if err != nil {
-		return "", err
-	}
-	defer out.Close()
-
 	dlReq, err := NewRequestWithDefaultHeaders(http.MethodGet, downloadURL, nil)
 	if err != nil {
 		return "", err
 	}
 
-	dlResp, err := a.client.Do(dlReq)
+	dlResp, err := NewDownloadHTTPClient(0).Do(dlReq)
 	if err != nil {
 		return "", err
 	}
 	defer dlResp.Body.Close()
 
 	fmt.Printf("Downloading track: %s\n", fileName)
-	pw := NewProgressWriter(out)
-	_, err = io.Copy(pw, dlResp.Body)
+	written, err := downloadToFile(filePath, dlResp.Body, dlResp.ContentLength, a.itemID)
 	if err != nil {
-		out.Close()
-		os.Remove(filePath)
 		return "", err
 	}
 
-	fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(pw.GetTotal())/(1024*1024))
+	fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(written)/(1024*1024))
 
 	if apiResp.DecryptionKey != "" {
 		fmt.Printf("Decrypting file...\n")
@@ -265,14 +259,16 @@ func (a *AmazonDownloader) DownloadFromAfkarXYZ(amazonURL, outputDir, quality st
 			return "", fmt.Errorf("decrypted file missing or empty")
 		}
 
-		if err := os.Remove(filePath); err != nil {
-			fmt.Printf("Warning: Failed to remove encrypted file: %v\n", err)
-		}
-
 		finalPath := filepath.Join(outputDir, strings.TrimPrefix(decryptedFilename, "dec_"))
 		if err := os.Rename(decryptedPath, finalPath); err != nil {
 			return "", fmt.Errorf("failed to rename decrypted file: %w", err)
 		}
+
+		if finalPath != filePath {
+			if err := os.Remove(filePath); err != nil {
+				fmt.Printf("Warning: Failed to remove encrypted file: %v\n", err)
+			}
+		}
 		filePath = finalPath
 
 		fmt.Println("Decryption successful")
@@ -293,15 +289,18 @@ func (a *AmazonDownloader) DownloadByURL(amazonURL, outputDir, quality, filename
 		}
 	}
 
+	filenameArtist := spotifyArtistName
+	filenameAlbumArtist := spotifyAlbumArtist
+	if useFirstArtistOnly {
+		filenameArtist = GetFirstArtist(spotifyArtistName)
+		filenameAlbumArtist = GetFirstArtist(spotifyAlbumArtist)
+	}
+	filenameISRC := strings.TrimSpace(isrcOverride)
+	filenameBase := ""
+
 	if spotifyTrackName != "" && spotifyArtistName != "" {
-		filenameArtist := spotifyArtistName
-		filenameAlbumArtist := spotifyAlbumArtist
-		if useFirstArtistOnly {
-			filenameArtist = GetFirstArtist(spotifyArtistName)
-			filenameAlbumArtist = GetFirstArtist(spotifyAlbumArtist)
-		}
-		expectedFilename := BuildExpectedFilename(spotifyTrackName, filenameArtist, spotifyAlbumName, filenameAlbumArtist, spotifyReleaseDate, filenameFormat, playlistName, playlistOwner, includeTrackNumber, position, spotifyDiscNumber, false, isrcOverride)
-		expectedPath := filepath.Join(outputDir, expectedFilename)
+		filenameBase = buildFormattedFilenameBase(spotifyTrackName, filenameArtist, spotifyAlbumName, filenameAlbumArtist, spotifyReleaseDate, filenameFormat, playlistName, playlistOwner, filenameISRC, includeTrackNumber, position, spotifyDiscNumber, false)
+		expectedPath := filepath.Join(outputDir, filenameBase+".flac")
 
 		if !GetRedownloadWithSuffixSetting() {
 			if fileInfo, err := os.Stat(expectedPath); err == nil && fileInfo.Size() > 0 {
@@ -321,14 +320,11 @@ func (a *AmazonDownloader) DownloadByURL(amazonURL, outputDir, quality, filename
 		go func() {
 			res := mbResult{}
 			var isrc string
-			parts := strings.Split(spotifyURL, "/")
-			if len(parts) > 0 {
-				sID := strings.Split(parts[len(parts)-1], "?")[0]
-				if sID != "" {
-					client := NewSongLinkClient()
-					if val, err := client.GetISRC(sID); err == nil {
-						isrc = val
-					}
+			sID, _, _ := strings.Cut(spotifyURL[strings.LastIndexByte(spotifyURL, '/')+1:], "?")
+			if sID != "" {
+				client := NewSongLinkClient()
+				if val, err := client.GetISRC(sID); err == nil {
+					isrc = val
 				}
 			}
 			res.ISRC = isrc
@@ -381,70 +377,16 @@ func (a *AmazonDownloader) DownloadByURL(amazonURL, outputDir, quality, filename
 	originalFileDir := filepath.Dir(filePath)
 	originalFileBase := strings.TrimSuffix(filepath.Base(filePath), filepath.Ext(filePath))
 
-	if spotifyTrackName != "" && spotifyArtistName != "" {
-		safeArtist := sanitizeFilename(spotifyArtistName)
-		safeAlbumArtist := sanitizeFilename(spotifyAlbumArtist)
-
-		if useFirstArtistOnly {
-			safeArtist = sanitizeFilename(GetFirstArtist(spotifyArtistName))
-			safeAlbumArtist = sanitizeFilename(GetFirstArtist(spotifyAlbumArtist))
-		}
-
-		safeTitle := sanitizeFilename(spotifyTrackName)
-		safeAlbum := sanitizeFilename(spotifyAlbumName)
-
-		year := ""
-		if len(spotifyReleaseDate) >= 4 {
-			year = spotifyReleaseDate[:4]
-		}
-
-		var newFilename string
-
-		if strings.Contains(filenameFormat, "{") {
-			newFilename = filenameFormat
-			newFilename = strings.ReplaceAll(newFilename, "{title}", safeTitle)
-			newFilename = strings.ReplaceAll(newFilename, "{artist}", safeArtist)
-			newFilename = strings.ReplaceAll(newFilename, "{album}", safeAlbum)
-			newFilename = strings.ReplaceAll(newFilename, "{album_artist}", safeAlbumArtist)
-			newFilename = strings.ReplaceAll(newFilename, "{year}", year)
-			newFilename = strings.ReplaceAll(newFilename, "{date}", SanitizeFilename(spotifyReleaseDate))
-			newFilename = strings.ReplaceAll(newFilename, "{isrc}", SanitizeOptionalFilename(isrc))
-
-			if spotifyDiscNumber > 0 {
-				newFilename = strings.ReplaceAll(newFilename, "{disc}", fmt.Sprintf("%d", spotifyDiscNumber))
-			} else {
-				newFilename = strings.ReplaceAll(newFilename, "{disc}", "")
-			}
-
-			if position > 0 {
-				newFilename = strings.ReplaceAll(newFilename, "{track}", fmt.Sprintf("%02d", position))
-			} else {
-
-				newFilename = regexp.MustCompile(`\{track\}\.\s*`).ReplaceAllString(newFilename, "")
-				newFilename = regexp.MustCompile(`\{track\}\s*-\s*`).ReplaceAllString(newFilename, "")
-				newFilename = regexp.MustCompile(`\{track\}\s*`).ReplaceAllString(newFilename, "")
-			}
-		} else {
-
-			switch filenameFormat {
-			case "artist-title":
-				newFilename = fmt.Sprintf("%s - %s", safeArtist, safeTitle)
-			case "title":
-				newFilename = safeTitle
-			default:
-				newFilename = fmt.Sprintf("%s - %s", safeTitle, safeArtist)
-			}
-
-			if includeTrackNumber && position > 0 {
-				newFilename = fmt.Sprintf("%02d. %s", position, newFilename)
-			}
+	if filenameBase != "" {
+		if isrc != filenameISRC && strings.Contains(filenameFormat, "{isrc}") {
+			filenameBase = buildFormattedFilenameBase(spotifyTrackName, filenameArtist, spotifyAlbumName, filenameAlbumArtist, spotifyReleaseDate, filenameFormat, playlistName, playlistOwner, isrc, includeTrackNumber, position, spotifyDiscNumber, false)
 		}
 
 		ext := filepath.Ext(filePath)
 		if ext == "" {
 			ext = ".flac"
 		}
-		newFilename = newFilename + ext
+		newFilename := filenameBase + ext
 		newFilePath := filepath.Join(outputDir, newFilename)
 		if GetRedownloadWithSuffixSetting() {
 			newFilePath, _ = ResolveOutputPathForDownload(newFilePath, true)
@@ -73,8 +73,9 @@ func GetMetadataWithFFprobe(filePath string) (*AnalysisResult, error) {
 	}
 
 	infoMap := make(map[string]string)
-	lines := strings.Split(string(output), "\n")
-	for _, line := range lines {
+	for rest := string(output); rest != ""; {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
 		if strings.Contains(line, "=") {
 			parts := strings.SplitN(line, "=", 2)
 			infoMap[strings.TrimSpace(parts[0])] = strings.TrimSpace(parts[1])
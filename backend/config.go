@@ -5,8 +5,23 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
+	"time"
 )
 
+var (
+	configSettingsCache     map[string]interface{}
+	configSettingsModTime   time.Time
+	configSettingsSize      int64
+	configSettingsReadAt    time.Time
+	configSettingsCacheLock sync.Mutex
+)
+
+// configModTimeRacyWindow covers coarse filesystem timestamps: a file read
+// within this long of its last modification could be rewritten with the same
+// size and mtime, so such a read is not trusted for later lookups.
+const configModTimeRacyWindow = 2 * time.Second
+
 func GetDefaultMusicPath() string {
 
 	homeDir, err := os.UserHomeDir()
@@ -33,9 +48,22 @@ func LoadConfigSettings() (map[string]interface{}, error) {
 		return nil, err
 	}
 
-	if _, err := os.Stat(configPath); os.IsNotExist(err) {
+	info, err := os.Stat(configPath)
+	if os.IsNotExist(err) {
 		return nil, nil
 	}
+	if err != nil {
+		return nil, err
+	}
+
+	configSettingsCacheLock.Lock()
+	defer configSettingsCacheLock.Unlock()
+
+	if configSettingsCache != nil && info.ModTime().Equal(configSettingsModTime) && info.Size() == configSettingsSize &&
+		configSettingsReadAt.Sub(configSettingsModTime) > configModTimeRacyWindow {
+		return configSettingsCache, nil
+	}
+	readAt := time.Now()
 
 	data, err := os.ReadFile(configPath)
 	if err != nil {
@@ -47,9 +75,22 @@ func LoadConfigSettings() (map[string]interface{}, error) {
 		return nil, err
 	}
 
+	configSettingsCache = settings
+	configSettingsModTime = info.ModTime()
+	configSettingsSize = info.Size()
+	configSettingsReadAt = readAt
+
 	return settings, nil
 }
 
+// InvalidateConfigSettingsCache forces the next LoadConfigSettings to re-read
+// config.json; call it after writing the file.
+func InvalidateConfigSettingsCache() {
+	configSettingsCacheLock.Lock()
+	configSettingsCache = nil
+	configSettingsCacheLock.Unlock()
+}
+
 func GetRedownloadWithSuffixSetting() bool {
 	settings, err := LoadConfigSettings()
 	if err != nil || settings == nil {
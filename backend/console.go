@@ -0,0 +1,119 @@
+package backend
+
+import (
+	"fmt"
+	"os"
+	"time"
+)
+
+const (
+	consoleBacklogChunks = 256
+	consoleMaxBatchBytes = 64 * 1024
+	consoleFlushTimeout  = 2 * time.Second
+)
+
+// consoleIsTerminal reports whether the process stdout is an interactive
+// terminal. Carriage-return progress lines are only useful there; when
+// stdout is redirected or detached they are skipped instead of formatted.
+var consoleIsTerminal = stdoutIsTerminal()
+
+func stdoutIsTerminal() bool {
+	info, err := os.Stdout.Stat()
+	if err != nil {
+		return false
+	}
+	return info.Mode()&os.ModeCharDevice != 0
+}
+
+var (
+	consolePipe *os.File
+	consoleOut  *os.File
+	consoleDone chan struct{}
+)
+
+func consoleDropMarker(dropped int) []byte {
+	return []byte(fmt.Sprintf("\n[console] dropped %d bytes\n", dropped))
+}
+
+func StartAsyncConsole() {
+	reader, writer, err := os.Pipe()
+	if err != nil {
+		return
+	}
+
+	console := os.Stdout
+	chunks := make(chan []byte, consoleBacklogChunks)
+	done := make(chan struct{})
+
+	go func() {
+		defer close(done)
+		for chunk := range chunks {
+			batch := chunk
+		drain:
+			for len(batch) < consoleMaxBatchBytes {
+				select {
+				case more, ok := <-chunks:
+					if !ok {
+						break drain
+					}
+					batch = append(batch, more...)
+				default:
+					break drain
+				}
+			}
+			_, _ = console.Write(batch)
+		}
+	}()
+
+	go func() {
+		defer close(chunks)
+		buf := make([]byte, 32*1024)
+		// Output that does not fit in the backlog is dropped rather than
+		// blocking the writer; the next chunk that gets through says how much.
+		dropped := 0
+		for {
+			n, err := reader.Read(buf)
+			if n > 0 {
+				chunk := append([]byte(nil), buf[:n]...)
+				if dropped > 0 {
+					chunk = append(consoleDropMarker(dropped), chunk...)
+				}
+				select {
+				case chunks <- chunk:
+					dropped = 0
+				default:
+					dropped += n
+				}
+			}
+			if err != nil {
+				if dropped > 0 {
+					chunks <- consoleDropMarker(dropped)
+				}
+				return
+			}
+		}
+	}()
+
+	consolePipe = writer
+	consoleOut = console
+	consoleDone = done
+	os.Stdout = writer
+}
+
+// FlushConsole restores the original stdout and waits briefly for the
+// backlog captured by StartAsyncConsole to be written out, so messages
+// printed just before exit are not lost.
+func FlushConsole() {
+	if consolePipe == nil {
+		return
+	}
+
+	os.Stdout = consoleOut
+	_ = consolePipe.Close()
+	consolePipe = nil
+
+	select {
+	case <-consoleDone:
+	case <-time.After(consoleFlushTimeout):
+	}
+}
@@ -9,7 +9,6 @@ import (
 	"net/http"
 	"os"
 	"path/filepath"
-	"regexp"
 	"strings"
 	"time"
 
@@ -65,7 +64,7 @@ type CoverClient struct {
 
 func NewCoverClient() *CoverClient {
 	return &CoverClient{
-		httpClient: &http.Client{Timeout: 30 * time.Second},
+		httpClient: NewAPIHTTPClient(30 * time.Second),
 	}
 }
 
@@ -83,28 +82,14 @@ func buildCoverFilename(trackName, artistName, albumName, albumArtist, releaseDa
 	var filename string
 
 	if strings.Contains(filenameFormat, "{") {
-		filename = filenameFormat
-		filename = strings.ReplaceAll(filename, "{title}", safeTitle)
-		filename = strings.ReplaceAll(filename, "{artist}", safeArtist)
-		filename = strings.ReplaceAll(filename, "{album}", safeAlbum)
-		filename = strings.ReplaceAll(filename, "{album_artist}", safeAlbumArtist)
-		filename = strings.ReplaceAll(filename, "{year}", year)
-		filename = strings.ReplaceAll(filename, "{date}", sanitizeFilename(releaseDate))
-
-		if discNumber > 0 {
-			filename = strings.ReplaceAll(filename, "{disc}", fmt.Sprintf("%d", discNumber))
-		} else {
-			filename = strings.ReplaceAll(filename, "{disc}", "")
-		}
-
-		if position > 0 {
-			filename = strings.ReplaceAll(filename, "{track}", fmt.Sprintf("%02d", position))
-		} else {
-
-			filename = regexp.MustCompile(`\{track\}\.\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*-\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*`).ReplaceAllString(filename, "")
-		}
+		filename = renderFilenameTemplate(filenameFormat, position, discNumber, map[string]string{
+			"title":        safeTitle,
+			"artist":       safeArtist,
+			"album":        safeAlbum,
+			"album_artist": safeAlbumArtist,
+			"year":         year,
+			"date":         sanitizeFilename(releaseDate),
+		})
 	} else {
 
 		switch filenameFormat {
@@ -152,6 +137,24 @@ func (c *CoverClient) DownloadCoverToPath(coverURL, outputPath string, embedMaxQ
 		downloadURL = c.getMaxResolutionURL(downloadURL)
 	}
 
+	cachePath, err := coverCachePath(downloadURL)
+	if err != nil {
+		return c.fetchCover(downloadURL, outputPath)
+	}
+	err = copyCachedCover(cachePath, outputPath)
+	if !os.IsNotExist(err) {
+		return err
+	}
+	if err := fillCoverCache(cachePath, func() error {
+		return c.fetchCover(downloadURL, cachePath)
+	}); err != nil {
+		return err
+	}
+
+	return copyCachedCover(cachePath, outputPath)
+}
+
+func (c *CoverClient) fetchCover(downloadURL, outputPath string) error {
 	resp, err := c.httpClient.Get(downloadURL)
 	if err != nil {
 		return fmt.Errorf("failed to download cover: %v", err)
@@ -162,17 +165,27 @@ func (c *CoverClient) DownloadCoverToPath(coverURL, outputPath string, embedMaxQ
 		return fmt.Errorf("failed to download cover: HTTP %d", resp.StatusCode)
 	}
 
-	file, err := os.Create(outputPath)
+	file, err := os.CreateTemp(filepath.Dir(outputPath), ".cover-*.part")
 	if err != nil {
 		return fmt.Errorf("failed to create file: %v", err)
 	}
-	defer file.Close()
+	tmpPath := file.Name()
 
-	_, err = io.Copy(file, resp.Body)
-	if err != nil {
+	if _, err := io.Copy(file, resp.Body); err != nil {
+		file.Close()
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write cover file: %v", err)
+	}
+	if err := file.Close(); err != nil {
+		os.Remove(tmpPath)
 		return fmt.Errorf("failed to write cover file: %v", err)
 	}
 
+	_ = os.Chmod(tmpPath, 0o644)
+	if err := os.Rename(tmpPath, outputPath); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write cover file: %v", err)
+	}
 	return nil
 }
 
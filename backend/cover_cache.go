@@ -0,0 +1,183 @@
+package backend
+
+import (
+	"crypto/sha1"
+	"encoding/hex"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+const (
+	coverCacheDirName       = "covers"
+	coverCacheTTL           = 7 * 24 * time.Hour
+	coverCacheMaxBytes      = 256 << 20
+	coverCachePruneInterval = 64
+)
+
+var (
+	coverCachePruneOnce sync.Once
+	coverCachePruning   atomic.Bool
+	coverCacheStored    atomic.Int64
+
+	coverCacheFetches     = make(map[string]*coverCacheFetch)
+	coverCacheFetchesLock sync.Mutex
+)
+
+type coverCacheFetch struct {
+	done chan struct{}
+	err  error
+}
+
+func coverCachePath(downloadURL string) (string, error) {
+	appDir, err := EnsureAppDir()
+	if err != nil {
+		return "", err
+	}
+
+	cacheDir := filepath.Join(appDir, coverCacheDirName)
+	if err := os.MkdirAll(cacheDir, 0o755); err != nil {
+		return "", fmt.Errorf("failed to create cover cache directory: %w", err)
+	}
+	coverCachePruneOnce.Do(func() {
+		startCoverCachePrune(cacheDir)
+	})
+
+	sum := sha1.Sum([]byte(downloadURL))
+	return filepath.Join(cacheDir, hex.EncodeToString(sum[:])+".jpg"), nil
+}
+
+// fillCoverCache runs fetch to populate cachePath, sharing one download
+// between tracks of the same album that ask for the cover at the same time.
+func fillCoverCache(cachePath string, fetch func() error) error {
+	coverCacheFetchesLock.Lock()
+	if inFlight, ok := coverCacheFetches[cachePath]; ok {
+		coverCacheFetchesLock.Unlock()
+		<-inFlight.done
+		return inFlight.err
+	}
+	f := &coverCacheFetch{done: make(chan struct{})}
+	coverCacheFetches[cachePath] = f
+	coverCacheFetchesLock.Unlock()
+
+	f.err = fetch()
+	if f.err != nil {
+		// Another process may have stored the same cover first, in which case
+		// the rename over it can fail (notably on Windows); the entry is usable.
+		if _, err := os.Stat(cachePath); err == nil {
+			f.err = nil
+		}
+	}
+
+	coverCacheFetchesLock.Lock()
+	delete(coverCacheFetches, cachePath)
+	coverCacheFetchesLock.Unlock()
+	close(f.done)
+
+	if f.err == nil && coverCacheStored.Add(1)%coverCachePruneInterval == 0 {
+		startCoverCachePrune(filepath.Dir(cachePath))
+	}
+	return f.err
+}
+
+func startCoverCachePrune(cacheDir string) {
+	if !coverCachePruning.CompareAndSwap(false, true) {
+		return
+	}
+	go func() {
+		defer coverCachePruning.Store(false)
+		pruneCoverCache(cacheDir)
+	}()
+}
+
+// pruneCoverCache drops entries older than coverCacheTTL, then the oldest
+// remaining ones until the cache fits in coverCacheMaxBytes.
+func pruneCoverCache(cacheDir string) {
+	entries, err := os.ReadDir(cacheDir)
+	if err != nil {
+		return
+	}
+
+	type cachedCover struct {
+		path    string
+		size    int64
+		modTime time.Time
+	}
+
+	cutoff := time.Now().Add(-coverCacheTTL)
+	kept := make([]cachedCover, 0, len(entries))
+	var total int64
+	for _, entry := range entries {
+		info, err := entry.Info()
+		if err != nil || info.IsDir() {
+			continue
+		}
+		path := filepath.Join(cacheDir, entry.Name())
+		if info.ModTime().Before(cutoff) {
+			_ = os.Remove(path)
+			continue
+		}
+		kept = append(kept, cachedCover{path: path, size: info.Size(), modTime: info.ModTime()})
+		total += info.Size()
+	}
+	if total <= coverCacheMaxBytes {
+		return
+	}
+
+	sort.Slice(kept, func(i, j int) bool {
+		return kept[i].modTime.Before(kept[j].modTime)
+	})
+	for _, cover := range kept {
+		if total <= coverCacheMaxBytes {
+			break
+		}
+		if os.Remove(cover.path) == nil {
+			total -= cover.size
+		}
+	}
+}
+
+func copyCachedCover(cachePath, outputPath string) error {
+	in, err := os.Open(cachePath)
+	if err != nil {
+		return err
+	}
+	defer in.Close()
+
+	// outputPath may be a hard link to this very cache entry left by an
+	// earlier run, so it is replaced rather than truncated in place; writing
+	// into it would empty the cached cover for every later track.
+	_ = os.Remove(outputPath)
+
+	// Callers only read the cover and remove it afterwards, so a hard link
+	// avoids rewriting the image when the cache shares the output filesystem.
+	if err := os.Link(cachePath, outputPath); err == nil {
+		return nil
+	}
+
+	out, err := os.CreateTemp(filepath.Dir(outputPath), ".cover-*.part")
+	if err != nil {
+		return fmt.Errorf("failed to create file: %v", err)
+	}
+	tmpPath := out.Name()
+	if _, err := out.ReadFrom(in); err != nil {
+		out.Close()
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write cover file: %v", err)
+	}
+	if err := out.Close(); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write cover file: %v", err)
+	}
+
+	_ = os.Chmod(tmpPath, 0o644)
+	if err := os.Rename(tmpPath, outputPath); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write cover file: %v", err)
+	}
+	return nil
+}
@@ -99,20 +99,32 @@ func copyExecutable(src, dst string) error {
 	}
 	defer in.Close()
 
-	out, err := os.OpenFile(dst, os.O_RDWR|os.O_CREATE|os.O_TRUNC, 0o755)
+	tmpPath := dst + ".tmp"
+	out, err := os.OpenFile(tmpPath, os.O_RDWR|os.O_CREATE|os.O_TRUNC, 0o755)
 	if err != nil {
 		return err
 	}
-	defer out.Close()
 
-	if _, err = io.Copy(out, in); err != nil {
+	if _, err = out.ReadFrom(in); err == nil {
+		err = out.Sync()
+	}
+	if closeErr := out.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		os.Remove(tmpPath)
 		return err
 	}
 
-	if err := out.Sync(); err != nil {
+	if err := os.Rename(tmpPath, dst); err != nil {
+		os.Remove(tmpPath)
 		return err
 	}
 
+	if info, err := in.Stat(); err == nil {
+		_ = os.Chtimes(dst, info.ModTime(), info.ModTime())
+	}
+
 	return prepareExecutableForUse(dst)
 }
 
@@ -213,6 +225,41 @@ func prepareExecutableForUse(path string) error {
 	return nil
 }
 
+var (
+	resolvedExecutables     = make(map[string]string)
+	resolvedExecutablesLock sync.Mutex
+)
+
+func resolveExecutablePathCached(executableName string) (string, string, error) {
+	resolvedExecutablesLock.Lock()
+	cached, ok := resolvedExecutables[executableName]
+	resolvedExecutablesLock.Unlock()
+
+	if ok {
+		if info, err := os.Stat(cached); err == nil && !info.IsDir() {
+			return cached, "", nil
+		}
+	}
+
+	path, localPath, err := resolveExecutablePath(executableName)
+
+	resolvedExecutablesLock.Lock()
+	if err == nil {
+		resolvedExecutables[executableName] = path
+	} else {
+		delete(resolvedExecutables, executableName)
+	}
+	resolvedExecutablesLock.Unlock()
+
+	return path, localPath, err
+}
+
+func forgetResolvedExecutables() {
+	resolvedExecutablesLock.Lock()
+	resolvedExecutables = make(map[string]string)
+	resolvedExecutablesLock.Unlock()
+}
+
 func resolveExecutablePath(executableName string) (string, string, error) {
 	ffmpegDir, err := GetFFmpegDir()
 	if err != nil {
@@ -285,7 +332,7 @@ func GetFFmpegPath() (string, error) {
 		ffmpegName = "ffmpeg.exe"
 	}
 
-	path, localPath, err := resolveExecutablePath(ffmpegName)
+	path, localPath, err := resolveExecutablePathCached(ffmpegName)
 	if err != nil {
 		if localPath != "" {
 			return localPath, err
@@ -302,7 +349,7 @@ func GetFFprobePath() (string, error) {
 		ffprobeName = "ffprobe.exe"
 	}
 
-	path, localPath, err := resolveExecutablePath(ffprobeName)
+	path, localPath, err := resolveExecutablePathCached(ffprobeName)
 	if err != nil {
 		if localPath != "" {
 			return localPath, err
@@ -354,6 +401,8 @@ func IsBrewFFmpegInstalled() (bool, error) {
 }
 
 func InstallFFmpegWithBrew(progressCallback func(int, string)) error {
+	defer forgetResolvedExecutables()
+
 	brewPath := GetBrewPath()
 	if brewPath == "" {
 		return fmt.Errorf("brew not found")
@@ -407,6 +456,7 @@ func getFFmpegDownloadURLs() ([]string, []string, error) {
 }
 
 func DownloadFFmpeg(progressCallback func(int)) error {
+	defer forgetResolvedExecutables()
 
 	SetDownloadProgress(0)
 	SetDownloadSpeed(0)
@@ -474,7 +524,7 @@ func downloadAndExtract(url, destDir string, progressCallback func(int), progres
 	defer os.Remove(tmpFile.Name())
 	defer tmpFile.Close()
 
-	client := &http.Client{}
+	client := NewDownloadHTTPClient(0)
 	req, err := http.NewRequest("GET", url, nil)
 	if err != nil {
 		return fmt.Errorf("failed to create request: %w", err)
@@ -495,6 +545,16 @@ func downloadAndExtract(url, destDir string, progressCallback func(int), progres
 	var downloaded int64
 	lastTime := time.Now()
 	var lastBytes int64
+	lastReportedProgress := -1
+
+	// Progress is only recomputed after roughly 1% of the file (at least
+	// progressCheckBytes) has arrived, so most reads skip the clock and the
+	// float math entirely.
+	reportEvery := int64(progressCheckBytes)
+	if totalSize/100 > reportEvery {
+		reportEvery = totalSize / 100
+	}
+	nextReportBytes := reportEvery
 
 	if totalSize > 0 {
 		totalSizeMB := float64(totalSize) / (1024 * 1024)
@@ -503,7 +563,7 @@ func downloadAndExtract(url, destDir string, progressCallback func(int), progres
 		fmt.Printf("[FFmpeg] Downloading... (size unknown)\n")
 	}
 
-	buf := make([]byte, 32*1024)
+	buf := make([]byte, downloadCopyBufferSize)
 	for {
 		n, err := resp.Body.Read(buf)
 		if n > 0 {
@@ -512,44 +572,39 @@ func downloadAndExtract(url, destDir string, progressCallback func(int), progres
 				return fmt.Errorf("failed to write to temp file: %w", writeErr)
 			}
 			downloaded += int64(n)
-
-			mbDownloaded := float64(downloaded) / (1024 * 1024)
-			now := time.Now()
-			timeDiff := now.Sub(lastTime).Seconds()
-			var speedMBps float64
-
-			if timeDiff > 0.1 {
-				bytesDiff := float64(downloaded - lastBytes)
-				speedMBps = (bytesDiff / (1024 * 1024)) / timeDiff
-				lastTime = now
-				lastBytes = downloaded
-			}
-
-			SetDownloadProgress(mbDownloaded)
-			if speedMBps > 0 {
-				SetDownloadSpeed(speedMBps)
-			}
-
-			if totalSize > 0 && progressCallback != nil {
-				rawProgress := float64(downloaded) / float64(totalSize)
-				scaledProgress := progressStart + int(rawProgress*float64(progressEnd-progressStart))
-				progressCallback(scaledProgress)
-			}
-
-			if totalSize > 0 {
-				percent := float64(downloaded) * 100 / float64(totalSize)
-				if speedMBps > 0 {
-					fmt.Printf("\r[FFmpeg] Downloading: %.2f MB / %.2f MB (%.1f%%) - %.2f MB/s",
-						mbDownloaded, float64(totalSize)/(1024*1024), percent, speedMBps)
-				} else {
-					fmt.Printf("\r[FFmpeg] Downloading: %.2f MB / %.2f MB (%.1f%%)",
-						mbDownloaded, float64(totalSize)/(1024*1024), percent)
+			if downloaded >= nextReportBytes || downloaded == totalSize {
+				nextReportBytes = downloaded + reportEvery
+
+				if totalSize > 0 && progressCallback != nil {
+					rawProgress := float64(downloaded) / float64(totalSize)
+					scaledProgress := progressStart + int(rawProgress*float64(progressEnd-progressStart))
+					if scaledProgress != lastReportedProgress {
+						lastReportedProgress = scaledProgress
+						progressCallback(scaledProgress)
+					}
 				}
-			} else {
-				if speedMBps > 0 {
-					fmt.Printf("\r[FFmpeg] Downloading: %.2f MB - %.2f MB/s", mbDownloaded, speedMBps)
-				} else {
-					fmt.Printf("\r[FFmpeg] Downloading: %.2f MB", mbDownloaded)
+
+				now := time.Now()
+				if timeDiff := now.Sub(lastTime).Seconds(); timeDiff > 0.1 {
+					mbDownloaded := float64(downloaded) / (1024 * 1024)
+					speedMBps := (float64(downloaded-lastBytes) / (1024 * 1024)) / timeDiff
+					lastTime = now
+					lastBytes = downloaded
+
+					SetDownloadProgress(mbDownloaded)
+					if speedMBps > 0 {
+						SetDownloadSpeed(speedMBps)
+					}
+
+					if consoleIsTerminal {
+						if totalSize > 0 {
+							percent := float64(downloaded) * 100 / float64(totalSize)
+							fmt.Printf("\r[FFmpeg] Downloading: %.2f MB / %.2f MB (%.1f%%) - %.2f MB/s",
+								mbDownloaded, float64(totalSize)/(1024*1024), percent, speedMBps)
+						} else {
+							fmt.Printf("\r[FFmpeg] Downloading: %.2f MB - %.2f MB/s", mbDownloaded, speedMBps)
+						}
+					}
 				}
 			}
 		}
@@ -562,6 +617,7 @@ func downloadAndExtract(url, destDir string, progressCallback func(int), progres
 	}
 
 	tmpFile.Close()
+	SetDownloadProgress(float64(downloaded) / (1024 * 1024))
 
 	if totalSize > 0 {
 		fmt.Printf("\r[FFmpeg] Download complete: %.2f MB / %.2f MB (100%%)          \n",
@@ -752,6 +808,23 @@ type ConvertAudioResult struct {
 	Error      string `json:"error,omitempty"`
 }
 
+const maxParallelFFmpegJobs = 8
+
+// ffmpegJobSlots is shared by every batch that spawns ffmpeg or ffprobe, so
+// concurrent convert, resample and probe requests are bounded together.
+var ffmpegJobSlots = newFFmpegJobSlots()
+
+func newFFmpegJobSlots() chan struct{} {
+	limit := runtime.NumCPU()
+	if limit > maxParallelFFmpegJobs {
+		limit = maxParallelFFmpegJobs
+	}
+	if limit < 1 {
+		limit = 1
+	}
+	return make(chan struct{}, limit)
+}
+
 func ConvertAudio(req ConvertAudioRequest) ([]ConvertAudioResult, error) {
 	ffmpegPath, err := GetFFmpegPath()
 	if err != nil {
@@ -775,6 +848,8 @@ func ConvertAudio(req ConvertAudioRequest) ([]ConvertAudioResult, error) {
 		wg.Add(1)
 		go func(idx int, inputFile string) {
 			defer wg.Done()
+			ffmpegJobSlots <- struct{}{}
+			defer func() { <-ffmpegJobSlots }()
 
 			result := ConvertAudioResult{
 				InputFile: inputFile,
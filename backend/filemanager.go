@@ -393,14 +393,12 @@ func GenerateFilename(metadata *AudioMetadata, format string, ext string) string
 	return result + ext
 }
 
-func sanitizeFilenameForRename(name string) string {
+var renameInvalidCharsReplacer = strings.NewReplacer(
+	"<", "", ">", "", ":", "", "\"", "", "/", "", "\\", "", "|", "", "?", "", "*", "",
+)
 
-	invalid := []string{"<", ">", ":", "\"", "/", "\\", "|", "?", "*"}
-	result := name
-	for _, char := range invalid {
-		result = strings.ReplaceAll(result, char, "")
-	}
-	return strings.TrimSpace(result)
+func sanitizeFilenameForRename(name string) string {
+	return strings.TrimSpace(renameInvalidCharsReplacer.Replace(name))
 }
 
 func PreviewRename(files []string, format string) []RenamePreview {
@@ -6,10 +6,115 @@ import (
 	"path/filepath"
 	"regexp"
 	"strings"
+	"sync"
 	"unicode"
 	"unicode/utf8"
 )
 
+var (
+	trackPlaceholderDotRe     = regexp.MustCompile(`\{track\}\.\s*`)
+	trackPlaceholderDashRe    = regexp.MustCompile(`\{track\}\s*-\s*`)
+	trackPlaceholderTrailerRe = regexp.MustCompile(`\{track\}\s*`)
+
+	filenameTemplateCache sync.Map
+)
+
+type filenameTemplatePart struct {
+	literal string
+	field   string
+}
+
+var filenameTemplateFields = map[string]bool{
+	"title":        true,
+	"artist":       true,
+	"album":        true,
+	"album_artist": true,
+	"year":         true,
+	"date":         true,
+	"playlist":     true,
+	"creator":      true,
+	"isrc":         true,
+	"disc":         true,
+	"track":        true,
+}
+
+func stripTrackPlaceholder(filename string) string {
+	filename = trackPlaceholderDotRe.ReplaceAllString(filename, "")
+	filename = trackPlaceholderDashRe.ReplaceAllString(filename, "")
+	return trackPlaceholderTrailerRe.ReplaceAllString(filename, "")
+}
+
+func compileFilenameTemplate(format string, stripTrack bool) []filenameTemplatePart {
+	key := format
+	if stripTrack {
+		key = "\x00" + format
+	}
+	if cached, ok := filenameTemplateCache.Load(key); ok {
+		return cached.([]filenameTemplatePart)
+	}
+
+	if stripTrack {
+		format = stripTrackPlaceholder(format)
+	}
+
+	var parts []filenameTemplatePart
+	var literal strings.Builder
+	for rest := format; rest != ""; {
+		open := strings.IndexByte(rest, '{')
+		if open < 0 {
+			literal.WriteString(rest)
+			break
+		}
+		literal.WriteString(rest[:open])
+		rest = rest[open:]
+
+		end := strings.IndexByte(rest, '}')
+		if end < 0 || !filenameTemplateFields[rest[1:end]] {
+			literal.WriteByte('{')
+			rest = rest[1:]
+			continue
+		}
+		if literal.Len() > 0 {
+			parts = append(parts, filenameTemplatePart{literal: literal.String()})
+			literal.Reset()
+		}
+		parts = append(parts, filenameTemplatePart{field: rest[1:end]})
+		rest = rest[end+1:]
+	}
+	if literal.Len() > 0 {
+		parts = append(parts, filenameTemplatePart{literal: literal.String()})
+	}
+
+	filenameTemplateCache.Store(key, parts)
+	return parts
+}
+
+func renderFilenameTemplate(format string, trackNumber, discNumber int, fields map[string]string) string {
+	if discNumber > 0 {
+		fields["disc"] = fmt.Sprintf("%d", discNumber)
+	} else {
+		fields["disc"] = ""
+	}
+	if trackNumber > 0 {
+		fields["track"] = fmt.Sprintf("%02d", trackNumber)
+	}
+
+	var b strings.Builder
+	b.Grow(len(format) + 64)
+	for _, part := range compileFilenameTemplate(format, trackNumber <= 0) {
+		if part.field == "" {
+			b.WriteString(part.literal)
+			continue
+		}
+		if value, ok := fields[part.field]; ok {
+			b.WriteString(value)
+		} else {
+			b.WriteString("{" + part.field + "}")
+		}
+	}
+	return b.String()
+}
+
 func buildFormattedFilenameBase(trackName, artistName, albumName, albumArtist, releaseDate, filenameFormat, playlistName, playlistOwner, isrc string, includeTrackNumber bool, position, discNumber int, useAlbumTrackNumber bool) string {
 	safeTitle := SanitizeFilename(trackName)
 	safeArtist := SanitizeFilename(artistName)
@@ -28,31 +133,17 @@ func buildFormattedFilenameBase(trackName, artistName, albumName, albumArtist, r
 	var filename string
 
 	if strings.Contains(filenameFormat, "{") {
-		filename = filenameFormat
-		filename = strings.ReplaceAll(filename, "{title}", safeTitle)
-		filename = strings.ReplaceAll(filename, "{artist}", safeArtist)
-		filename = strings.ReplaceAll(filename, "{album}", safeAlbum)
-		filename = strings.ReplaceAll(filename, "{album_artist}", safeAlbumArtist)
-		filename = strings.ReplaceAll(filename, "{year}", year)
-		filename = strings.ReplaceAll(filename, "{date}", SanitizeFilename(releaseDate))
-		filename = strings.ReplaceAll(filename, "{playlist}", safePlaylist)
-		filename = strings.ReplaceAll(filename, "{creator}", safeCreator)
-		filename = strings.ReplaceAll(filename, "{isrc}", safeISRC)
-
-		if discNumber > 0 {
-			filename = strings.ReplaceAll(filename, "{disc}", fmt.Sprintf("%d", discNumber))
-		} else {
-			filename = strings.ReplaceAll(filename, "{disc}", "")
-		}
-
-		if position > 0 {
-			filename = strings.ReplaceAll(filename, "{track}", fmt.Sprintf("%02d", position))
-		} else {
-
-			filename = regexp.MustCompile(`\{track\}\.\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*-\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*`).ReplaceAllString(filename, "")
-		}
+		filename = renderFilenameTemplate(filenameFormat, position, discNumber, map[string]string{
+			"title":        safeTitle,
+			"artist":       safeArtist,
+			"album":        safeAlbum,
+			"album_artist": safeAlbumArtist,
+			"year":         year,
+			"date":         SanitizeFilename(releaseDate),
+			"playlist":     safePlaylist,
+			"creator":      safeCreator,
+			"isrc":         safeISRC,
+		})
 	} else {
 
 		switch filenameFormat {
@@ -72,6 +163,52 @@ func buildFormattedFilenameBase(trackName, artistName, albumName, albumArtist, r
 	return filename
 }
 
+func buildTrackFilename(title, artist, album, albumArtist, releaseDate string, trackNumber, discNumber int, format string, includeTrackNumber bool, position int, useAlbumTrackNumber bool, extra ...string) string {
+	var filename string
+	isrc := ""
+	if len(extra) > 0 {
+		isrc = SanitizeOptionalFilename(extra[0])
+	}
+
+	numberToUse := position
+	if useAlbumTrackNumber && trackNumber > 0 {
+		numberToUse = trackNumber
+	}
+
+	year := ""
+	if len(releaseDate) >= 4 {
+		year = releaseDate[:4]
+	}
+
+	if strings.Contains(format, "{") {
+		filename = renderFilenameTemplate(format, numberToUse, discNumber, map[string]string{
+			"title":        title,
+			"artist":       artist,
+			"album":        album,
+			"album_artist": albumArtist,
+			"year":         year,
+			"date":         SanitizeFilename(releaseDate),
+			"isrc":         isrc,
+		})
+	} else {
+
+		switch format {
+		case "artist-title":
+			filename = fmt.Sprintf("%s - %s", artist, title)
+		case "title":
+			filename = title
+		default:
+			filename = fmt.Sprintf("%s - %s", title, artist)
+		}
+
+		if includeTrackNumber && position > 0 {
+			filename = fmt.Sprintf("%02d. %s", numberToUse, filename)
+		}
+	}
+
+	return filename + ".flac"
+}
+
 func BuildExpectedFilename(trackName, artistName, albumName, albumArtist, releaseDate, filenameFormat, playlistName, playlistOwner string, includeTrackNumber bool, position, discNumber int, useAlbumTrackNumber bool, extra ...string) string {
 	isrc := ""
 	if len(extra) > 0 {
@@ -82,15 +219,18 @@ func BuildExpectedFilename(trackName, artistName, albumName, albumArtist, releas
 }
 
 func ResolveOutputPathForDownload(path string, redownloadWithSuffix bool) (string, bool) {
-	if !redownloadWithSuffix {
-		if info, err := os.Stat(path); err == nil && info.Size() > 0 {
-			return path, true
-		}
-		return path, false
+	resolved, _, alreadyExists := resolveOutputPathWithSize(path, redownloadWithSuffix)
+	return resolved, alreadyExists
+}
+
+func resolveOutputPathWithSize(path string, redownloadWithSuffix bool) (string, int64, bool) {
+	info, err := os.Stat(path)
+	if err != nil || info.Size() == 0 {
+		return path, 0, false
 	}
 
-	if info, err := os.Stat(path); err != nil || info.Size() == 0 {
-		return path, false
+	if !redownloadWithSuffix {
+		return path, info.Size(), true
 	}
 
 	ext := filepath.Ext(path)
@@ -99,53 +239,84 @@ func ResolveOutputPathForDownload(path string, redownloadWithSuffix bool) (strin
 	for i := 1; ; i++ {
 		candidate := fmt.Sprintf("%s_%02d%s", base, i, ext)
 		if info, err := os.Stat(candidate); err != nil || info.Size() == 0 {
-			return candidate, false
+			return candidate, 0, false
 		}
 	}
 }
 
-func mustFileSize(path string) int64 {
-	info, err := os.Stat(path)
-	if err != nil {
-		return 0
+func sanitizeFilenameRune(r rune) rune {
+	switch r {
+	case '/', '<', '>', ':', '"', '\\', '|', '?', '*':
+		return ' '
+	case 0x09, 0x0A, 0x0D:
+		return r
+	}
+	if r < 0x20 || r == 0x7F || unicode.IsControl(r) {
+		return -1
 	}
-	return info.Size()
+	return r
 }
 
-func SanitizeFilename(name string) string {
-
-	sanitized := strings.ReplaceAll(name, "/", " ")
-
-	re := regexp.MustCompile(`[<>:"\\|?*]`)
-	sanitized = re.ReplaceAllString(sanitized, " ")
-
-	var result strings.Builder
-	for _, r := range sanitized {
-
-		if r < 0x20 && r != 0x09 && r != 0x0A && r != 0x0D {
-			continue
+func isSanitizedFilename(name string) bool {
+	if name == "" || !utf8.ValidString(name) {
+		return false
+	}
+	first, _ := utf8.DecodeRuneInString(name)
+	last, _ := utf8.DecodeLastRuneInString(name)
+	if first == '.' || first == '_' || unicode.IsSpace(first) || last == '.' || last == '_' || unicode.IsSpace(last) {
+		return false
+	}
+	var prev rune
+	for _, r := range name {
+		if r == '\t' || r == '\n' || r == '\r' || sanitizeFilenameRune(r) != r {
+			return false
 		}
-		if r == 0x7F {
-			continue
+		if (r == ' ' || r == '_') && r == prev {
+			return false
 		}
+		prev = r
+	}
+	return true
+}
 
-		if unicode.IsControl(r) && r != 0x09 && r != 0x0A && r != 0x0D {
-			continue
+// collapseFilenameRuns turns every run of ASCII whitespace into one space and
+// every run of underscores into one underscore in a single pass.
+func collapseFilenameRuns(s string) string {
+	var b strings.Builder
+	b.Grow(len(s))
+	var prev byte
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		switch c {
+		case ' ', '\t', '\n', '\f', '\r':
+			if prev == ' ' {
+				continue
+			}
+			c = ' '
+		case '_':
+			if prev == '_' {
+				continue
+			}
 		}
+		b.WriteByte(c)
+		prev = c
+	}
+	return b.String()
+}
 
-		result.WriteRune(r)
+func SanitizeFilename(name string) string {
+	// Track fields are sanitized again every time a filename or folder is
+	// built for them; most are already clean, so skip the regex passes.
+	if isSanitizedFilename(name) {
+		return name
 	}
 
-	sanitized = result.String()
+	sanitized := strings.Map(sanitizeFilenameRune, name)
 	sanitized = strings.TrimSpace(sanitized)
 
 	sanitized = strings.Trim(sanitized, ". ")
 
-	re = regexp.MustCompile(`\s+`)
-	sanitized = re.ReplaceAllString(sanitized, " ")
-
-	re = regexp.MustCompile(`_+`)
-	sanitized = re.ReplaceAllString(sanitized, "_")
+	sanitized = collapseFilenameRuns(sanitized)
 
 	sanitized = strings.Trim(sanitized, "_ ")
 
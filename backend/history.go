@@ -5,6 +5,8 @@ import (
 	"fmt"
 	"path/filepath"
 	"sort"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	bolt "go.etcd.io/bbolt"
@@ -27,11 +29,61 @@ type HistoryItem struct {
 
 var historyDB *bolt.DB
 
+// historyWatch lets the history page long-poll for changes instead of
+// re-reading the database on a timer. Download and fetch history each have
+// their own, so recording a fetch does not reload the downloads tab.
+type historyWatch struct {
+	version atomic.Int64
+	changed chan struct{}
+	lock    sync.Mutex
+}
+
+var (
+	downloadHistoryWatch = &historyWatch{changed: make(chan struct{})}
+	fetchHistoryWatch    = &historyWatch{changed: make(chan struct{})}
+)
+
 const (
 	historyBucket = "DownloadHistory"
 	maxHistory    = 10000
 )
 
+func (w *historyWatch) notify() {
+	w.lock.Lock()
+	w.version.Add(1)
+	close(w.changed)
+	w.changed = make(chan struct{})
+	w.lock.Unlock()
+}
+
+// WaitForHistoryChange blocks until the given history ("downloads" or
+// "fetches") is modified or the timeout elapses, and returns its current
+// version.
+func WaitForHistoryChange(kind string, lastVersion int64, timeout time.Duration) int64 {
+	w := downloadHistoryWatch
+	if kind == "fetches" {
+		w = fetchHistoryWatch
+	}
+
+	w.lock.Lock()
+	changed := w.changed
+	version := w.version.Load()
+	w.lock.Unlock()
+
+	if version != lastVersion {
+		return version
+	}
+
+	timer := time.NewTimer(timeout)
+	defer timer.Stop()
+
+	select {
+	case <-changed:
+	case <-timer.C:
+	}
+	return w.version.Load()
+}
+
 func InitHistoryDB(appName string) error {
 
 	appDir, err := EnsureAppDir()
@@ -66,6 +118,8 @@ func CloseHistoryDB() {
 }
 
 func AddHistoryItem(item HistoryItem, appName string) error {
+	defer downloadHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -138,6 +192,8 @@ func GetHistoryItems(appName string) ([]HistoryItem, error) {
 }
 
 func ClearHistory(appName string) error {
+	defer downloadHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -164,6 +220,8 @@ const (
 )
 
 func AddFetchHistoryItem(item FetchHistoryItem, appName string) error {
+	defer fetchHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -248,6 +306,8 @@ func GetFetchHistoryItems(appName string) ([]FetchHistoryItem, error) {
 }
 
 func ClearFetchHistory(appName string) error {
+	defer fetchHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -259,6 +319,8 @@ func ClearFetchHistory(appName string) error {
 }
 
 func ClearFetchHistoryByType(itemType string, appName string) error {
+	defer fetchHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -292,6 +354,8 @@ func ClearFetchHistoryByType(itemType string, appName string) error {
 }
 
 func DeleteHistoryItem(id string, appName string) error {
+	defer downloadHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -308,6 +372,8 @@ func DeleteHistoryItem(id string, appName string) error {
 }
 
 func DeleteFetchHistoryItem(id string, appName string) error {
+	defer fetchHistoryWatch.notify()
+
 	if historyDB == nil {
 		if err := InitHistoryDB(appName); err != nil {
 			return err
@@ -2,11 +2,67 @@ package backend
 
 import (
 	"io"
+	"math/rand"
 	"net/http"
+	"strconv"
+	"strings"
+	"time"
 )
 
 const DefaultDownloaderUserAgent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36"
 
+const (
+	maxDiscardedResponseBytes     = 64 << 10
+	downloadResponseHeaderTimeout = 30 * time.Second
+)
+
+var (
+	downloadTransport = newDownloadTransport()
+	apiTransport      = newAPITransport()
+)
+
+// Both transports are cloned from http.DefaultTransport, so their dialer
+// already disables Nagle (Go sets TCP_NODELAY on every TCP connection) and
+// sends keep-alive probes on idle pooled connections.
+func newDownloadTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 64
+	transport.MaxIdleConnsPerHost = 16
+	transport.ResponseHeaderTimeout = downloadResponseHeaderTimeout
+	return transport
+}
+
+func newAPITransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 32
+	transport.MaxIdleConnsPerHost = 8
+	return transport
+}
+
+func NewAPIHTTPClient(timeout time.Duration) *http.Client {
+	return &http.Client{
+		Timeout:   timeout,
+		Transport: apiTransport,
+	}
+}
+
+func NewDownloadHTTPClient(timeout time.Duration) *http.Client {
+	return &http.Client{
+		Timeout:   timeout,
+		Transport: downloadTransport,
+	}
+}
+
+// discardResponseBody drains a small unread body before closing it so the
+// pooled keep-alive connection can be reused by the next request to the host.
+func discardResponseBody(resp *http.Response) {
+	if resp == nil || resp.Body == nil {
+		return
+	}
+	_, _ = io.CopyN(io.Discard, resp.Body, maxDiscardedResponseBytes)
+	resp.Body.Close()
+}
+
 func NewRequestWithDefaultHeaders(method string, rawURL string, body io.Reader) (*http.Request, error) {
 	req, err := http.NewRequest(method, rawURL, body)
 	if err != nil {
@@ -18,3 +74,41 @@ func NewRequestWithDefaultHeaders(method string, rawURL string, body io.Reader)
 
 	return req, nil
 }
+
+func RetryBackoffDelay(base, maxDelay time.Duration, attempt int) time.Duration {
+	delay := base
+	for i := 0; i < attempt && delay < maxDelay; i++ {
+		delay *= 2
+	}
+	if delay > maxDelay {
+		delay = maxDelay
+	}
+
+	// Scale by a random factor in [0.5, 1.5] so concurrent workers that hit the
+	// same limit spread their retries out instead of waking up together.
+	return delay/2 + time.Duration(rand.Int63n(int64(delay)+1))
+}
+
+func ParseRetryAfter(value string) (time.Duration, bool) {
+	value = strings.TrimSpace(value)
+	if value == "" {
+		return 0, false
+	}
+
+	if seconds, err := strconv.Atoi(value); err == nil {
+		if seconds < 0 {
+			return 0, false
+		}
+		return time.Duration(seconds) * time.Second, true
+	}
+
+	if retryAt, err := http.ParseTime(value); err == nil {
+		wait := time.Until(retryAt)
+		if wait < 0 {
+			wait = 0
+		}
+		return wait, true
+	}
+
+	return 0, false
+}
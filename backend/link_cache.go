@@ -0,0 +1,108 @@
+package backend
+
+import (
+	"encoding/json"
+	"fmt"
+	"strings"
+	"time"
+
+	bolt "go.etcd.io/bbolt"
+)
+
+const (
+	trackLinksCacheBucket = "SpotifyTrackLinks"
+	trackLinksCacheTTL    = 7 * 24 * time.Hour
+
+	// Entries missing a service may only reflect a transient failure or 429
+	// from a resolver, so they are retried much sooner.
+	trackLinksPartialCacheTTL = time.Hour
+)
+
+type trackLinksCacheEntry struct {
+	TidalURL  string `json:"tidal_url"`
+	AmazonURL string `json:"amazon_url"`
+	DeezerURL string `json:"deezer_url"`
+	ISRC      string `json:"isrc"`
+	UpdatedAt int64  `json:"updated_at"`
+}
+
+func (e trackLinksCacheEntry) ttl() time.Duration {
+	if e.TidalURL == "" || e.AmazonURL == "" {
+		return trackLinksPartialCacheTTL
+	}
+	return trackLinksCacheTTL
+}
+
+func trackLinksCacheKey(trackID string, region string) string {
+	return strings.TrimSpace(trackID) + "|" + strings.ToUpper(strings.TrimSpace(region))
+}
+
+func getCachedTrackLinks(trackID string, region string) *resolvedTrackLinks {
+	if strings.TrimSpace(trackID) == "" {
+		return nil
+	}
+
+	if err := InitISRCCacheDB(); err != nil {
+		return nil
+	}
+
+	var entry trackLinksCacheEntry
+	found := false
+	_ = isrcCacheDB.View(func(tx *bolt.Tx) error {
+		bucket := tx.Bucket([]byte(trackLinksCacheBucket))
+		if bucket == nil {
+			return nil
+		}
+
+		value := bucket.Get([]byte(trackLinksCacheKey(trackID, region)))
+		if len(value) == 0 {
+			return nil
+		}
+
+		if err := json.Unmarshal(value, &entry); err != nil {
+			return err
+		}
+		found = true
+		return nil
+	})
+
+	if !found || time.Since(time.Unix(entry.UpdatedAt, 0)) > entry.ttl() {
+		return nil
+	}
+
+	return &resolvedTrackLinks{
+		TidalURL:  entry.TidalURL,
+		AmazonURL: entry.AmazonURL,
+		DeezerURL: entry.DeezerURL,
+		ISRC:      entry.ISRC,
+	}
+}
+
+func putCachedTrackLinks(trackID string, region string, links *resolvedTrackLinks) error {
+	if strings.TrimSpace(trackID) == "" || links == nil || !hasAnySongLinkData(links) {
+		return nil
+	}
+
+	if err := InitISRCCacheDB(); err != nil {
+		return err
+	}
+
+	payload, err := json.Marshal(trackLinksCacheEntry{
+		TidalURL:  links.TidalURL,
+		AmazonURL: links.AmazonURL,
+		DeezerURL: links.DeezerURL,
+		ISRC:      links.ISRC,
+		UpdatedAt: time.Now().Unix(),
+	})
+	if err != nil {
+		return fmt.Errorf("failed to encode track links cache entry: %w", err)
+	}
+
+	return isrcCacheDB.Update(func(tx *bolt.Tx) error {
+		bucket, err := tx.CreateBucketIfNotExists([]byte(trackLinksCacheBucket))
+		if err != nil {
+			return err
+		}
+		return bucket.Put([]byte(trackLinksCacheKey(trackID, region)), payload)
+	})
+}
@@ -19,6 +19,20 @@ const (
 )
 
 func (s *SongLinkClient) resolveSpotifyTrackLinks(spotifyTrackID string, region string) (*resolvedTrackLinks, error) {
+	if cached := getCachedTrackLinks(spotifyTrackID, region); cached != nil {
+		return cached, nil
+	}
+
+	links, err := s.resolveSpotifyTrackLinksUncached(spotifyTrackID, region)
+	if err == nil {
+		if cacheErr := putCachedTrackLinks(spotifyTrackID, region, links); cacheErr != nil {
+			fmt.Printf("Warning: failed to cache track links: %v\n", cacheErr)
+		}
+	}
+	return links, err
+}
+
+func (s *SongLinkClient) resolveSpotifyTrackLinksUncached(spotifyTrackID string, region string) (*resolvedTrackLinks, error) {
 	links := &resolvedTrackLinks{}
 	var attempts []string
 
@@ -8,7 +8,6 @@ import (
 	"net/url"
 	"os"
 	"path/filepath"
-	"regexp"
 	"strings"
 	"time"
 )
@@ -67,7 +66,7 @@ type LyricsClient struct {
 
 func NewLyricsClient() *LyricsClient {
 	return &LyricsClient{
-		httpClient: &http.Client{Timeout: 15 * time.Second},
+		httpClient: NewAPIHTTPClient(15 * time.Second),
 	}
 }
 
@@ -130,8 +129,10 @@ func (c *LyricsClient) convertLRCLibToLyricsResponse(lrcLib *LRCLibResponse) *Ly
 		return resp
 	}
 
-	lines := strings.Split(lyricsText, "\n")
-	for _, line := range lines {
+	resp.Lines = make([]LyricsLine, 0, strings.Count(lyricsText, "\n")+1)
+	for rest := lyricsText; rest != ""; {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
 		line = strings.TrimSpace(line)
 		if line == "" {
 			continue
@@ -379,29 +380,15 @@ func buildLyricsFilename(trackName, artistName, albumName, albumArtist, releaseD
 	var filename string
 
 	if strings.Contains(filenameFormat, "{") {
-		filename = filenameFormat
-		filename = strings.ReplaceAll(filename, "{title}", safeTitle)
-		filename = strings.ReplaceAll(filename, "{artist}", safeArtist)
-		filename = strings.ReplaceAll(filename, "{album}", safeAlbum)
-		filename = strings.ReplaceAll(filename, "{album_artist}", safeAlbumArtist)
-		filename = strings.ReplaceAll(filename, "{year}", year)
-		filename = strings.ReplaceAll(filename, "{date}", sanitizeFilename(releaseDate))
-		filename = strings.ReplaceAll(filename, "{isrc}", safeISRC)
-
-		if discNumber > 0 {
-			filename = strings.ReplaceAll(filename, "{disc}", fmt.Sprintf("%d", discNumber))
-		} else {
-			filename = strings.ReplaceAll(filename, "{disc}", "")
-		}
-
-		if position > 0 {
-			filename = strings.ReplaceAll(filename, "{track}", fmt.Sprintf("%02d", position))
-		} else {
-
-			filename = regexp.MustCompile(`\{track\}\.\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*-\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*`).ReplaceAllString(filename, "")
-		}
+		filename = renderFilenameTemplate(filenameFormat, position, discNumber, map[string]string{
+			"title":        safeTitle,
+			"artist":       safeArtist,
+			"album":        safeAlbum,
+			"album_artist": safeAlbumArtist,
+			"year":         year,
+			"date":         sanitizeFilename(releaseDate),
+			"isrc":         safeISRC,
+		})
 	} else {
 
 		switch filenameFormat {
@@ -421,13 +408,22 @@ func buildLyricsFilename(trackName, artistName, albumName, albumArtist, releaseD
 	return filename + ".lrc"
 }
 
+func findAudioFileBesideLyrics(lyricsPath string) string {
+	base := strings.TrimSuffix(lyricsPath, filepath.Ext(lyricsPath))
+	for _, ext := range []string{".flac", ".m4a", ".mp3"} {
+		candidate := base + ext
+		if info, err := os.Stat(candidate); err == nil && !info.IsDir() {
+			return candidate
+		}
+	}
+	return ""
+}
+
 func findAudioFileForLyrics(dir, trackName, artistName string) string {
 
 	safeTitle := sanitizeFilename(trackName)
 	safeArtist := sanitizeFilename(artistName)
 
-	audioExts := []string{".flac", ".mp3", ".m4a", ".FLAC", ".MP3", ".M4A"}
-
 	patterns := []string{
 		fmt.Sprintf("%s - %s", safeTitle, safeArtist),
 		fmt.Sprintf("%s - %s", safeArtist, safeTitle),
@@ -445,16 +441,17 @@ func findAudioFileForLyrics(dir, trackName, artistName string) string {
 		}
 
 		filename := entry.Name()
-		baseName := strings.TrimSuffix(filename, filepath.Ext(filename))
+		ext := filepath.Ext(filename)
+		switch strings.ToLower(ext) {
+		case ".flac", ".mp3", ".m4a":
+		default:
+			continue
+		}
 
+		baseName := strings.TrimSuffix(filename, ext)
 		for _, pattern := range patterns {
-			if strings.HasPrefix(baseName, pattern) || strings.Contains(baseName, pattern) {
-				ext := strings.ToLower(filepath.Ext(filename))
-				for _, audioExt := range audioExts {
-					if ext == strings.ToLower(audioExt) {
-						return filepath.Join(dir, filename)
-					}
-				}
+			if strings.Contains(baseName, pattern) {
+				return filepath.Join(dir, filename)
 			}
 		}
 	}
@@ -506,7 +503,13 @@ func (c *LyricsClient) DownloadLyrics(req LyricsDownloadRequest) (*LyricsDownloa
 	}
 
 	audioDuration := 0
-	audioFile := findAudioFileForLyrics(outputDir, req.TrackName, req.ArtistName)
+	audioFile := findAudioFileBesideLyrics(filepath.Join(outputDir, filename))
+	if audioFile == "" {
+		audioFile = findAudioFileForLyrics(outputDir, req.TrackName, req.ArtistName)
+		if audioFile != "" {
+			fmt.Printf("[DownloadLyrics] ⚠ Audio file located by directory scan: %s\n", audioFile)
+		}
+	}
 	if audioFile != "" {
 		duration, err := GetAudioDuration(audioFile)
 		if err == nil && duration > 0 {
@@ -0,0 +1,143 @@
+package backend
+
+import (
+	"encoding/binary"
+	"fmt"
+	"strings"
+	"sync/atomic"
+	"time"
+
+	bolt "go.etcd.io/bbolt"
+)
+
+const (
+	spotifyMetadataCacheBucket = "SpotifyMetadata"
+	spotifyMetadataCacheTTL    = 24 * time.Hour
+	spotifyCollectionCacheTTL  = time.Hour
+
+	// Expired entries are swept on the first write after startup and then
+	// at most this often, instead of scanning the bucket on every write.
+	spotifyMetadataCachePruneInterval = time.Hour
+)
+
+var lastSpotifyMetadataCachePrune atomic.Int64
+
+func SpotifyMetadataCacheKey(spotifyURL string, batch bool, separator string) string {
+	canonical := strings.TrimSpace(spotifyURL)
+	if parsed, err := parseSpotifyURI(canonical); err == nil {
+		canonical = parsed.Type + ":" + parsed.ID
+		if parsed.DiscographyGroup != "" {
+			canonical += ":" + parsed.DiscographyGroup
+		}
+	} else {
+		if idx := strings.IndexAny(canonical, "?#"); idx >= 0 {
+			canonical = canonical[:idx]
+		}
+		canonical = strings.TrimRight(canonical, "/")
+	}
+	return fmt.Sprintf("%s|%t|%s", canonical, batch, separator)
+}
+
+func spotifyMetadataCacheTTLFor(key string) time.Duration {
+	if strings.HasPrefix(key, "playlist:") || strings.HasPrefix(key, "artist") ||
+		strings.Contains(key, "/playlist/") || strings.Contains(key, "/artist/") {
+		return spotifyCollectionCacheTTL
+	}
+	return spotifyMetadataCacheTTL
+}
+
+func GetCachedSpotifyMetadata(key string) (string, bool) {
+	if err := InitISRCCacheDB(); err != nil {
+		return "", false
+	}
+
+	var data string
+	found := false
+	_ = isrcCacheDB.View(func(tx *bolt.Tx) error {
+		bucket := tx.Bucket([]byte(spotifyMetadataCacheBucket))
+		if bucket == nil {
+			return nil
+		}
+
+		value := bucket.Get([]byte(key))
+		if len(value) <= 8 {
+			return nil
+		}
+
+		updatedAt := time.Unix(int64(binary.BigEndian.Uint64(value[:8])), 0)
+		if time.Since(updatedAt) > spotifyMetadataCacheTTLFor(key) {
+			return nil
+		}
+
+		data = string(value[8:])
+		found = true
+		return nil
+	})
+
+	return data, found
+}
+
+func PutCachedSpotifyMetadata(key string, data []byte) error {
+	if len(data) == 0 {
+		return nil
+	}
+
+	if err := InitISRCCacheDB(); err != nil {
+		return err
+	}
+
+	value := make([]byte, 8+len(data))
+	binary.BigEndian.PutUint64(value[:8], uint64(time.Now().Unix()))
+	copy(value[8:], data)
+
+	return isrcCacheDB.Update(func(tx *bolt.Tx) error {
+		bucket, err := tx.CreateBucketIfNotExists([]byte(spotifyMetadataCacheBucket))
+		if err != nil {
+			return err
+		}
+
+		now := time.Now()
+		last := lastSpotifyMetadataCachePrune.Load()
+		if now.Sub(time.Unix(last, 0)) >= spotifyMetadataCachePruneInterval && lastSpotifyMetadataCachePrune.CompareAndSwap(last, now.Unix()) {
+			if err := pruneSpotifyMetadataCache(bucket); err != nil {
+				return err
+			}
+		}
+
+		return bucket.Put([]byte(key), value)
+	})
+}
+
+func pruneSpotifyMetadataCache(bucket *bolt.Bucket) error {
+	// Deleting through a cursor while iterating it skips the following
+	// entry, so expired keys are collected first and deleted afterwards.
+	var expired [][]byte
+	cursor := bucket.Cursor()
+	for k, v := cursor.First(); k != nil; k, v = cursor.Next() {
+		if len(v) < 8 || time.Since(time.Unix(int64(binary.BigEndian.Uint64(v[:8])), 0)) > spotifyMetadataCacheTTLFor(string(k)) {
+			expired = append(expired, append([]byte(nil), k...))
+		}
+	}
+
+	for _, k := range expired {
+		if err := bucket.Delete(k); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// ClearMetadataCache drops every cached Spotify metadata response so the next
+// lookup of each album, playlist or artist goes back to Spotify.
+func ClearMetadataCache() error {
+	if err := InitISRCCacheDB(); err != nil {
+		return err
+	}
+
+	return isrcCacheDB.Update(func(tx *bolt.Tx) error {
+		if tx.Bucket([]byte(spotifyMetadataCacheBucket)) == nil {
+			return nil
+		}
+		return tx.DeleteBucket([]byte(spotifyMetadataCacheBucket))
+	})
+}
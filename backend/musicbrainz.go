@@ -20,6 +20,7 @@ const (
 	musicBrainzRequestTimeout        = 10 * time.Second
 	musicBrainzRequestRetries        = 3
 	musicBrainzRequestRetryWait      = 3 * time.Second
+	musicBrainzRequestRetryMaxWait   = 30 * time.Second
 	musicBrainzMinRequestInterval    = 1100 * time.Millisecond
 	musicBrainzThrottleCooldownOn503 = 5 * time.Second
 	musicBrainzStatusCheckSkipWindow = 5 * time.Minute
@@ -27,6 +28,7 @@ const (
 
 type musicBrainzStatusError struct {
 	StatusCode int
+	RetryAfter time.Duration
 }
 
 func (e *musicBrainzStatusError) Error() string {
@@ -169,7 +171,18 @@ func shouldRetryMusicBrainzRequest(err error) bool {
 		return true
 	}
 
-	return statusErr.StatusCode == http.StatusServiceUnavailable || statusErr.StatusCode >= http.StatusInternalServerError
+	return statusErr.StatusCode == http.StatusTooManyRequests || statusErr.StatusCode >= http.StatusInternalServerError
+}
+
+func musicBrainzRetryDelay(err error, attempt int) time.Duration {
+	delay := RetryBackoffDelay(musicBrainzRequestRetryWait, musicBrainzRequestRetryMaxWait, attempt)
+	if statusErr, ok := err.(*musicBrainzStatusError); ok && statusErr.RetryAfter > 0 {
+		delay = statusErr.RetryAfter
+		if delay > musicBrainzRequestRetryMaxWait {
+			delay = musicBrainzRequestRetryMaxWait
+		}
+	}
+	return delay
 }
 
 func queryMusicBrainzRecordings(client *http.Client, query string) (*MusicBrainzRecordingResponse, error) {
@@ -204,15 +217,19 @@ func queryMusicBrainzRecordings(client *http.Client, query string) (*MusicBrainz
 		} else if resp == nil {
 			lastErr = fmt.Errorf("empty response from MusicBrainz")
 		} else {
-			if resp.StatusCode == http.StatusServiceUnavailable {
+			if resp.StatusCode == http.StatusServiceUnavailable || resp.StatusCode == http.StatusTooManyRequests {
 				noteMusicBrainzThrottle()
 			}
-			lastErr = &musicBrainzStatusError{StatusCode: resp.StatusCode}
-			resp.Body.Close()
+			statusErr := &musicBrainzStatusError{StatusCode: resp.StatusCode}
+			if retryAfter, ok := ParseRetryAfter(resp.Header.Get("Retry-After")); ok {
+				statusErr.RetryAfter = retryAfter
+			}
+			lastErr = statusErr
+			discardResponseBody(resp)
 		}
 
 		if attempt < musicBrainzRequestRetries-1 && shouldRetryMusicBrainzRequest(lastErr) {
-			time.Sleep(musicBrainzRequestRetryWait)
+			time.Sleep(musicBrainzRetryDelay(lastErr, attempt))
 			continue
 		}
 
@@ -270,9 +287,7 @@ func FetchMusicBrainzMetadata(isrc, title, artist, album string, useSingleGenre
 		musicBrainzInflightMu.Unlock()
 	}()
 
-	client := &http.Client{
-		Timeout: musicBrainzRequestTimeout,
-	}
+	client := NewAPIHTTPClient(musicBrainzRequestTimeout)
 
 	query := fmt.Sprintf("isrc:%s", isrc)
 	mbResp, err := queryMusicBrainzRecordings(client, query)
@@ -0,0 +1,157 @@
+package backend
+
+import (
+	"bufio"
+	"fmt"
+	"io"
+	"os"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+const (
+	downloadWriteBufferSize = 1024 * 1024
+	downloadCopyBufferSize  = 64 << 10
+	downloadPipelineDepth   = 16
+	downloadStallTimeout    = 60 * time.Second
+)
+
+var downloadCopyBuffers = sync.Pool{
+	New: func() interface{} {
+		buf := make([]byte, downloadCopyBufferSize)
+		return &buf
+	},
+}
+
+type downloadChunk struct {
+	buf *[]byte
+	n   int
+	err error
+}
+
+// copyDownloadBody copies a response body in 64 KiB chunks, reading on its own
+// goroutine so the connection keeps draining while a write or buffer flush is
+// blocked on a slow disk. Up to downloadPipelineDepth chunks are in flight.
+func copyDownloadBody(dst io.Writer, src io.Reader) (int64, error) {
+	chunks := make(chan downloadChunk, downloadPipelineDepth)
+	stop := make(chan struct{})
+	defer close(stop)
+
+	go func() {
+		defer close(chunks)
+		for {
+			buf := downloadCopyBuffers.Get().(*[]byte)
+			n, err := src.Read(*buf)
+			select {
+			case chunks <- downloadChunk{buf: buf, n: n, err: err}:
+			case <-stop:
+				downloadCopyBuffers.Put(buf)
+				return
+			}
+			if err != nil {
+				return
+			}
+		}
+	}()
+
+	var written int64
+	for chunk := range chunks {
+		if chunk.n > 0 {
+			n, err := dst.Write((*chunk.buf)[:chunk.n])
+			written += int64(n)
+			if err == nil && n != chunk.n {
+				err = io.ErrShortWrite
+			}
+			if err != nil {
+				downloadCopyBuffers.Put(chunk.buf)
+				return written, err
+			}
+		}
+		downloadCopyBuffers.Put(chunk.buf)
+		if chunk.err == io.EOF {
+			break
+		}
+		if chunk.err != nil {
+			return written, chunk.err
+		}
+	}
+	return written, nil
+}
+
+// stallGuardedBody closes a response body once no bytes have arrived for
+// downloadStallTimeout. Large transfers can then run without an overall client
+// deadline while a dead connection still fails instead of hanging forever.
+type stallGuardedBody struct {
+	body    io.ReadCloser
+	timer   *time.Timer
+	stalled atomic.Bool
+}
+
+func guardDownloadStall(body io.ReadCloser) *stallGuardedBody {
+	g := &stallGuardedBody{body: body}
+	g.timer = time.AfterFunc(downloadStallTimeout, func() {
+		g.stalled.Store(true)
+		body.Close()
+	})
+	return g
+}
+
+func (g *stallGuardedBody) Read(p []byte) (int, error) {
+	n, err := g.body.Read(p)
+	if n > 0 {
+		g.timer.Reset(downloadStallTimeout)
+	}
+	if err != nil && g.stalled.Load() {
+		err = fmt.Errorf("download stalled: no data received for %s", downloadStallTimeout)
+	}
+	return n, err
+}
+
+func (g *stallGuardedBody) Close() error {
+	g.timer.Stop()
+	return g.body.Close()
+}
+
+func downloadToFile(path string, src io.Reader, expectedSize int64, itemID string) (int64, error) {
+	if body, ok := src.(io.ReadCloser); ok {
+		guarded := guardDownloadStall(body)
+		defer guarded.timer.Stop()
+		src = guarded
+	}
+
+	tmpPath := path + ".part"
+	out, err := os.Create(tmpPath)
+	if err != nil {
+		return 0, fmt.Errorf("failed to create file: %w", err)
+	}
+
+	preallocated := expectedSize > 0 && preallocateFile(out, expectedSize) == nil
+
+	buffered := bufio.NewWriterSize(out, downloadWriteBufferSize)
+	progress := NewProgressWriterWithID(buffered, itemID)
+	written, err := copyDownloadBody(progress, src)
+	if err == nil {
+		err = buffered.Flush()
+	}
+	if err == nil {
+		progress.Finish()
+	}
+	if err == nil && preallocated && written != expectedSize {
+		err = out.Truncate(written)
+	}
+	if closeErr := out.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		os.Remove(tmpPath)
+		return written, fmt.Errorf("failed to write file: %w", err)
+	}
+
+	if err := os.Rename(tmpPath, path); err != nil {
+		os.Remove(tmpPath)
+		return written, fmt.Errorf("failed to finalize file: %w", err)
+	}
+
+	return written, nil
+}
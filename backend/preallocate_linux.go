@@ -0,0 +1,13 @@
+//go:build linux
+// +build linux
+
+package backend
+
+import (
+	"os"
+	"syscall"
+)
+
+func preallocateFile(f *os.File, size int64) error {
+	return syscall.Fallocate(int(f.Fd()), 0, 0, size)
+}
@@ -0,0 +1,10 @@
+//go:build !linux && !windows
+// +build !linux,!windows
+
+package backend
+
+import "os"
+
+func preallocateFile(f *os.File, size int64) error {
+	return nil
+}
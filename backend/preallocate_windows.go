@@ -0,0 +1,10 @@
+//go:build windows
+// +build windows
+
+package backend
+
+import "os"
+
+func preallocateFile(f *os.File, size int64) error {
+	return f.Truncate(size)
+}
@@ -3,7 +3,9 @@ package backend
 import (
 	"fmt"
 	"io"
+	"math"
 	"sync"
+	"sync/atomic"
 	"time"
 )
 
@@ -34,21 +36,36 @@ type DownloadItem struct {
 }
 
 var (
-	currentProgress     float64
-	currentProgressLock sync.RWMutex
-	isDownloading       bool
-	downloadingLock     sync.RWMutex
-	currentSpeed        float64
-	speedLock           sync.RWMutex
+	currentProgressBits atomic.Uint64
+	isDownloading       atomic.Bool
+	activeDownloads     int
+	downloadingLock     sync.Mutex
+	currentSpeedBits    atomic.Uint64
 
 	downloadQueue       []DownloadItem
+	downloadQueueIndex  = make(map[string]int)
+	queueStatusCounts   = make(map[DownloadStatus]int)
+	downloadingItemIDs  = make(map[string]struct{})
 	downloadQueueLock   sync.RWMutex
 	currentItemID       string
 	currentItemLock     sync.RWMutex
 	totalDownloaded     float64
 	totalDownloadedLock sync.RWMutex
 	sessionStartTime    int64
+	sessionStartedAt    time.Time
 	sessionStartLock    sync.RWMutex
+
+	completionIntervalEMA float64
+	lastCompletionTime    time.Time
+
+	retainedFinished int
+	prunedCompleted  int
+	prunedSkipped    int
+
+	queueVersion       atomic.Int64
+	queueChanged       = make(chan struct{})
+	queueChangedLock   sync.Mutex
+	lastProgressNotify atomic.Int64
 )
 
 type ProgressInfo struct {
@@ -63,56 +80,141 @@ type DownloadQueueInfo struct {
 	CurrentSpeed     float64        `json:"current_speed"`
 	TotalDownloaded  float64        `json:"total_downloaded"`
 	SessionStartTime int64          `json:"session_start_time"`
+	SessionElapsed   int64          `json:"session_elapsed"`
 	QueuedCount      int            `json:"queued_count"`
+	DownloadingCount int            `json:"downloading_count"`
 	CompletedCount   int            `json:"completed_count"`
 	FailedCount      int            `json:"failed_count"`
 	SkippedCount     int            `json:"skipped_count"`
+	EstimatedSeconds int64          `json:"estimated_seconds"`
 }
 
-func GetDownloadProgress() ProgressInfo {
-	downloadingLock.RLock()
-	downloading := isDownloading
-	downloadingLock.RUnlock()
+const (
+	completionEMAAlpha = 0.3
 
-	currentProgressLock.RLock()
-	progress := currentProgress
-	currentProgressLock.RUnlock()
+	maxRetainedFinishedItems = 1000
+	finishedItemsPruneSlack  = 100
+)
+
+func GetDownloadProgress() ProgressInfo {
+	downloadQueueLock.RLock()
+	mb, speed, ok := activeItemsProgressLocked()
+	downloadQueueLock.RUnlock()
 
-	speedLock.RLock()
-	speed := currentSpeed
-	speedLock.RUnlock()
+	if !ok {
+		mb = math.Float64frombits(currentProgressBits.Load())
+		speed = math.Float64frombits(currentSpeedBits.Load())
+	}
 
 	return ProgressInfo{
-		IsDownloading: downloading,
-		MBDownloaded:  progress,
+		IsDownloading: isDownloading.Load(),
+		MBDownloaded:  mb,
 		SpeedMBps:     speed,
 	}
 }
 
+// activeItemsProgressLocked sums progress and speed over the items that are
+// downloading right now, so parallel downloads add up instead of
+// overwriting one another. ok is false when nothing is in flight as a queue
+// item (e.g. the ffmpeg download), in which case callers fall back to the
+// global counters.
+func activeItemsProgressLocked() (mb, speed float64, ok bool) {
+	for id := range downloadingItemIDs {
+		if item := findQueueItem(id); item != nil {
+			mb += item.Progress
+			speed += item.Speed
+			ok = true
+		}
+	}
+	return mb, speed, ok
+}
+
 func SetDownloadSpeed(mbps float64) {
-	speedLock.Lock()
-	currentSpeed = mbps
-	speedLock.Unlock()
+	currentSpeedBits.Store(math.Float64bits(mbps))
+}
+
+// reportDownloadProgress records progress against the queue item when the
+// download belongs to one, and against the global counters otherwise.
+func reportDownloadProgress(itemID string, mbDownloaded, speedMBps float64) {
+	if itemID != "" {
+		UpdateItemProgress(itemID, mbDownloaded, speedMBps)
+		return
+	}
+	SetDownloadSpeed(speedMBps)
+	SetDownloadProgress(mbDownloaded)
 }
 
 func SetDownloadProgress(mbDownloaded float64) {
-	currentProgressLock.Lock()
-	currentProgress = mbDownloaded
-	currentProgressLock.Unlock()
+	currentProgressBits.Store(math.Float64bits(mbDownloaded))
+
+	notifyProgressChanged()
 }
 
 func SetDownloading(downloading bool) {
 	downloadingLock.Lock()
-	isDownloading = downloading
+	if downloading {
+		activeDownloads++
+	} else if activeDownloads > 0 {
+		activeDownloads--
+	}
+	idle := activeDownloads == 0
+	isDownloading.Store(!idle)
 	downloadingLock.Unlock()
 
-	if !downloading {
+	if idle {
 
 		SetDownloadProgress(0)
 		SetDownloadSpeed(0)
 	}
+	notifyQueueChanged()
 }
 
+func notifyQueueChanged() {
+	queueChangedLock.Lock()
+	queueVersion.Add(1)
+	close(queueChanged)
+	queueChanged = make(chan struct{})
+	queueChangedLock.Unlock()
+}
+
+// notifyProgressChanged coalesces byte-level progress wakeups from concurrent
+// writers into at most one per progressUpdateIntervalMs. Status transitions
+// still call notifyQueueChanged directly so they are never delayed.
+func notifyProgressChanged() {
+	now := getCurrentTimeMillis()
+	last := lastProgressNotify.Load()
+	if now-last < progressUpdateIntervalMs || !lastProgressNotify.CompareAndSwap(last, now) {
+		return
+	}
+	notifyQueueChanged()
+}
+
+func WaitForDownloadQueueChange(lastVersion int64, timeout time.Duration) int64 {
+	queueChangedLock.Lock()
+	changed := queueChanged
+	version := queueVersion.Load()
+	queueChangedLock.Unlock()
+
+	if version != lastVersion {
+		return version
+	}
+
+	timer := time.NewTimer(timeout)
+	defer timer.Stop()
+
+	select {
+	case <-changed:
+	case <-timer.C:
+	}
+	return queueVersion.Load()
+}
+
+const progressUpdateIntervalMs = 100
+
+// progressCheckBytes is how much data must arrive between progress checks;
+// smaller writes skip the clock read and the speed calculation.
+const progressCheckBytes = 256 * 1024
+
 type ProgressWriter struct {
 	writer      io.Writer
 	total       int64
@@ -149,29 +251,31 @@ func getCurrentTimeMillis() int64 {
 func (pw *ProgressWriter) Write(p []byte) (int, error) {
 	n, err := pw.writer.Write(p)
 	pw.total += int64(n)
+	if pw.total-pw.lastPrinted < progressCheckBytes {
+		return n, err
+	}
 
-	if pw.total-pw.lastPrinted >= 256*1024 {
+	now := getCurrentTimeMillis()
+	if now-pw.lastTime >= progressUpdateIntervalMs {
 		mbDownloaded := float64(pw.total) / (1024 * 1024)
 
-		now := getCurrentTimeMillis()
 		timeDiff := float64(now-pw.lastTime) / 1000.0
 		bytesDiff := float64(pw.total - pw.lastBytes)
 
 		var speedMBps float64
 		if timeDiff > 0 {
 			speedMBps = (bytesDiff / (1024 * 1024)) / timeDiff
-			SetDownloadSpeed(speedMBps)
-			fmt.Printf("\rDownloaded: %.2f MB (%.2f MB/s)", mbDownloaded, speedMBps)
-		} else {
-			fmt.Printf("\rDownloaded: %.2f MB", mbDownloaded)
 		}
-
-		SetDownloadProgress(mbDownloaded)
-
-		if pw.itemID != "" {
-			UpdateItemProgress(pw.itemID, mbDownloaded, speedMBps)
+		if consoleIsTerminal {
+			if timeDiff > 0 {
+				fmt.Printf("\rDownloaded: %.2f MB (%.2f MB/s)", mbDownloaded, speedMBps)
+			} else {
+				fmt.Printf("\rDownloaded: %.2f MB", mbDownloaded)
+			}
 		}
 
+		reportDownloadProgress(pw.itemID, mbDownloaded, speedMBps)
+
 		pw.lastPrinted = pw.total
 		pw.lastTime = now
 		pw.lastBytes = pw.total
@@ -180,48 +284,74 @@ func (pw *ProgressWriter) Write(p []byte) (int, error) {
 	return n, err
 }
 
+// Finish reports whatever arrived since the last update. Write only checks
+// after progressCheckBytes, so without this the tail of a file (all of a
+// small one) would never show up in the reported progress.
+func (pw *ProgressWriter) Finish() {
+	if pw.total == pw.lastPrinted {
+		return
+	}
+
+	mbDownloaded := float64(pw.total) / (1024 * 1024)
+	if pw.itemID != "" {
+		UpdateItemProgress(pw.itemID, mbDownloaded, 0)
+	} else {
+		SetDownloadProgress(mbDownloaded)
+	}
+	pw.lastPrinted = pw.total
+}
+
 func (pw *ProgressWriter) GetTotal() int64 {
 	return pw.total
 }
 
 func AddToQueue(id, trackName, artistName, albumName, spotifyID string) {
-	downloadQueueLock.Lock()
-	defer downloadQueueLock.Unlock()
-
-	item := DownloadItem{
+	AddBatchToQueue([]DownloadItem{{
 		ID:         id,
 		TrackName:  trackName,
 		ArtistName: artistName,
 		AlbumName:  albumName,
 		SpotifyID:  spotifyID,
-		Status:     StatusQueued,
-		Progress:   0,
-		TotalSize:  0,
-		Speed:      0,
-		StartTime:  0,
-		EndTime:    0,
+	}})
+}
+
+func AddBatchToQueue(items []DownloadItem) {
+	if len(items) == 0 {
+		return
 	}
+	defer notifyQueueChanged()
 
-	downloadQueue = append(downloadQueue, item)
+	downloadQueueLock.Lock()
+	defer downloadQueueLock.Unlock()
+
+	for _, item := range items {
+		item.Status = StatusQueued
+		queueStatusCounts[StatusQueued]++
+		if _, exists := downloadQueueIndex[item.ID]; !exists {
+			downloadQueueIndex[item.ID] = len(downloadQueue)
+		}
+		downloadQueue = append(downloadQueue, item)
+	}
 
 	sessionStartLock.Lock()
 	if sessionStartTime == 0 {
-		sessionStartTime = time.Now().Unix()
+		sessionStartedAt = time.Now()
+		sessionStartTime = sessionStartedAt.Unix()
 	}
 	sessionStartLock.Unlock()
 }
 
 func StartDownloadItem(id string) {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
-	for i := range downloadQueue {
-		if downloadQueue[i].ID == id {
-			downloadQueue[i].Status = StatusDownloading
-			downloadQueue[i].StartTime = time.Now().Unix()
-			downloadQueue[i].Progress = 0
-			break
-		}
+	if item := findQueueItem(id); item != nil {
+		setItemStatusLocked(item, StatusDownloading)
+		item.StartTime = time.Now().Unix()
+		item.Progress = 0
+		item.Speed = 0
 	}
 
 	currentItemLock.Lock()
@@ -230,14 +360,53 @@ func StartDownloadItem(id string) {
 }
 
 func UpdateItemProgress(id string, progress, speed float64) {
+	defer notifyProgressChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
+	if item := findQueueItem(id); item != nil {
+		item.Progress = progress
+		item.Speed = speed
+	}
+}
+
+func findQueueItem(id string) *DownloadItem {
+	if i, ok := downloadQueueIndex[id]; ok && i < len(downloadQueue) && downloadQueue[i].ID == id {
+		return &downloadQueue[i]
+	}
+	return nil
+}
+
+// setItemStatusLocked moves an item to a new status and keeps the running
+// per-status counts in sync so summaries never have to rescan the queue.
+func setItemStatusLocked(item *DownloadItem, status DownloadStatus) {
+	queueStatusCounts[item.Status]--
+	queueStatusCounts[status]++
+	item.Status = status
+	if status == StatusDownloading {
+		downloadingItemIDs[item.ID] = struct{}{}
+	} else {
+		delete(downloadingItemIDs, item.ID)
+	}
+}
+
+func recountQueueStatusesLocked() {
+	queueStatusCounts = make(map[DownloadStatus]int)
+	downloadingItemIDs = make(map[string]struct{})
+	for _, item := range downloadQueue {
+		queueStatusCounts[item.Status]++
+		if item.Status == StatusDownloading {
+			downloadingItemIDs[item.ID] = struct{}{}
+		}
+	}
+}
+
+func rebuildDownloadQueueIndex() {
+	downloadQueueIndex = make(map[string]int, len(downloadQueue))
 	for i := range downloadQueue {
-		if downloadQueue[i].ID == id {
-			downloadQueue[i].Progress = progress
-			downloadQueue[i].Speed = speed
-			break
+		if _, exists := downloadQueueIndex[downloadQueue[i].ID]; !exists {
+			downloadQueueIndex[downloadQueue[i].ID] = i
 		}
 	}
 }
@@ -249,67 +418,157 @@ func GetCurrentItemID() string {
 }
 
 func CompleteDownloadItem(id, filePath string, finalSize float64) {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
-	for i := range downloadQueue {
-		if downloadQueue[i].ID == id {
-			downloadQueue[i].Status = StatusCompleted
-			downloadQueue[i].EndTime = time.Now().Unix()
-			downloadQueue[i].FilePath = filePath
-			downloadQueue[i].Progress = finalSize
-			downloadQueue[i].TotalSize = finalSize
-
-			totalDownloadedLock.Lock()
-			totalDownloaded += finalSize
-			totalDownloadedLock.Unlock()
-			break
-		}
+	if item := findQueueItem(id); item != nil {
+		setItemStatusLocked(item, StatusCompleted)
+		item.EndTime = time.Now().Unix()
+		item.FilePath = filePath
+		item.Progress = finalSize
+		item.TotalSize = finalSize
+		recordCompletionLocked(time.Unix(item.StartTime, 0))
+		noteFinishedItemLocked()
+
+		totalDownloadedLock.Lock()
+		totalDownloaded += finalSize
+		totalDownloadedLock.Unlock()
+	}
+}
+
+func recordCompletionLocked(itemStart time.Time) {
+	now := time.Now()
+	since := lastCompletionTime
+	if since.IsZero() || itemStart.After(since) {
+		since = itemStart
+	}
+	interval := now.Sub(since).Seconds()
+	lastCompletionTime = now
+	if interval <= 0 {
+		return
+	}
+	if completionIntervalEMA == 0 {
+		completionIntervalEMA = interval
+	} else {
+		completionIntervalEMA += completionEMAAlpha * (interval - completionIntervalEMA)
 	}
 }
 
+func resetCompletionEstimateLocked() {
+	completionIntervalEMA = 0
+	lastCompletionTime = time.Time{}
+}
+
 func FailDownloadItem(id, errorMsg string) {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
-	for i := range downloadQueue {
-		if downloadQueue[i].ID == id {
-			downloadQueue[i].Status = StatusFailed
-			downloadQueue[i].EndTime = time.Now().Unix()
-			downloadQueue[i].ErrorMessage = errorMsg
-			break
-		}
+	if item := findQueueItem(id); item != nil {
+		setItemStatusLocked(item, StatusFailed)
+		item.EndTime = time.Now().Unix()
+		item.ErrorMessage = errorMsg
 	}
 }
 
 func SkipDownloadItem(id, filePath string) {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
-	for i := range downloadQueue {
-		if downloadQueue[i].ID == id {
-			downloadQueue[i].Status = StatusSkipped
-			downloadQueue[i].EndTime = time.Now().Unix()
-			downloadQueue[i].FilePath = filePath
-			break
+	if item := findQueueItem(id); item != nil {
+		setItemStatusLocked(item, StatusSkipped)
+		item.EndTime = time.Now().Unix()
+		item.FilePath = filePath
+		noteFinishedItemLocked()
+	}
+}
+
+func SkipDownloadItems(filePaths map[string]string) {
+	if len(filePaths) == 0 {
+		return
+	}
+	defer notifyQueueChanged()
+
+	downloadQueueLock.Lock()
+	defer downloadQueueLock.Unlock()
+
+	now := time.Now().Unix()
+	for id, filePath := range filePaths {
+		if item := findQueueItem(id); item != nil {
+			setItemStatusLocked(item, StatusSkipped)
+			item.EndTime = now
+			item.FilePath = filePath
+			noteFinishedItemLocked()
 		}
 	}
 }
 
+func noteFinishedItemLocked() {
+	retainedFinished++
+	if retainedFinished <= maxRetainedFinishedItems+finishedItemsPruneSlack {
+		return
+	}
+
+	finished := queueStatusCounts[StatusCompleted] + queueStatusCounts[StatusSkipped]
+
+	excess := finished - maxRetainedFinishedItems
+	kept := downloadQueue[:0]
+	for _, item := range downloadQueue {
+		if excess > 0 && (item.Status == StatusCompleted || item.Status == StatusSkipped) {
+			if item.Status == StatusCompleted {
+				prunedCompleted++
+			} else {
+				prunedSkipped++
+			}
+			queueStatusCounts[item.Status]--
+			excess--
+			finished--
+			continue
+		}
+		kept = append(kept, item)
+	}
+	downloadQueue = kept
+	retainedFinished = finished
+	rebuildDownloadQueueIndex()
+}
+
+func GetFailedDownloadItems() []DownloadItem {
+	downloadQueueLock.RLock()
+	defer downloadQueueLock.RUnlock()
+
+	var failedItems []DownloadItem
+	for _, item := range downloadQueue {
+		if item.Status == StatusFailed {
+			failedItems = append(failedItems, item)
+		}
+	}
+	return failedItems
+}
+
 func GetDownloadQueue() DownloadQueueInfo {
+	return buildDownloadQueueInfo(true)
+}
 
+func GetDownloadQueueSummary() DownloadQueueInfo {
+	return buildDownloadQueueInfo(false)
+}
+
+func buildDownloadQueueInfo(includeItems bool) DownloadQueueInfo {
 	ResetSessionIfComplete()
 
 	downloadQueueLock.RLock()
 	defer downloadQueueLock.RUnlock()
 
-	downloadingLock.RLock()
-	downloading := isDownloading
-	downloadingLock.RUnlock()
-
-	speedLock.RLock()
-	speed := currentSpeed
-	speedLock.RUnlock()
+	downloading := isDownloading.Load()
+	_, speed, ok := activeItemsProgressLocked()
+	if !ok {
+		speed = math.Float64frombits(currentSpeedBits.Load())
+	}
 
 	totalDownloadedLock.RLock()
 	total := totalDownloaded
@@ -317,24 +576,28 @@ func GetDownloadQueue() DownloadQueueInfo {
 
 	sessionStartLock.RLock()
 	sessionStart := sessionStartTime
+	var sessionElapsed int64
+	if sessionStart != 0 {
+		sessionElapsed = int64(time.Since(sessionStartedAt) / time.Second)
+	}
 	sessionStartLock.RUnlock()
 
-	var queued, completed, failed, skipped int
-	for _, item := range downloadQueue {
-		switch item.Status {
-		case StatusQueued:
-			queued++
-		case StatusCompleted:
-			completed++
-		case StatusFailed:
-			failed++
-		case StatusSkipped:
-			skipped++
-		}
+	queued := queueStatusCounts[StatusQueued]
+	downloadingCount := queueStatusCounts[StatusDownloading]
+	completed := queueStatusCounts[StatusCompleted] + prunedCompleted
+	failed := queueStatusCounts[StatusFailed]
+	skipped := queueStatusCounts[StatusSkipped] + prunedSkipped
+
+	var estimated int64
+	if completionIntervalEMA > 0 {
+		estimated = int64(completionIntervalEMA*float64(queued+downloadingCount) + 0.5)
 	}
 
-	queueCopy := make([]DownloadItem, len(downloadQueue))
-	copy(queueCopy, downloadQueue)
+	queueCopy := []DownloadItem{}
+	if includeItems {
+		queueCopy = make([]DownloadItem, len(downloadQueue))
+		copy(queueCopy, downloadQueue)
+	}
 
 	return DownloadQueueInfo{
 		IsDownloading:    downloading,
@@ -342,14 +605,19 @@ func GetDownloadQueue() DownloadQueueInfo {
 		CurrentSpeed:     speed,
 		TotalDownloaded:  total,
 		SessionStartTime: sessionStart,
+		SessionElapsed:   sessionElapsed,
 		QueuedCount:      queued,
+		DownloadingCount: downloadingCount,
 		CompletedCount:   completed,
 		FailedCount:      failed,
 		SkippedCount:     skipped,
+		EstimatedSeconds: estimated,
 	}
 }
 
 func ClearDownloadQueue() {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
@@ -360,11 +628,25 @@ func ClearDownloadQueue() {
 		}
 	}
 	downloadQueue = newQueue
+	retainedFinished = 0
+	prunedCompleted = 0
+	prunedSkipped = 0
+	recountQueueStatusesLocked()
+	rebuildDownloadQueueIndex()
 }
 
 func ClearAllDownloads() {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	downloadQueue = []DownloadItem{}
+	downloadQueueIndex = make(map[string]int)
+	queueStatusCounts = make(map[DownloadStatus]int)
+	downloadingItemIDs = make(map[string]struct{})
+	retainedFinished = 0
+	prunedCompleted = 0
+	prunedSkipped = 0
+	resetCompletionEstimateLocked()
 	downloadQueueLock.Unlock()
 
 	totalDownloadedLock.Lock()
@@ -381,15 +663,18 @@ func ClearAllDownloads() {
 
 	SetDownloadProgress(0)
 	SetDownloadSpeed(0)
+	notifyQueueChanged()
 }
 
 func CancelAllQueuedItems() {
+	defer notifyQueueChanged()
+
 	downloadQueueLock.Lock()
 	defer downloadQueueLock.Unlock()
 
 	for i := range downloadQueue {
 		if downloadQueue[i].Status == StatusQueued {
-			downloadQueue[i].Status = StatusSkipped
+			setItemStatusLocked(&downloadQueue[i], StatusSkipped)
 			downloadQueue[i].EndTime = time.Now().Unix()
 			downloadQueue[i].ErrorMessage = "Cancelled"
 		}
@@ -398,13 +683,7 @@ func CancelAllQueuedItems() {
 
 func ResetSessionIfComplete() {
 	downloadQueueLock.RLock()
-	hasActiveOrQueued := false
-	for _, item := range downloadQueue {
-		if item.Status == StatusQueued || item.Status == StatusDownloading {
-			hasActiveOrQueued = true
-			break
-		}
-	}
+	hasActiveOrQueued := queueStatusCounts[StatusQueued]+queueStatusCounts[StatusDownloading] > 0
 	downloadQueueLock.RUnlock()
 
 	if !hasActiveOrQueued {
@@ -415,5 +694,9 @@ func ResetSessionIfComplete() {
 		totalDownloadedLock.Lock()
 		totalDownloaded = 0
 		totalDownloadedLock.Unlock()
+
+		downloadQueueLock.Lock()
+		resetCompletionEstimateLocked()
+		downloadQueueLock.Unlock()
 	}
 }
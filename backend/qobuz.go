@@ -2,6 +2,7 @@ package backend
 
 import (
 	"bytes"
+	"context"
 	"crypto/aes"
 	"crypto/cipher"
 	"crypto/sha256"
@@ -12,7 +13,6 @@ import (
 	"net/url"
 	"os"
 	"path/filepath"
-	"regexp"
 	"strings"
 	"sync"
 	"time"
@@ -21,6 +21,7 @@ import (
 type QobuzDownloader struct {
 	client *http.Client
 	appID  string
+	itemID string
 }
 
 type QobuzSearchResponse struct {
@@ -126,13 +127,15 @@ var qobuzMusicDLDebugKeyTag = []byte{
 
 func NewQobuzDownloader() *QobuzDownloader {
 	return &QobuzDownloader{
-		client: &http.Client{
-			Timeout: 60 * time.Second,
-		},
-		appID: qobuzDefaultAPIAppID,
+		client: NewDownloadHTTPClient(60 * time.Second),
+		appID:  qobuzDefaultAPIAppID,
 	}
 }
 
+func (q *QobuzDownloader) SetItemID(itemID string) {
+	q.itemID = itemID
+}
+
 func previewQobuzResponseBody(body []byte, maxLen int) string {
 	preview := strings.TrimSpace(string(body))
 	if len(preview) > maxLen {
@@ -256,7 +259,7 @@ func (q *QobuzDownloader) DownloadFromStandard(apiBase string, trackID int64, qu
 		return "", err
 	}
 
-	resp, err := q.client.Do(req)
+	resp, err := DoWithFailoverRateLimitRetry(q.client, req)
 	if err != nil {
 		return "", err
 	}
@@ -293,6 +296,10 @@ func (q *QobuzDownloader) DownloadFromStandard(apiBase string, trackID int64, qu
 }
 
 func (q *QobuzDownloader) DownloadFromMusicDL(trackID int64, quality string) (string, error) {
+	return q.downloadFromMusicDL(context.Background(), trackID, quality)
+}
+
+func (q *QobuzDownloader) downloadFromMusicDL(ctx context.Context, trackID int64, quality string) (string, error) {
 	if strings.TrimSpace(quality) == "" {
 		quality = "6"
 	}
@@ -315,10 +322,11 @@ func (q *QobuzDownloader) DownloadFromMusicDL(trackID int64, quality string) (st
 		return "", fmt.Errorf("failed to create MusicDL request: %w", err)
 	}
 
+	req = req.WithContext(ctx)
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("X-Debug-Key", debugKey)
 
-	resp, err := q.client.Do(req)
+	resp, err := DoWithFailoverRateLimitRetry(q.client, req)
 	if err != nil {
 		return "", fmt.Errorf("failed to reach MusicDL: %w", err)
 	}
@@ -357,13 +365,13 @@ func (q *QobuzDownloader) DownloadFromMusicDL(trackID int64, quality string) (st
 	return downloadURL, nil
 }
 
-func CheckQobuzMusicDLStatus(client *http.Client) bool {
+func CheckQobuzMusicDLStatus(ctx context.Context, client *http.Client) bool {
 	if client == nil {
-		client = &http.Client{Timeout: 4 * time.Second}
+		client = NewAPIHTTPClient(4 * time.Second)
 	}
 
 	downloader := &QobuzDownloader{client: client, appID: qobuzDefaultAPIAppID}
-	_, err := downloader.DownloadFromMusicDL(qobuzMusicDLProbeTrackID, "27")
+	_, err := downloader.downloadFromMusicDL(ctx, qobuzMusicDLProbeTrackID, "27")
 	return err == nil
 }
 
@@ -473,9 +481,7 @@ func (q *QobuzDownloader) GetDownloadURL(trackID int64, quality string, allowFal
 func (q *QobuzDownloader) DownloadFile(url, filepath string) error {
 	fmt.Println("Starting file download...")
 
-	downloadClient := &http.Client{
-		Timeout: 5 * time.Minute,
-	}
+	downloadClient := NewDownloadHTTPClient(0)
 
 	req, err := NewRequestWithDefaultHeaders(http.MethodGet, url, nil)
 	if err != nil {
@@ -493,21 +499,14 @@ func (q *QobuzDownloader) DownloadFile(url, filepath string) error {
 	}
 
 	fmt.Printf("Creating file: %s\n", filepath)
-	out, err := os.Create(filepath)
-	if err != nil {
-		return fmt.Errorf("failed to create file: %w", err)
-	}
-	defer out.Close()
-
 	fmt.Println("Downloading...")
 
-	pw := NewProgressWriter(out)
-	_, err = io.Copy(pw, resp.Body)
+	written, err := downloadToFile(filepath, resp.Body, resp.ContentLength, q.itemID)
 	if err != nil {
-		return fmt.Errorf("failed to write file: %w", err)
+		return err
 	}
 
-	fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(pw.GetTotal())/(1024*1024))
+	fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(written)/(1024*1024))
 	return nil
 }
 
@@ -541,66 +540,6 @@ func (q *QobuzDownloader) DownloadCoverArt(coverURL, filepath string) error {
 	return err
 }
 
-func buildQobuzFilename(title, artist, album, albumArtist, releaseDate string, trackNumber, discNumber int, format string, includeTrackNumber bool, position int, useAlbumTrackNumber bool, extra ...string) string {
-	var filename string
-	isrc := ""
-	if len(extra) > 0 {
-		isrc = SanitizeOptionalFilename(extra[0])
-	}
-
-	numberToUse := position
-	if useAlbumTrackNumber && trackNumber > 0 {
-		numberToUse = trackNumber
-	}
-
-	year := ""
-	if len(releaseDate) >= 4 {
-		year = releaseDate[:4]
-	}
-
-	if strings.Contains(format, "{") {
-		filename = format
-		filename = strings.ReplaceAll(filename, "{title}", title)
-		filename = strings.ReplaceAll(filename, "{artist}", artist)
-		filename = strings.ReplaceAll(filename, "{album}", album)
-		filename = strings.ReplaceAll(filename, "{album_artist}", albumArtist)
-		filename = strings.ReplaceAll(filename, "{year}", year)
-		filename = strings.ReplaceAll(filename, "{date}", SanitizeFilename(releaseDate))
-		filename = strings.ReplaceAll(filename, "{isrc}", isrc)
-
-		if discNumber > 0 {
-			filename = strings.ReplaceAll(filename, "{disc}", fmt.Sprintf("%d", discNumber))
-		} else {
-			filename = strings.ReplaceAll(filename, "{disc}", "")
-		}
-
-		if numberToUse > 0 {
-			filename = strings.ReplaceAll(filename, "{track}", fmt.Sprintf("%02d", numberToUse))
-		} else {
-
-			filename = regexp.MustCompile(`\{track\}\.\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*-\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*`).ReplaceAllString(filename, "")
-		}
-	} else {
-
-		switch format {
-		case "artist-title":
-			filename = fmt.Sprintf("%s - %s", artist, title)
-		case "title":
-			filename = title
-		default:
-			filename = fmt.Sprintf("%s - %s", title, artist)
-		}
-
-		if includeTrackNumber && position > 0 {
-			filename = fmt.Sprintf("%02d. %s", numberToUse, filename)
-		}
-	}
-
-	return filename + ".flac"
-}
-
 func (q *QobuzDownloader) DownloadTrack(spotifyID, outputDir, quality, filenameFormat string, includeTrackNumber bool, position int, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate string, useAlbumTrackNumber bool, spotifyCoverURL string, embedMaxQualityCover bool, spotifyTrackNumber, spotifyDiscNumber, spotifyTotalTracks int, spotifyTotalDiscs int, spotifyCopyright, spotifyPublisher, spotifyComposer, metadataSeparator, spotifyURL string, allowFallback bool, useFirstArtistOnly bool, useSingleGenre bool, embedGenre bool) (string, error) {
 	var isrc string
 	if spotifyID != "" {
@@ -681,22 +620,23 @@ func (q *QobuzDownloader) DownloadTrackWithISRC(isrc, outputDir, quality, filena
 	}
 	fmt.Printf("Download URL obtained: %s\n", urlPreview)
 
-	safeArtist := sanitizeFilename(artists)
-	safeAlbumArtist := sanitizeFilename(spotifyAlbumArtist)
-
+	filenameArtist := artists
+	filenameAlbumArtist := spotifyAlbumArtist
 	if useFirstArtistOnly {
-		safeArtist = sanitizeFilename(GetFirstArtist(artists))
-		safeAlbumArtist = sanitizeFilename(GetFirstArtist(spotifyAlbumArtist))
+		filenameArtist = GetFirstArtist(artists)
+		filenameAlbumArtist = GetFirstArtist(spotifyAlbumArtist)
 	}
+	safeArtist := sanitizeFilename(filenameArtist)
+	safeAlbumArtist := sanitizeFilename(filenameAlbumArtist)
 
 	safeTitle := sanitizeFilename(trackTitle)
 	safeAlbum := sanitizeFilename(albumTitle)
 
-	filename := buildQobuzFilename(safeTitle, safeArtist, safeAlbum, safeAlbumArtist, spotifyReleaseDate, spotifyTrackNumber, spotifyDiscNumber, filenameFormat, includeTrackNumber, position, useAlbumTrackNumber, isrc)
+	filename := buildTrackFilename(safeTitle, safeArtist, safeAlbum, safeAlbumArtist, spotifyReleaseDate, spotifyTrackNumber, spotifyDiscNumber, filenameFormat, includeTrackNumber, position, useAlbumTrackNumber, isrc)
 	filepath := filepath.Join(outputDir, filename)
-	filepath, alreadyExists := ResolveOutputPathForDownload(filepath, GetRedownloadWithSuffixSetting())
+	filepath, existingSize, alreadyExists := resolveOutputPathWithSize(filepath, GetRedownloadWithSuffixSetting())
 	if alreadyExists {
-		fmt.Printf("File already exists: %s (%.2f MB)\n", filepath, float64(mustFileSize(filepath))/(1024*1024))
+		fmt.Printf("File already exists: %s (%.2f MB)\n", filepath, float64(existingSize)/(1024*1024))
 		return "EXISTS:" + filepath, nil
 	}
 
@@ -316,7 +316,7 @@ func getQobuzAPICredentials(forceRefresh bool) (*qobuzAPICredentials, error) {
 		return qobuzCachedCredentials, nil
 	}
 
-	client := &http.Client{Timeout: 30 * time.Second}
+	client := NewAPIHTTPClient(30 * time.Second)
 	scrapedCreds, scrapeErr := scrapeQobuzOpenCredentials(client)
 	if scrapeErr == nil {
 		if qobuzCredentialsSupportSignedMetadata(client, scrapedCreds) {
@@ -363,7 +363,7 @@ func newQobuzSignedRequest(method string, path string, params url.Values) (*http
 
 func doQobuzSignedRequest(method string, path string, params url.Values, client *http.Client) (*http.Response, error) {
 	if client == nil {
-		client = &http.Client{Timeout: 20 * time.Second}
+		client = NewAPIHTTPClient(20 * time.Second)
 	}
 
 	call := func(forceRefresh bool) (*http.Response, error) {
@@ -384,7 +384,7 @@ func doQobuzSignedRequest(method string, path string, params url.Values, client
 	}
 
 	if qobuzShouldRefreshCredentials(resp.StatusCode) {
-		resp.Body.Close()
+		discardResponseBody(resp)
 		return call(true)
 	}
 
@@ -392,7 +392,7 @@ func doQobuzSignedRequest(method string, path string, params url.Values, client
 }
 
 func doQobuzSignedJSONRequest(path string, params url.Values, target interface{}) error {
-	resp, err := doQobuzSignedRequest(http.MethodGet, path, params, &http.Client{Timeout: 20 * time.Second})
+	resp, err := doQobuzSignedRequest(http.MethodGet, path, params, NewAPIHTTPClient(20*time.Second))
 	if err != nil {
 		return err
 	}
@@ -24,6 +24,8 @@ func GetFlacInfoBatch(paths []string) []FlacInfo {
 		wg.Add(1)
 		go func(idx int, p string) {
 			defer wg.Done()
+			ffmpegJobSlots <- struct{}{}
+			defer func() { <-ffmpegJobSlots }()
 			info := FlacInfo{Path: p}
 
 			ffprobePath, err := GetFFprobePath()
@@ -48,7 +50,9 @@ func GetFlacInfoBatch(paths []string) []FlacInfo {
 			}
 
 			kvMap := make(map[string]string)
-			for _, line := range strings.Split(string(out), "\n") {
+			for rest := string(out); rest != ""; {
+				var line string
+				line, rest, _ = strings.Cut(rest, "\n")
 				if parts := strings.SplitN(line, "=", 2); len(parts) == 2 {
 					kvMap[strings.TrimSpace(parts[0])] = strings.TrimSpace(parts[1])
 				}
@@ -149,6 +153,8 @@ func ResampleAudio(req ResampleRequest) ([]ResampleResult, error) {
 		wg.Add(1)
 		go func(idx int, inputFile string) {
 			defer wg.Done()
+			ffmpegJobSlots <- struct{}{}
+			defer func() { <-ffmpegJobSlots }()
 
 			result := ResampleResult{
 				InputFile: inputFile,
@@ -0,0 +1,125 @@
+package backend
+
+import (
+	"fmt"
+	"net/http"
+	"sync"
+	"time"
+)
+
+var (
+	serviceSlotLimits = map[string]int{
+		"tidal":    4,
+		"qobuz":    2,
+		"amazon":   4,
+		"songlink": 4,
+	}
+	serviceSlots     = make(map[string]chan struct{})
+	serviceSlotsLock sync.Mutex
+)
+
+const (
+	rateLimitRetries  = 3
+	rateLimitMaxDelay = 60 * time.Second
+
+	failoverRateLimitRetries  = 1
+	failoverRateLimitMaxDelay = 2 * time.Second
+)
+
+// rateLimitPolicy bounds how long a request waits out 429 responses. With
+// capDelay a longer Retry-After is shortened to maxDelay; without it the 429
+// is returned straight away so the caller can try another endpoint.
+type rateLimitPolicy struct {
+	retries  int
+	maxDelay time.Duration
+	capDelay bool
+}
+
+var (
+	defaultRateLimitPolicy  = rateLimitPolicy{retries: rateLimitRetries, maxDelay: rateLimitMaxDelay, capDelay: true}
+	failoverRateLimitPolicy = rateLimitPolicy{retries: failoverRateLimitRetries, maxDelay: failoverRateLimitMaxDelay}
+)
+
+func serviceSlot(service string) chan struct{} {
+	serviceSlotsLock.Lock()
+	defer serviceSlotsLock.Unlock()
+
+	slot, ok := serviceSlots[service]
+	if !ok {
+		limit, known := serviceSlotLimits[service]
+		if !known {
+			return nil
+		}
+		slot = make(chan struct{}, limit)
+		serviceSlots[service] = slot
+	}
+	return slot
+}
+
+func AcquireServiceSlot(service string) func() {
+	slot := serviceSlot(service)
+	if slot == nil {
+		return func() {}
+	}
+
+	slot <- struct{}{}
+	return func() { <-slot }
+}
+
+func rateLimitRetryDelay(resp *http.Response, attempt int, policy rateLimitPolicy) (time.Duration, bool) {
+	if retryAfter, ok := ParseRetryAfter(resp.Header.Get("Retry-After")); ok {
+		if retryAfter > policy.maxDelay {
+			return policy.maxDelay, policy.capDelay
+		}
+		return retryAfter, true
+	}
+
+	return RetryBackoffDelay(time.Second, policy.maxDelay, attempt), true
+}
+
+// DoWithRateLimitRetry waits out 429 responses from an endpoint that has no
+// alternative, honouring Retry-After up to rateLimitMaxDelay.
+func DoWithRateLimitRetry(client *http.Client, req *http.Request) (*http.Response, error) {
+	return doWithRateLimitRetry(client, req, defaultRateLimitPolicy)
+}
+
+// DoWithFailoverRateLimitRetry is for requests made inside a mirror or
+// provider failover loop. It retries a 429 at most once and only after a
+// short wait; otherwise the 429 is returned so the loop moves on instead of
+// holding its service slot while one endpoint cools down.
+func DoWithFailoverRateLimitRetry(client *http.Client, req *http.Request) (*http.Response, error) {
+	return doWithRateLimitRetry(client, req, failoverRateLimitPolicy)
+}
+
+func doWithRateLimitRetry(client *http.Client, req *http.Request, policy rateLimitPolicy) (*http.Response, error) {
+	for attempt := 0; ; attempt++ {
+		resp, err := client.Do(req)
+		if err != nil || resp.StatusCode != http.StatusTooManyRequests || attempt >= policy.retries {
+			return resp, err
+		}
+		if req.Body != nil && req.GetBody == nil {
+			return resp, nil
+		}
+
+		delay, ok := rateLimitRetryDelay(resp, attempt, policy)
+		if !ok {
+			return resp, nil
+		}
+		discardResponseBody(resp)
+		fmt.Printf("Rate limited by %s, retrying in %s...\n", req.URL.Host, delay.Round(100*time.Millisecond))
+
+		select {
+		case <-time.After(delay):
+		case <-req.Context().Done():
+			return nil, req.Context().Err()
+		}
+
+		if req.GetBody != nil {
+			body, err := req.GetBody()
+			if err != nil {
+				return nil, err
+			}
+			req.Body = body
+		}
+	}
+}
@@ -59,9 +59,7 @@ type qobuzAvailabilityTrack struct {
 
 func NewSongLinkClient() *SongLinkClient {
 	return &SongLinkClient{
-		client: &http.Client{
-			Timeout: 30 * time.Second,
-		},
+		client: NewAPIHTTPClient(30 * time.Second),
 	}
 }
 
@@ -270,7 +268,7 @@ func getDeezerISRC(deezerURL string) (string, error) {
 
 	apiURL := fmt.Sprintf("https://api.deezer.com/track/%s", trackID)
 
-	client := &http.Client{Timeout: 10 * time.Second}
+	client := NewAPIHTTPClient(10 * time.Second)
 	resp, err := client.Get(apiURL)
 	if err != nil {
 		return "", fmt.Errorf("failed to call Deezer API: %w", err)
@@ -344,7 +342,12 @@ func (s *SongLinkClient) fetchSongLinkLinksByURL(rawURL string, region string) (
 	}
 	req.Header.Set("User-Agent", songLinkUserAgent)
 
-	resp, err := s.client.Do(req)
+	releaseSlot := AcquireServiceSlot("songlink")
+	defer releaseSlot()
+
+	// song.link is one of several link resolvers, so a 429 is handed back
+	// quickly for the resolver loop to fall through to the next provider.
+	resp, err := DoWithFailoverRateLimitRetry(s.client, req)
 	if err != nil {
 		return nil, fmt.Errorf("failed to call song.link: %w", err)
 	}
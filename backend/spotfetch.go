@@ -12,6 +12,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"sort"
@@ -19,6 +20,11 @@ import (
 
 var SpotifyError = errors.New("spotify error")
 
+var (
+	spotifyAppServerConfigPattern = regexp.MustCompile(`<script id="appServerConfig" type="text/plain">([^<]+)</script>`)
+	htmlTagPattern                = regexp.MustCompile(`(?s)<[^>]*>`)
+)
+
 type SpotifyClient struct {
 	client        *http.Client
 	accessToken   string
@@ -27,15 +33,89 @@ type SpotifyClient struct {
 	deviceID      string
 	clientVersion string
 	cookies       map[string]string
+
+	// sessionLock guards initialization, since a client may be shared by
+	// concurrent lookups. queryHeader holds the session-bound headers for
+	// Query, built once per Initialize and never mutated afterwards.
+	sessionLock sync.Mutex
+	queryHeader http.Header
 }
 
 func NewSpotifyClient() *SpotifyClient {
 	return &SpotifyClient{
-		client:  &http.Client{Timeout: 30 * time.Second},
+		client:  NewAPIHTTPClient(30 * time.Second),
 		cookies: make(map[string]string),
 	}
 }
 
+const spotifySessionReuseWindow = 10 * time.Minute
+
+var (
+	sharedSpotifySession     *SpotifyClient
+	sharedSpotifySessionAt   time.Time
+	sharedSpotifySessionInit *spotifySessionInit
+	sharedSpotifySessionLock sync.Mutex
+)
+
+// spotifySessionInit lets concurrent callers wait for one in-progress
+// Initialize instead of each starting their own.
+type spotifySessionInit struct {
+	done   chan struct{}
+	client *SpotifyClient
+	err    error
+}
+
+// errSpotifySessionRejected marks query failures caused by the session's
+// tokens (HTTP 401/403); only these warrant starting a new session.
+var errSpotifySessionRejected = errors.New("session rejected")
+
+// getSharedSpotifyClient returns an initialized client shared by per-track
+// lookups. Initializing costs three requests (web player page, access token,
+// client token), so it is only repeated once the session ages out or Spotify
+// rejects its tokens. The lock is not held while initializing.
+func getSharedSpotifyClient() (*SpotifyClient, error) {
+	sharedSpotifySessionLock.Lock()
+	if sharedSpotifySession != nil && time.Since(sharedSpotifySessionAt) < spotifySessionReuseWindow {
+		client := sharedSpotifySession
+		sharedSpotifySessionLock.Unlock()
+		return client, nil
+	}
+	if pending := sharedSpotifySessionInit; pending != nil {
+		sharedSpotifySessionLock.Unlock()
+		<-pending.done
+		return pending.client, pending.err
+	}
+	pending := &spotifySessionInit{done: make(chan struct{})}
+	sharedSpotifySessionInit = pending
+	sharedSpotifySessionLock.Unlock()
+
+	client := NewSpotifyClient()
+	if err := client.Initialize(); err != nil {
+		pending.err = err
+	} else {
+		pending.client = client
+	}
+
+	sharedSpotifySessionLock.Lock()
+	sharedSpotifySessionInit = nil
+	if pending.err == nil {
+		sharedSpotifySession = client
+		sharedSpotifySessionAt = time.Now()
+	}
+	sharedSpotifySessionLock.Unlock()
+	close(pending.done)
+
+	return pending.client, pending.err
+}
+
+func invalidateSharedSpotifyClient(client *SpotifyClient) {
+	sharedSpotifySessionLock.Lock()
+	if sharedSpotifySession == client {
+		sharedSpotifySession = nil
+	}
+	sharedSpotifySessionLock.Unlock()
+}
+
 func (c *SpotifyClient) generateTOTP() (string, int, error) {
 	return generateSpotifyTOTP(time.Now())
 }
@@ -117,10 +197,9 @@ func (c *SpotifyClient) getSessionInfo() error {
 		return err
 	}
 
-	re := regexp.MustCompile(`<script id="appServerConfig" type="text/plain">([^<]+)</script>`)
-	matches := re.FindStringSubmatch(string(body))
+	matches := spotifyAppServerConfigPattern.FindSubmatch(body)
 	if len(matches) > 1 {
-		decoded, err := base64.StdEncoding.DecodeString(matches[1])
+		decoded, err := base64.StdEncoding.DecodeString(string(matches[1]))
 		if err == nil {
 			var cfg map[string]interface{}
 			if json.Unmarshal(decoded, &cfg) == nil {
@@ -205,37 +284,90 @@ func (c *SpotifyClient) getClientToken() error {
 }
 
 func (c *SpotifyClient) Initialize() error {
+	c.sessionLock.Lock()
+	defer c.sessionLock.Unlock()
+	return c.initializeLocked()
+}
+
+func (c *SpotifyClient) initializeLocked() error {
 	if err := c.getSessionInfo(); err != nil {
 		return err
 	}
 	if err := c.getAccessToken(); err != nil {
 		return err
 	}
-	return c.getClientToken()
+	if err := c.getClientToken(); err != nil {
+		return err
+	}
+
+	header := make(http.Header, 5)
+	header.Set("Authorization", "Bearer "+c.accessToken)
+	header.Set("Client-Token", c.clientToken)
+	header.Set("Spotify-App-Version", c.clientVersion)
+	header.Set("Content-Type", "application/json")
+	header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36")
+	c.queryHeader = header
+	return nil
 }
 
-func (c *SpotifyClient) Query(payload map[string]interface{}) (map[string]interface{}, error) {
-	if c.accessToken == "" || c.clientToken == "" {
-		if err := c.Initialize(); err != nil {
+func (c *SpotifyClient) sessionQueryHeader() (http.Header, error) {
+	c.sessionLock.Lock()
+	defer c.sessionLock.Unlock()
+
+	if c.queryHeader == nil || c.accessToken == "" || c.clientToken == "" {
+		if err := c.initializeLocked(); err != nil {
 			return nil, err
 		}
 	}
+	return c.queryHeader, nil
+}
+
+type spotifyPersistedQuery struct {
+	Version    int    `json:"version"`
+	Sha256Hash string `json:"sha256Hash"`
+}
+
+type spotifyQueryExtensions struct {
+	PersistedQuery spotifyPersistedQuery `json:"persistedQuery"`
+}
+
+// spotifyQueryPayload is the request body for a persisted pathfinder query.
+// Only the variables vary per call; the fixed shell is a struct so it is
+// encoded directly instead of through nested maps whose keys are sorted on
+// every request.
+type spotifyQueryPayload struct {
+	Variables     map[string]interface{} `json:"variables"`
+	OperationName string                 `json:"operationName"`
+	Extensions    spotifyQueryExtensions `json:"extensions"`
+}
+
+func newSpotifyQuery(operationName, sha256Hash string, variables map[string]interface{}) spotifyQueryPayload {
+	return spotifyQueryPayload{
+		Variables:     variables,
+		OperationName: operationName,
+		Extensions: spotifyQueryExtensions{
+			PersistedQuery: spotifyPersistedQuery{Version: 1, Sha256Hash: sha256Hash},
+		},
+	}
+}
+
+func (c *SpotifyClient) Query(payload spotifyQueryPayload) (map[string]interface{}, error) {
+	header, err := c.sessionQueryHeader()
+	if err != nil {
+		return nil, err
+	}
 
 	jsonData, err := json.Marshal(payload)
 	if err != nil {
 		return nil, err
 	}
 
-	req, err := http.NewRequest("POST", "https://api-partner.spotify.com/pathfinder/v2/query", bytes.NewBuffer(jsonData))
+	req, err := http.NewRequest("POST", "https://api-partner.spotify.com/pathfinder/v2/query", bytes.NewReader(jsonData))
 	if err != nil {
 		return nil, err
 	}
 
-	req.Header.Set("Authorization", "Bearer "+c.accessToken)
-	req.Header.Set("Client-Token", c.clientToken)
-	req.Header.Set("Spotify-App-Version", c.clientVersion)
-	req.Header.Set("Content-Type", "application/json")
-	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36")
+	req.Header = header.Clone()
 
 	resp, err := c.client.Do(req)
 	if err != nil {
@@ -253,6 +385,9 @@ func (c *SpotifyClient) Query(payload map[string]interface{}) (map[string]interf
 		if len(errorText) > 200 {
 			errorText = errorText[:200]
 		}
+		if resp.StatusCode == http.StatusUnauthorized || resp.StatusCode == http.StatusForbidden {
+			return nil, fmt.Errorf("%w: %w: API query failed: HTTP %d | %s", SpotifyError, errSpotifySessionRejected, resp.StatusCode, errorText)
+		}
 		return nil, fmt.Errorf("%w: API query failed: HTTP %d | %s", SpotifyError, resp.StatusCode, errorText)
 	}
 
@@ -264,6 +399,15 @@ func (c *SpotifyClient) Query(payload map[string]interface{}) (map[string]interf
 	return result, nil
 }
 
+// spotifyURIID returns the segment after the last ':' of a Spotify URI such as
+// "spotify:track:<id>" without splitting the whole URI.
+func spotifyURIID(uri string) string {
+	if idx := strings.LastIndexByte(uri, ':'); idx >= 0 {
+		return uri[idx+1:]
+	}
+	return ""
+}
+
 func getString(m map[string]interface{}, key string) string {
 	if val, ok := m[key].(string); ok {
 		return val
@@ -631,10 +775,7 @@ func FilterTrack(data map[string]interface{}, separator string, albumFetchData .
 		albumID := getString(albumData, "id")
 		if albumID == "" {
 			albumURI := getString(albumData, "uri")
-			if strings.Contains(albumURI, ":") {
-				parts := strings.Split(albumURI, ":")
-				albumID = parts[len(parts)-1]
-			}
+			albumID = spotifyURIID(albumURI)
 		}
 
 		albumArtistsString := ""
@@ -843,14 +984,8 @@ func FilterAlbum(data map[string]interface{}, separator string) map[string]inter
 						continue
 					}
 					artistURI := getString(artistItemMap, "uri")
-					if artistURI != "" && strings.Contains(artistURI, ":") {
-						parts := strings.Split(artistURI, ":")
-						if len(parts) > 0 {
-							artistID := parts[len(parts)-1]
-							if artistID != "" {
-								artistIDs = append(artistIDs, artistID)
-							}
-						}
+					if artistID := spotifyURIID(artistURI); artistID != "" {
+						artistIDs = append(artistIDs, artistID)
 					}
 				}
 			}
@@ -861,11 +996,7 @@ func FilterAlbum(data map[string]interface{}, separator string) map[string]inter
 			trackArtistsString := strings.Join(trackArtistNames, separator)
 
 			trackURI := getString(track, "uri")
-			trackID := ""
-			if strings.Contains(trackURI, ":") {
-				parts := strings.Split(trackURI, ":")
-				trackID = parts[len(parts)-1]
-			}
+			trackID := spotifyURIID(trackURI)
 
 			contentRating := getMap(track, "contentRating")
 			isExplicit := getString(contentRating, "label") == "EXPLICIT"
@@ -897,11 +1028,7 @@ func FilterAlbum(data map[string]interface{}, separator string) map[string]inter
 	}
 
 	albumURI := getString(albumData, "uri")
-	albumID := ""
-	if strings.Contains(albumURI, ":") {
-		parts := strings.Split(albumURI, ":")
-		albumID = parts[len(parts)-1]
-	}
+	albumID := spotifyURIID(albumURI)
 
 	totalDiscs := 1
 	discsData := getMap(albumData, "discs")
@@ -1031,14 +1158,8 @@ func FilterPlaylist(data map[string]interface{}, separator string) map[string]in
 						continue
 					}
 					artistURI := getString(artistItemMap, "uri")
-					if artistURI != "" && strings.Contains(artistURI, ":") {
-						parts := strings.Split(artistURI, ":")
-						if len(parts) > 0 {
-							artistID := parts[len(parts)-1]
-							if artistID != "" {
-								artistIDs = append(artistIDs, artistID)
-							}
-						}
+					if artistID := spotifyURIID(artistURI); artistID != "" {
+						artistIDs = append(artistIDs, artistID)
 					}
 				}
 			}
@@ -1055,10 +1176,7 @@ func FilterPlaylist(data map[string]interface{}, separator string) map[string]in
 			trackURI := getString(trackData, "uri")
 			trackID := getString(trackData, "id")
 			if trackID == "" {
-				if strings.Contains(trackURI, ":") {
-					parts := strings.Split(trackURI, ":")
-					trackID = parts[len(parts)-1]
-				}
+				trackID = spotifyURIID(trackURI)
 			}
 
 			albumData := getMap(trackData, "albumOfTrack")
@@ -1070,10 +1188,7 @@ func FilterPlaylist(data map[string]interface{}, separator string) map[string]in
 			if len(albumData) > 0 {
 				albumName = getString(albumData, "name")
 				albumURI := getString(albumData, "uri")
-				if strings.Contains(albumURI, ":") {
-					parts := strings.Split(albumURI, ":")
-					albumID = parts[len(parts)-1]
-				}
+				albumID = spotifyURIID(albumURI)
 				coverObj := extractCoverImage(getMap(albumData, "coverArt"))
 				if coverObj != nil {
 
@@ -1140,11 +1255,7 @@ func FilterPlaylist(data map[string]interface{}, separator string) map[string]in
 	}
 
 	playlistURI := getString(playlistData, "uri")
-	playlistID := ""
-	if strings.Contains(playlistURI, ":") {
-		parts := strings.Split(playlistURI, ":")
-		playlistID = parts[len(parts)-1]
-	}
+	playlistID := spotifyURIID(playlistURI)
 
 	totalCount := getFloat64(content, "totalCount")
 	count := len(tracks)
@@ -1200,10 +1311,7 @@ func extractRelease(release map[string]interface{}) map[string]interface{} {
 	releaseID := getString(release, "id")
 	if releaseID == "" {
 		releaseURI := getString(release, "uri")
-		if strings.Contains(releaseURI, ":") {
-			parts := strings.Split(releaseURI, ":")
-			releaseID = parts[len(parts)-1]
-		}
+		releaseID = spotifyURIID(releaseURI)
 	}
 
 	var year interface{}
@@ -1262,8 +1370,7 @@ func extractDiscographyItems(itemsData map[string]interface{}) []map[string]inte
 }
 
 func stripHTMLTags(s string) string {
-	re := regexp.MustCompile(`(?s)<[^>]*>`)
-	return re.ReplaceAllString(s, "")
+	return htmlTagPattern.ReplaceAllString(s, "")
 }
 
 func FilterArtist(data map[string]interface{}, separator string) map[string]interface{} {
@@ -1375,11 +1482,7 @@ func FilterArtist(data map[string]interface{}, separator string) map[string]inte
 	}
 
 	artistURI := getString(artistData, "uri")
-	artistID := ""
-	if strings.Contains(artistURI, ":") {
-		parts := strings.Split(artistURI, ":")
-		artistID = parts[len(parts)-1]
-	}
+	artistID := spotifyURIID(artistURI)
 
 	filtered := map[string]interface{}{
 		"id":          artistID,
@@ -1449,10 +1552,7 @@ func FilterSearch(data map[string]interface{}, separator string) map[string]inte
 				albumURI := getString(albumData, "uri")
 				albumID := getString(albumData, "id")
 				if albumID == "" {
-					if strings.Contains(albumURI, ":") {
-						parts := strings.Split(albumURI, ":")
-						albumID = parts[len(parts)-1]
-					}
+					albumID = spotifyURIID(albumURI)
 				}
 				albumInfo = map[string]interface{}{
 					"name": getString(albumData, "name"),
@@ -1464,10 +1564,7 @@ func FilterSearch(data map[string]interface{}, separator string) map[string]inte
 			trackURI := getString(track, "uri")
 			trackID := getString(track, "id")
 			if trackID == "" {
-				if strings.Contains(trackURI, ":") {
-					parts := strings.Split(trackURI, ":")
-					trackID = parts[len(parts)-1]
-				}
+				trackID = spotifyURIID(trackURI)
 			}
 
 			coverObj := extractCoverImage(getMap(albumData, "coverArt"))
@@ -1541,10 +1638,7 @@ func FilterSearch(data map[string]interface{}, separator string) map[string]inte
 			albumURI := getString(album, "uri")
 			albumID := getString(album, "id")
 			if albumID == "" {
-				if strings.Contains(albumURI, ":") {
-					parts := strings.Split(albumURI, ":")
-					albumID = parts[len(parts)-1]
-				}
+				albumID = spotifyURIID(albumURI)
 			}
 
 			coverObj := extractCoverImage(getMap(album, "coverArt"))
@@ -1616,11 +1710,7 @@ func FilterSearch(data map[string]interface{}, separator string) map[string]inte
 			}
 
 			artistURI := getString(artist, "uri")
-			artistID := ""
-			if strings.Contains(artistURI, ":") {
-				parts := strings.Split(artistURI, ":")
-				artistID = parts[len(parts)-1]
-			}
+			artistID := spotifyURIID(artistURI)
 
 			coverObj := extractCoverImage(getMap(artist, "visualIdentity"))
 			if coverObj == nil {
@@ -1681,11 +1771,7 @@ func FilterSearch(data map[string]interface{}, separator string) map[string]inte
 			}
 
 			playlistURI := getString(playlist, "uri")
-			playlistID := ""
-			if strings.Contains(playlistURI, ":") {
-				parts := strings.Split(playlistURI, ":")
-				playlistID = parts[len(parts)-1]
-			}
+			playlistID := spotifyURIID(playlistURI)
 
 			playlistImages := getMap(playlist, "images")
 			if len(playlistImages) == 0 {
@@ -15,7 +15,9 @@ import (
 )
 
 var (
-	errInvalidSpotifyURL = errors.New("invalid or unsupported Spotify URL")
+	errInvalidSpotifyURL     = errors.New("invalid or unsupported Spotify URL")
+	spotifyPreviewURLPattern = regexp.MustCompile(`https://p\.scdn\.co/mp3-preview/[a-zA-Z0-9]+`)
+	artistSeparatorPattern   = regexp.MustCompile(`\s*[;,]\s*`)
 )
 
 type MetadataCallback func(data interface{})
@@ -27,7 +29,7 @@ type SpotifyMetadataClient struct {
 
 func NewSpotifyMetadataClient() *SpotifyMetadataClient {
 	return &SpotifyMetadataClient{
-		httpClient: &http.Client{Timeout: 30 * time.Second},
+		httpClient: NewAPIHTTPClient(30 * time.Second),
 		Separator:  ", ",
 	}
 }
@@ -418,26 +420,20 @@ func (c *SpotifyMetadataClient) processSpotifyData(ctx context.Context, raw inte
 }
 
 func (c *SpotifyMetadataClient) fetchTrack(ctx context.Context, trackID string) (*apiTrackResponse, error) {
-	client := NewSpotifyClient()
-	if err := client.Initialize(); err != nil {
+	client, err := getSharedSpotifyClient()
+	if err != nil {
 		return nil, fmt.Errorf("failed to initialize spotify client: %w", err)
 	}
 
-	payload := map[string]interface{}{
-		"variables": map[string]interface{}{
-			"uri": fmt.Sprintf("spotify:track:%s", trackID),
-		},
-		"operationName": "getTrack",
-		"extensions": map[string]interface{}{
-			"persistedQuery": map[string]interface{}{
-				"version":    1,
-				"sha256Hash": "612585ae06ba435ad26369870deaae23b5c8800a256cd8a57e08eddc25a37294",
-			},
-		},
-	}
+	payload := newSpotifyQuery("getTrack", "612585ae06ba435ad26369870deaae23b5c8800a256cd8a57e08eddc25a37294", map[string]interface{}{
+		"uri": fmt.Sprintf("spotify:track:%s", trackID),
+	})
 
 	data, err := client.Query(payload)
 	if err != nil {
+		if errors.Is(err, errSpotifySessionRejected) {
+			invalidateSharedSpotifyClient(client)
+		}
 		return nil, fmt.Errorf("failed to query track: %w", err)
 	}
 
@@ -449,12 +445,7 @@ func (c *SpotifyMetadataClient) fetchTrack(ctx context.Context, trackID string)
 				if id, ok := albumOfTrack["id"].(string); ok && id != "" {
 					albumID = id
 				} else if uri, ok := albumOfTrack["uri"].(string); ok && uri != "" {
-					if strings.Contains(uri, ":") {
-						parts := strings.Split(uri, ":")
-						if len(parts) > 0 {
-							albumID = parts[len(parts)-1]
-						}
-					}
+					albumID = spotifyURIID(uri)
 				}
 
 				if albumID != "" {
@@ -567,20 +558,11 @@ func collectTrackCreditNamesByRole(items []interface{}, role string) []string {
 func (c *SpotifyMetadataClient) fetchTrackComposerWithClient(ctx context.Context, client *SpotifyClient, trackID string) (string, error) {
 	_ = ctx
 
-	payload := map[string]interface{}{
-		"variables": map[string]interface{}{
-			"trackUri":           fmt.Sprintf("spotify:track:%s", trackID),
-			"contributorsLimit":  100,
-			"contributorsOffset": 0,
-		},
-		"operationName": "queryTrackCreditsModal",
-		"extensions": map[string]interface{}{
-			"persistedQuery": map[string]interface{}{
-				"version":    1,
-				"sha256Hash": "e2ca40d46cf1fde36562261ccec754f23fb31b561877252e9fe0d6834aabb84b",
-			},
-		},
-	}
+	payload := newSpotifyQuery("queryTrackCreditsModal", "e2ca40d46cf1fde36562261ccec754f23fb31b561877252e9fe0d6834aabb84b", map[string]interface{}{
+		"trackUri":           fmt.Sprintf("spotify:track:%s", trackID),
+		"contributorsLimit":  100,
+		"contributorsOffset": 0,
+	})
 
 	data, err := client.Query(payload)
 	if err != nil {
@@ -631,21 +613,12 @@ func (c *SpotifyMetadataClient) fetchAlbumWithClient(ctx context.Context, client
 	var data map[string]interface{}
 
 	for {
-		payload := map[string]interface{}{
-			"variables": map[string]interface{}{
-				"uri":    fmt.Sprintf("spotify:album:%s", albumID),
-				"locale": "",
-				"offset": offset,
-				"limit":  limit,
-			},
-			"operationName": "getAlbum",
-			"extensions": map[string]interface{}{
-				"persistedQuery": map[string]interface{}{
-					"version":    1,
-					"sha256Hash": "b9bfabef66ed756e5e13f68a942deb60bd4125ec1f1be8cc42769dc0259b4b10",
-				},
-			},
-		}
+		payload := newSpotifyQuery("getAlbum", "b9bfabef66ed756e5e13f68a942deb60bd4125ec1f1be8cc42769dc0259b4b10", map[string]interface{}{
+			"uri":    fmt.Sprintf("spotify:album:%s", albumID),
+			"locale": "",
+			"offset": offset,
+			"limit":  limit,
+		})
 
 		response, err := client.Query(payload)
 		if err != nil {
@@ -744,21 +717,12 @@ func (c *SpotifyMetadataClient) fetchPlaylist(ctx context.Context, playlistID st
 	var data map[string]interface{}
 
 	for {
-		payload := map[string]interface{}{
-			"variables": map[string]interface{}{
-				"uri":                       fmt.Sprintf("spotify:playlist:%s", playlistID),
-				"offset":                    offset,
-				"limit":                     limit,
-				"enableWatchFeedEntrypoint": false,
-			},
-			"operationName": "fetchPlaylist",
-			"extensions": map[string]interface{}{
-				"persistedQuery": map[string]interface{}{
-					"version":    1,
-					"sha256Hash": "bb67e0af06e8d6f52b531f97468ee4acd44cd0f82b988e15c2ea47b1148efc77",
-				},
-			},
-		}
+		payload := newSpotifyQuery("fetchPlaylist", "bb67e0af06e8d6f52b531f97468ee4acd44cd0f82b988e15c2ea47b1148efc77", map[string]interface{}{
+			"uri":                       fmt.Sprintf("spotify:playlist:%s", playlistID),
+			"offset":                    offset,
+			"limit":                     limit,
+			"enableWatchFeedEntrypoint": false,
+		})
 
 		response, err := client.Query(payload)
 		if err != nil {
@@ -839,19 +803,10 @@ func (c *SpotifyMetadataClient) fetchArtistDiscography(ctx context.Context, pars
 		return nil, fmt.Errorf("failed to initialize spotify client: %w", err)
 	}
 
-	overviewPayload := map[string]interface{}{
-		"variables": map[string]interface{}{
-			"uri":    fmt.Sprintf("spotify:artist:%s", parsed.ID),
-			"locale": "",
-		},
-		"operationName": "queryArtistOverview",
-		"extensions": map[string]interface{}{
-			"persistedQuery": map[string]interface{}{
-				"version":    1,
-				"sha256Hash": "446130b4a0aa6522a686aafccddb0ae849165b5e0436fd802f96e0243617b5d8",
-			},
-		},
-	}
+	overviewPayload := newSpotifyQuery("queryArtistOverview", "446130b4a0aa6522a686aafccddb0ae849165b5e0436fd802f96e0243617b5d8", map[string]interface{}{
+		"uri":    fmt.Sprintf("spotify:artist:%s", parsed.ID),
+		"locale": "",
+	})
 
 	data, err := client.Query(overviewPayload)
 	if err != nil {
@@ -874,21 +829,12 @@ func (c *SpotifyMetadataClient) fetchArtistDiscography(ctx context.Context, pars
 	var totalCount interface{}
 
 	for {
-		discographyPayload := map[string]interface{}{
-			"variables": map[string]interface{}{
-				"uri":    fmt.Sprintf("spotify:artist:%s", parsed.ID),
-				"offset": offset,
-				"limit":  limit,
-				"order":  "DATE_DESC",
-			},
-			"operationName": "queryArtistDiscographyAll",
-			"extensions": map[string]interface{}{
-				"persistedQuery": map[string]interface{}{
-					"version":    1,
-					"sha256Hash": "5e07d323febb57b4a56a42abbf781490e58764aa45feb6e3dc0591564fc56599",
-				},
-			},
-		}
+		discographyPayload := newSpotifyQuery("queryArtistDiscographyAll", "5e07d323febb57b4a56a42abbf781490e58764aa45feb6e3dc0591564fc56599", map[string]interface{}{
+			"uri":    fmt.Sprintf("spotify:artist:%s", parsed.ID),
+			"offset": offset,
+			"limit":  limit,
+			"order":  "DATE_DESC",
+		})
 
 		response, err := client.Query(discographyPayload)
 		if err != nil {
@@ -1089,6 +1035,28 @@ func (c *SpotifyMetadataClient) formatTrackData(raw *apiTrackResponse) TrackResp
 	}
 }
 
+const (
+	spotifyTrackURLPrefix  = "https://open.spotify.com/track/"
+	spotifyAlbumURLPrefix  = "https://open.spotify.com/album/"
+	spotifyArtistURLPrefix = "https://open.spotify.com/artist/"
+
+	discographyFetchConcurrency = 5
+)
+
+func spotifyArtistRefs(ids []string) (artistID, artistURL string, artistsData []ArtistSimple) {
+	artistsData = make([]ArtistSimple, len(ids))
+	for i, id := range ids {
+		artistsData[i] = ArtistSimple{
+			ID:          id,
+			ExternalURL: spotifyArtistURLPrefix + id,
+		}
+	}
+	if len(ids) > 0 {
+		artistID, artistURL = ids[0], artistsData[0].ExternalURL
+	}
+	return artistID, artistURL, artistsData
+}
+
 func (c *SpotifyMetadataClient) formatAlbumData(raw *apiAlbumResponse, callback MetadataCallback) (*AlbumResponsePayload, error) {
 	var artistID, artistURL string
 	for _, item := range raw.Tracks {
@@ -1122,7 +1090,8 @@ func (c *SpotifyMetadataClient) formatAlbumData(raw *apiAlbumResponse, callback
 		})
 	}
 
-	tracks := make([]AlbumTrackMetadata, 0, len(raw.Tracks))
+	tracks := make([]AlbumTrackMetadata, len(raw.Tracks))
+	albumURL := spotifyAlbumURLPrefix + raw.ID
 	for idx, item := range raw.Tracks {
 		durationMS := parseDuration(item.Duration)
 		trackNumber := idx + 1
@@ -1131,22 +1100,9 @@ func (c *SpotifyMetadataClient) formatAlbumData(raw *apiAlbumResponse, callback
 			trackUPC = strings.TrimSpace(raw.UPC)
 		}
 
-		var artistID, artistURL string
-		if len(item.ArtistIds) > 0 {
-			artistID = item.ArtistIds[0]
-			artistURL = fmt.Sprintf("https://open.spotify.com/artist/%s", artistID)
-		}
-
-		artistsData := make([]ArtistSimple, 0, len(item.ArtistIds))
-		for _, id := range item.ArtistIds {
-			artistsData = append(artistsData, ArtistSimple{
-				ID:          id,
-				Name:        "",
-				ExternalURL: fmt.Sprintf("https://open.spotify.com/artist/%s", id),
-			})
-		}
+		artistID, artistURL, artistsData := spotifyArtistRefs(item.ArtistIds)
 
-		tracks = append(tracks, AlbumTrackMetadata{
+		tracks[idx] = AlbumTrackMetadata{
 			SpotifyID:   item.ID,
 			Artists:     item.Artists,
 			Name:        item.Name,
@@ -1159,16 +1115,16 @@ func (c *SpotifyMetadataClient) formatAlbumData(raw *apiAlbumResponse, callback
 			TotalTracks: raw.Count,
 			DiscNumber:  item.DiscNumber,
 			TotalDiscs:  raw.Discs.TotalCount,
-			ExternalURL: fmt.Sprintf("https://open.spotify.com/track/%s", item.ID),
+			ExternalURL: spotifyTrackURLPrefix + item.ID,
 			AlbumID:     raw.ID,
-			AlbumURL:    fmt.Sprintf("https://open.spotify.com/album/%s", raw.ID),
+			AlbumURL:    albumURL,
 			ArtistID:    artistID,
 			ArtistURL:   artistURL,
 			ArtistsData: artistsData,
 			UPC:         trackUPC,
 			Plays:       item.Plays,
 			IsExplicit:  item.IsExplicit,
-		})
+		}
 	}
 
 	if callback != nil {
@@ -1198,26 +1154,13 @@ func (c *SpotifyMetadataClient) formatPlaylistData(raw *apiPlaylistResponse, cal
 		})
 	}
 
-	tracks := make([]AlbumTrackMetadata, 0, len(raw.Tracks))
-	for _, item := range raw.Tracks {
+	tracks := make([]AlbumTrackMetadata, len(raw.Tracks))
+	for idx, item := range raw.Tracks {
 		durationMS := parseDuration(item.Duration)
 
-		var artistID, artistURL string
-		if len(item.ArtistIds) > 0 {
-			artistID = item.ArtistIds[0]
-			artistURL = fmt.Sprintf("https://open.spotify.com/artist/%s", artistID)
-		}
-
-		artistsData := make([]ArtistSimple, 0, len(item.ArtistIds))
-		for _, id := range item.ArtistIds {
-			artistsData = append(artistsData, ArtistSimple{
-				ID:          id,
-				Name:        "",
-				ExternalURL: fmt.Sprintf("https://open.spotify.com/artist/%s", id),
-			})
-		}
+		artistID, artistURL, artistsData := spotifyArtistRefs(item.ArtistIds)
 
-		tracks = append(tracks, AlbumTrackMetadata{
+		tracks[idx] = AlbumTrackMetadata{
 			SpotifyID:   item.ID,
 			Artists:     item.Artist,
 			Name:        item.Title,
@@ -1230,9 +1173,9 @@ func (c *SpotifyMetadataClient) formatPlaylistData(raw *apiPlaylistResponse, cal
 			TotalTracks: 0,
 			DiscNumber:  item.DiscNumber,
 			TotalDiscs:  0,
-			ExternalURL: fmt.Sprintf("https://open.spotify.com/track/%s", item.ID),
+			ExternalURL: spotifyTrackURLPrefix + item.ID,
 			AlbumID:     item.AlbumID,
-			AlbumURL:    fmt.Sprintf("https://open.spotify.com/album/%s", item.AlbumID),
+			AlbumURL:    spotifyAlbumURLPrefix + item.AlbumID,
 			ArtistID:    artistID,
 			ArtistURL:   artistURL,
 			ArtistsData: artistsData,
@@ -1240,7 +1183,7 @@ func (c *SpotifyMetadataClient) formatPlaylistData(raw *apiPlaylistResponse, cal
 			Plays:       item.Plays,
 			Status:      item.Status,
 			IsExplicit:  item.IsExplicit,
-		})
+		}
 	}
 
 	if callback != nil {
@@ -1281,7 +1224,6 @@ func (c *SpotifyMetadataClient) formatArtistDiscographyData(ctx context.Context,
 	}
 
 	resultsChan := make(chan fetchResult, len(raw.Discography.All))
-	sem := make(chan struct{}, 5)
 
 	sharedClient := NewSpotifyClient()
 	if err := sharedClient.Initialize(); err != nil {
@@ -1309,76 +1251,71 @@ func (c *SpotifyMetadataClient) formatArtistDiscographyData(ctx context.Context,
 		})
 	}
 
-	for _, alb := range raw.Discography.All {
-		go func(albumID string, albumName string) {
-			sem <- struct{}{}
-
-			time.Sleep(100 * time.Millisecond)
-			defer func() { <-sem }()
+	fetchAlbumTracks := func(albumID string, albumName string) fetchResult {
+		select {
+		case <-ctx.Done():
+			return fetchResult{err: ctx.Err()}
+		case <-time.After(100 * time.Millisecond):
+		}
 
-			select {
-			case <-ctx.Done():
-				resultsChan <- fetchResult{err: ctx.Err()}
-				return
-			default:
-			}
+		albumData, err := c.fetchAlbumWithClient(ctx, sharedClient, albumID, nil)
+		if err != nil {
+			fmt.Printf("Error getting tracks for album %s: %v\n", albumName, err)
+			return fetchResult{tracks: []AlbumTrackMetadata{}}
+		}
 
-			albumData, err := c.fetchAlbumWithClient(ctx, sharedClient, albumID, nil)
-			if err != nil {
-				fmt.Printf("Error getting tracks for album %s: %v\n", albumName, err)
-				resultsChan <- fetchResult{tracks: []AlbumTrackMetadata{}}
-				return
+		tracks := make([]AlbumTrackMetadata, len(albumData.Tracks))
+		albumURL := spotifyAlbumURLPrefix + albumID
+		for idx, tr := range albumData.Tracks {
+			durationMS := parseDuration(tr.Duration)
+			trackNumber := idx + 1
+
+			artistID, artistURL, artistsData := spotifyArtistRefs(tr.ArtistIds)
+
+			tracks[idx] = AlbumTrackMetadata{
+				SpotifyID:   tr.ID,
+				Artists:     tr.Artists,
+				Name:        tr.Name,
+				AlbumName:   albumData.Name,
+				AlbumArtist: raw.Name,
+				AlbumType:   "album",
+				DurationMS:  durationMS,
+				Images:      albumData.Cover,
+				ReleaseDate: albumData.ReleaseDate,
+				TrackNumber: trackNumber,
+				TotalTracks: albumData.Count,
+				DiscNumber:  tr.DiscNumber,
+				UPC:         tr.UPC,
+				ExternalURL: spotifyTrackURLPrefix + tr.ID,
+				AlbumID:     albumID,
+				AlbumURL:    albumURL,
+				ArtistID:    artistID,
+				ArtistURL:   artistURL,
+				ArtistsData: artistsData,
+				Plays:       tr.Plays,
+				IsExplicit:  tr.IsExplicit,
 			}
+		}
+		if callback != nil {
+			callback(tracks)
+		}
+		return fetchResult{tracks: tracks}
+	}
 
-			tracks := make([]AlbumTrackMetadata, 0, len(albumData.Tracks))
-			for idx, tr := range albumData.Tracks {
-				durationMS := parseDuration(tr.Duration)
-				trackNumber := idx + 1
-
-				var artistID, artistURL string
-				if len(tr.ArtistIds) > 0 {
-					artistID = tr.ArtistIds[0]
-					artistURL = fmt.Sprintf("https://open.spotify.com/artist/%s", artistID)
-				}
-
-				artistsData := make([]ArtistSimple, 0, len(tr.ArtistIds))
-				for _, id := range tr.ArtistIds {
-					artistsData = append(artistsData, ArtistSimple{
-						ID:          id,
-						Name:        "",
-						ExternalURL: fmt.Sprintf("https://open.spotify.com/artist/%s", id),
-					})
-				}
+	albums := raw.Discography.All
+	jobs := make(chan int, len(albums))
+	for i := range albums {
+		jobs <- i
+	}
+	close(jobs)
 
-				tracks = append(tracks, AlbumTrackMetadata{
-					SpotifyID:   tr.ID,
-					Artists:     tr.Artists,
-					Name:        tr.Name,
-					AlbumName:   albumData.Name,
-					AlbumArtist: raw.Name,
-					AlbumType:   "album",
-					DurationMS:  durationMS,
-					Images:      albumData.Cover,
-					ReleaseDate: albumData.ReleaseDate,
-					TrackNumber: trackNumber,
-					TotalTracks: albumData.Count,
-					DiscNumber:  tr.DiscNumber,
-					UPC:         tr.UPC,
-					ExternalURL: fmt.Sprintf("https://open.spotify.com/track/%s", tr.ID),
-					AlbumID:     albumID,
-					AlbumURL:    fmt.Sprintf("https://open.spotify.com/album/%s", albumID),
-					ArtistID:    artistID,
-					ArtistURL:   artistURL,
-					ArtistsData: artistsData,
-					Plays:       tr.Plays,
-					IsExplicit:  tr.IsExplicit,
-				})
-			}
-			if callback != nil {
-				callback(tracks)
+	workerCount := min(discographyFetchConcurrency, len(albums))
+	for w := 0; w < workerCount; w++ {
+		go func() {
+			for i := range jobs {
+				resultsChan <- fetchAlbumTracks(albums[i].ID, albums[i].Name)
 			}
-			resultsChan <- fetchResult{tracks: tracks}
-		}(alb.ID, alb.Name)
+		}()
 	}
 
 	for i := 0; i < len(raw.Discography.All); i++ {
@@ -1498,7 +1435,7 @@ func parseArtistIDsFromString(artists string) []string {
 }
 
 func splitAndCleanArtists(artists string) []string {
-	raw := regexp.MustCompile(`\s*[;,]\s*`).Split(strings.TrimSpace(artists), -1)
+	raw := artistSeparatorPattern.Split(strings.TrimSpace(artists), -1)
 	parts := make([]string, 0, len(raw))
 	for _, part := range raw {
 		part = strings.TrimSpace(part)
@@ -1523,25 +1460,16 @@ func (c *SpotifyMetadataClient) Search(ctx context.Context, query string, limit
 		return nil, fmt.Errorf("failed to initialize spotify client: %w", err)
 	}
 
-	payload := map[string]interface{}{
-		"variables": map[string]interface{}{
-			"searchTerm":                    query,
-			"offset":                        0,
-			"limit":                         limit,
-			"numberOfTopResults":            5,
-			"includeAudiobooks":             true,
-			"includeArtistHasConcertsField": false,
-			"includePreReleases":            true,
-			"includeAuthors":                false,
-		},
-		"operationName": "searchDesktop",
-		"extensions": map[string]interface{}{
-			"persistedQuery": map[string]interface{}{
-				"version":    1,
-				"sha256Hash": "fcad5a3e0d5af727fb76966f06971c19cfa2275e6ff7671196753e008611873c",
-			},
-		},
-	}
+	payload := newSpotifyQuery("searchDesktop", "fcad5a3e0d5af727fb76966f06971c19cfa2275e6ff7671196753e008611873c", map[string]interface{}{
+		"searchTerm":                    query,
+		"offset":                        0,
+		"limit":                         limit,
+		"numberOfTopResults":            5,
+		"includeAudiobooks":             true,
+		"includeArtistHasConcertsField": false,
+		"includePreReleases":            true,
+		"includeAuthors":                false,
+	})
 
 	data, err := client.Query(payload)
 	if err != nil {
@@ -1575,7 +1503,7 @@ func (c *SpotifyMetadataClient) Search(ctx context.Context, query string, limit
 			Artists:     item.Artists,
 			AlbumName:   item.Album,
 			Images:      item.Cover,
-			ExternalURL: fmt.Sprintf("https://open.spotify.com/track/%s", item.ID),
+			ExternalURL: spotifyTrackURLPrefix + item.ID,
 			Duration:    parseDuration(item.Duration),
 			IsExplicit:  item.IsExplicit,
 		})
@@ -1640,25 +1568,16 @@ func (c *SpotifyMetadataClient) SearchByType(ctx context.Context, query string,
 		return nil, fmt.Errorf("failed to initialize spotify client: %w", err)
 	}
 
-	payload := map[string]interface{}{
-		"variables": map[string]interface{}{
-			"searchTerm":                    query,
-			"offset":                        offset,
-			"limit":                         limit,
-			"numberOfTopResults":            5,
-			"includeAudiobooks":             true,
-			"includeArtistHasConcertsField": false,
-			"includePreReleases":            true,
-			"includeAuthors":                false,
-		},
-		"operationName": "searchDesktop",
-		"extensions": map[string]interface{}{
-			"persistedQuery": map[string]interface{}{
-				"version":    1,
-				"sha256Hash": "fcad5a3e0d5af727fb76966f06971c19cfa2275e6ff7671196753e008611873c",
-			},
-		},
-	}
+	payload := newSpotifyQuery("searchDesktop", "fcad5a3e0d5af727fb76966f06971c19cfa2275e6ff7671196753e008611873c", map[string]interface{}{
+		"searchTerm":                    query,
+		"offset":                        offset,
+		"limit":                         limit,
+		"numberOfTopResults":            5,
+		"includeAudiobooks":             true,
+		"includeArtistHasConcertsField": false,
+		"includePreReleases":            true,
+		"includeAuthors":                false,
+	})
 
 	data, err := client.Query(payload)
 	if err != nil {
@@ -1689,7 +1608,7 @@ func (c *SpotifyMetadataClient) SearchByType(ctx context.Context, query string,
 				Artists:     item.Artists,
 				AlbumName:   item.Album,
 				Images:      item.Cover,
-				ExternalURL: fmt.Sprintf("https://open.spotify.com/track/%s", item.ID),
+				ExternalURL: spotifyTrackURLPrefix + item.ID,
 				Duration:    parseDuration(item.Duration),
 				IsExplicit:  item.IsExplicit,
 			})
@@ -1746,7 +1665,7 @@ func GetPreviewURL(trackID string) (string, error) {
 
 	embedURL := fmt.Sprintf("https://open.spotify.com/embed/track/%s", trackID)
 
-	client := &http.Client{Timeout: 15 * time.Second}
+	client := NewAPIHTTPClient(15 * time.Second)
 	resp, err := client.Get(embedURL)
 	if err != nil {
 		return "", fmt.Errorf("failed to fetch embed page: %w", err)
@@ -1762,13 +1681,10 @@ func GetPreviewURL(trackID string) (string, error) {
 		return "", fmt.Errorf("failed to read response body: %w", err)
 	}
 
-	html := string(body)
-	re := regexp.MustCompile(`https://p\.scdn\.co/mp3-preview/[a-zA-Z0-9]+`)
-	match := re.FindString(html)
-
-	if match == "" {
+	match := spotifyPreviewURLPattern.Find(body)
+	if match == nil {
 		return "", errors.New("preview URL not found")
 	}
 
-	return match, nil
+	return string(match), nil
 }
@@ -1,6 +1,7 @@
 package backend
 
 import (
+	"context"
 	"encoding/base64"
 	"encoding/json"
 	"encoding/xml"
@@ -15,11 +16,14 @@ import (
 	"time"
 )
 
+const tidalSegmentConcurrency = 4
+
 type TidalDownloader struct {
 	client     *http.Client
 	timeout    time.Duration
 	maxRetries int
 	apiURL     string
+	itemID     string
 }
 
 type TidalAPIResponse struct {
@@ -72,28 +76,30 @@ func getConfiguredTidalAPIAttemptList() ([]string, error) {
 	return result, err
 }
 
-func buildTidalOutputPath(outputDir, filenameFormat string, includeTrackNumber bool, position int, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate string, useAlbumTrackNumber bool, spotifyTrackNumber, spotifyDiscNumber int, isrcOverride string, useFirstArtistOnly bool) (string, bool, error) {
+func buildTidalOutputPath(outputDir, filenameFormat string, includeTrackNumber bool, position int, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate string, useAlbumTrackNumber bool, spotifyTrackNumber, spotifyDiscNumber int, isrcOverride string, useFirstArtistOnly bool) (string, int64, bool, error) {
 	if outputDir != "." {
 		if err := os.MkdirAll(outputDir, 0755); err != nil {
-			return "", false, fmt.Errorf("directory error: %w", err)
+			return "", 0, false, fmt.Errorf("directory error: %w", err)
 		}
 	}
 
-	artistNameForFile := sanitizeFilename(spotifyArtistName)
-	albumArtistForFile := sanitizeFilename(spotifyAlbumArtist)
+	filenameArtist := spotifyArtistName
+	filenameAlbumArtist := spotifyAlbumArtist
 	if useFirstArtistOnly {
-		artistNameForFile = sanitizeFilename(GetFirstArtist(spotifyArtistName))
-		albumArtistForFile = sanitizeFilename(GetFirstArtist(spotifyAlbumArtist))
+		filenameArtist = GetFirstArtist(spotifyArtistName)
+		filenameAlbumArtist = GetFirstArtist(spotifyAlbumArtist)
 	}
+	artistNameForFile := sanitizeFilename(filenameArtist)
+	albumArtistForFile := sanitizeFilename(filenameAlbumArtist)
 
 	trackTitleForFile := sanitizeFilename(spotifyTrackName)
 	albumTitleForFile := sanitizeFilename(spotifyAlbumName)
 
-	filename := buildTidalFilename(trackTitleForFile, artistNameForFile, albumTitleForFile, albumArtistForFile, spotifyReleaseDate, spotifyTrackNumber, spotifyDiscNumber, filenameFormat, includeTrackNumber, position, useAlbumTrackNumber, isrcOverride)
+	filename := buildTrackFilename(trackTitleForFile, artistNameForFile, albumTitleForFile, albumArtistForFile, spotifyReleaseDate, spotifyTrackNumber, spotifyDiscNumber, filenameFormat, includeTrackNumber, position, useAlbumTrackNumber, isrcOverride)
 	outputFilename := filepath.Join(outputDir, filename)
 
-	outputFilename, alreadyExists := ResolveOutputPathForDownload(outputFilename, GetRedownloadWithSuffixSetting())
-	return outputFilename, alreadyExists, nil
+	outputFilename, existingSize, alreadyExists := resolveOutputPathWithSize(outputFilename, GetRedownloadWithSuffixSetting())
+	return outputFilename, existingSize, alreadyExists, nil
 }
 
 func finalizeTidalDownload(outputFilename, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate string, spotifyCoverURL string, embedMaxQualityCover bool, spotifyTrackNumber, spotifyDiscNumber, spotifyTotalTracks, spotifyTotalDiscs int, spotifyCopyright, spotifyPublisher, spotifyComposer, metadataSeparator, isrcOverride, spotifyURL string, useSingleGenre bool, embedGenre bool) {
@@ -111,14 +117,11 @@ func finalizeTidalDownload(outputFilename, spotifyTrackName, spotifyArtistName,
 		go func() {
 			res := mbResult{}
 			var isrc string
-			parts := strings.Split(spotifyURL, "/")
-			if len(parts) > 0 {
-				sID := strings.Split(parts[len(parts)-1], "?")[0]
-				if sID != "" {
-					client := NewSongLinkClient()
-					if val, err := client.GetISRC(sID); err == nil {
-						isrc = val
-					}
+			sID, _, _ := strings.Cut(spotifyURL[strings.LastIndexByte(spotifyURL, '/')+1:], "?")
+			if sID != "" {
+				client := NewSongLinkClient()
+				if val, err := client.GetISRC(sID); err == nil {
+					isrc = val
 				}
 			}
 			res.ISRC = isrc
@@ -220,15 +223,19 @@ func NewTidalDownloader(apiURL string) *TidalDownloader {
 	}
 
 	return &TidalDownloader{
-		client: &http.Client{
-			Timeout: 5 * time.Second,
-		},
+		client:     NewDownloadHTTPClient(5 * time.Second),
 		timeout:    5 * time.Second,
 		maxRetries: 3,
 		apiURL:     apiURL,
 	}
 }
 
+// SetItemID ties the downloader's progress reporting to a download queue
+// item, so parallel downloads each report their own progress.
+func (t *TidalDownloader) SetItemID(itemID string) {
+	t.itemID = itemID
+}
+
 func (t *TidalDownloader) GetAvailableAPIs() ([]string, error) {
 	apis, err := getConfiguredTidalAPIAttemptList()
 	if err == nil && len(apis) > 0 {
@@ -285,7 +292,7 @@ func (t *TidalDownloader) GetDownloadURL(trackID int64, quality string) (string,
 		return "", fmt.Errorf("failed to create request: %w", err)
 	}
 
-	resp, err := t.client.Do(req)
+	resp, err := DoWithFailoverRateLimitRetry(t.client, req)
 	if err != nil {
 		fmt.Printf("✗ Tidal API request failed: %v\n", err)
 		return "", fmt.Errorf("failed to get download URL: %w", err)
@@ -347,7 +354,11 @@ func (t *TidalDownloader) DownloadFile(url, filepath string, quality string) err
 		return fmt.Errorf("failed to create request: %w", err)
 	}
 
-	resp, err := t.client.Do(req)
+	// t.client carries the short API deadline; the file itself is fetched
+	// without one and relies on the header timeout and the stall guard.
+	downloadClient := NewDownloadHTTPClient(0)
+
+	resp, err := downloadClient.Do(req)
 
 	if err != nil {
 		return fmt.Errorf("failed to download file: %w", err)
@@ -358,19 +369,12 @@ func (t *TidalDownloader) DownloadFile(url, filepath string, quality string) err
 		return fmt.Errorf("download failed with status %d", resp.StatusCode)
 	}
 
-	out, err := os.Create(filepath)
+	written, err := downloadToFile(filepath, resp.Body, resp.ContentLength, t.itemID)
 	if err != nil {
-		return fmt.Errorf("failed to create file: %w", err)
+		return err
 	}
-	defer out.Close()
 
-	pw := NewProgressWriter(out)
-	_, err = io.Copy(pw, resp.Body)
-	if err != nil {
-		return fmt.Errorf("failed to write file: %w", err)
-	}
-
-	fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(pw.GetTotal())/(1024*1024))
+	fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(written)/(1024*1024))
 
 	fmt.Println("Download complete")
 	return nil
@@ -388,22 +392,22 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 		return fmt.Errorf("requested %s quality but Tidal provided lossy format (%s). Aborting download", quality, mimeType)
 	}
 
-	client := &http.Client{
-		Timeout: 120 * time.Second,
-	}
+	// No overall deadline: large files can take minutes on slow links. The
+	// transport's header timeout and the body stall guard catch dead connections.
+	client := NewDownloadHTTPClient(0)
 
-	doRequest := func(url string) (*http.Response, error) {
+	doRequest := func(ctx context.Context, url string) (*http.Response, error) {
 		req, err := NewRequestWithDefaultHeaders(http.MethodGet, url, nil)
 		if err != nil {
 			return nil, err
 		}
-		return client.Do(req)
+		return client.Do(req.WithContext(ctx))
 	}
 
 	if directURL != "" && (strings.Contains(strings.ToLower(mimeType), "flac") || mimeType == "") {
 		fmt.Println("Downloading file...")
 
-		resp, err := doRequest(directURL)
+		resp, err := doRequest(context.Background(), directURL)
 		if err != nil {
 			return fmt.Errorf("failed to download file: %w", err)
 		}
@@ -413,19 +417,12 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 			return fmt.Errorf("download failed with status %d", resp.StatusCode)
 		}
 
-		out, err := os.Create(outputPath)
+		written, err := downloadToFile(outputPath, resp.Body, resp.ContentLength, t.itemID)
 		if err != nil {
-			return fmt.Errorf("failed to create file: %w", err)
+			return err
 		}
-		defer out.Close()
 
-		pw := NewProgressWriter(out)
-		_, err = io.Copy(pw, resp.Body)
-		if err != nil {
-			return fmt.Errorf("failed to write file: %w", err)
-		}
-
-		fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(pw.GetTotal())/(1024*1024))
+		fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(written)/(1024*1024))
 		fmt.Println("Download complete")
 		return nil
 	}
@@ -435,7 +432,7 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 	if directURL != "" {
 		fmt.Printf("Downloading non-FLAC file (%s)...\n", mimeType)
 
-		resp, err := doRequest(directURL)
+		resp, err := doRequest(context.Background(), directURL)
 		if err != nil {
 			return fmt.Errorf("failed to download file: %w", err)
 		}
@@ -445,21 +442,12 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 			return fmt.Errorf("download failed with status %d", resp.StatusCode)
 		}
 
-		out, err := os.Create(tempPath)
-		if err != nil {
-			return fmt.Errorf("failed to create temp file: %w", err)
-		}
-
-		pw := NewProgressWriter(out)
-		_, err = io.Copy(pw, resp.Body)
-		out.Close()
-
+		written, err := downloadToFile(tempPath, resp.Body, resp.ContentLength, t.itemID)
 		if err != nil {
-			os.Remove(tempPath)
-			return fmt.Errorf("failed to write temp file: %w", err)
+			return err
 		}
 
-		fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(pw.GetTotal())/(1024*1024))
+		fmt.Printf("\rDownloaded: %.2f MB (Complete)\n", float64(written)/(1024*1024))
 
 	} else {
 
@@ -471,7 +459,7 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 		}
 
 		fmt.Print("Downloading init segment... ")
-		resp, err := doRequest(initURL)
+		resp, err := doRequest(context.Background(), initURL)
 		if err != nil {
 			out.Close()
 			os.Remove(tempPath)
@@ -483,8 +471,9 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 			os.Remove(tempPath)
 			return fmt.Errorf("init segment download failed with status %d", resp.StatusCode)
 		}
-		_, err = io.Copy(out, resp.Body)
-		resp.Body.Close()
+		initBody := guardDownloadStall(resp.Body)
+		_, err = io.Copy(out, initBody)
+		initBody.Close()
 		if err != nil {
 			out.Close()
 			os.Remove(tempPath)
@@ -496,42 +485,47 @@ func (t *TidalDownloader) DownloadFromManifest(manifestB64, outputPath string, q
 		var totalBytes int64
 		lastTime := time.Now()
 		var lastBytes int64
-		for i, mediaURL := range mediaURLs {
-			resp, err := doRequest(mediaURL)
-			if err != nil {
+		var speedMBps float64
+		// Cancelling on return stops further segment requests and aborts the
+		// ones in flight when a segment fails.
+		segmentCtx, cancelSegments := context.WithCancel(context.Background())
+		defer cancelSegments()
+		segments, releaseSegment := fetchTidalSegments(segmentCtx, doRequest, mediaURLs)
+		for i := range mediaURLs {
+			segment := <-segments[i]
+			if segment.err != nil {
 				out.Close()
 				os.Remove(tempPath)
-				return fmt.Errorf("failed to download segment %d: %w", i+1, err)
+				return fmt.Errorf("failed to download segment %d: %w", i+1, segment.err)
 			}
-			if resp.StatusCode != 200 {
-				resp.Body.Close()
-				out.Close()
-				os.Remove(tempPath)
-				return fmt.Errorf("segment %d download failed with status %d", i+1, resp.StatusCode)
-			}
-			n, err := io.Copy(out, resp.Body)
-			totalBytes += n
-			resp.Body.Close()
+			n, err := out.Write(segment.data)
+			totalBytes += int64(n)
 			if err != nil {
 				out.Close()
 				os.Remove(tempPath)
 				return fmt.Errorf("failed to write segment %d: %w", i+1, err)
 			}
+			releaseSegment()
 
-			mbDownloaded := float64(totalBytes) / (1024 * 1024)
+			// Segments arrive in bursts from the parallel fetch, so only report
+			// progress at most every 100ms and once for the final segment.
 			now := time.Now()
 			timeDiff := now.Sub(lastTime).Seconds()
-			var speedMBps float64
+			if timeDiff <= 0.1 && i+1 < totalSegments {
+				continue
+			}
 			if timeDiff > 0.1 {
 				bytesDiff := float64(totalBytes - lastBytes)
 				speedMBps = (bytesDiff / (1024 * 1024)) / timeDiff
-				SetDownloadSpeed(speedMBps)
 				lastTime = now
 				lastBytes = totalBytes
 			}
-			SetDownloadProgress(mbDownloaded)
+			mbDownloaded := float64(totalBytes) / (1024 * 1024)
+			reportDownloadProgress(t.itemID, mbDownloaded, speedMBps)
 
-			fmt.Printf("\rDownloading: %.2f MB (%d/%d segments)", mbDownloaded, i+1, totalSegments)
+			if consoleIsTerminal {
+				fmt.Printf("\rDownloading: %.2f MB (%d/%d segments)", mbDownloaded, i+1, totalSegments)
+			}
 		}
 
 		out.Close()
@@ -579,12 +573,12 @@ func (t *TidalDownloader) DownloadByURL(tidalURL, outputDir, quality, filenameFo
 		return "", fmt.Errorf("no track ID found")
 	}
 
-	outputFilename, alreadyExists, err := buildTidalOutputPath(outputDir, filenameFormat, includeTrackNumber, position, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate, useAlbumTrackNumber, spotifyTrackNumber, spotifyDiscNumber, isrcOverride, useFirstArtistOnly)
+	outputFilename, existingSize, alreadyExists, err := buildTidalOutputPath(outputDir, filenameFormat, includeTrackNumber, position, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate, useAlbumTrackNumber, spotifyTrackNumber, spotifyDiscNumber, isrcOverride, useFirstArtistOnly)
 	if err != nil {
 		return "", err
 	}
 	if alreadyExists {
-		fmt.Printf("File already exists: %s (%.2f MB)\n", outputFilename, float64(mustFileSize(outputFilename))/(1024*1024))
+		fmt.Printf("File already exists: %s (%.2f MB)\n", outputFilename, float64(existingSize)/(1024*1024))
 		return "EXISTS:" + outputFilename, nil
 	}
 
@@ -631,12 +625,12 @@ func (t *TidalDownloader) DownloadByURLWithFallback(tidalURL, outputDir, quality
 		return "", fmt.Errorf("no track ID found")
 	}
 
-	outputFilename, alreadyExists, err := buildTidalOutputPath(outputDir, filenameFormat, includeTrackNumber, position, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate, useAlbumTrackNumber, spotifyTrackNumber, spotifyDiscNumber, isrcOverride, useFirstArtistOnly)
+	outputFilename, existingSize, alreadyExists, err := buildTidalOutputPath(outputDir, filenameFormat, includeTrackNumber, position, spotifyTrackName, spotifyArtistName, spotifyAlbumName, spotifyAlbumArtist, spotifyReleaseDate, useAlbumTrackNumber, spotifyTrackNumber, spotifyDiscNumber, isrcOverride, useFirstArtistOnly)
 	if err != nil {
 		return "", err
 	}
 	if alreadyExists {
-		fmt.Printf("File already exists: %s (%.2f MB)\n", outputFilename, float64(mustFileSize(outputFilename))/(1024*1024))
+		fmt.Printf("File already exists: %s (%.2f MB)\n", outputFilename, float64(existingSize)/(1024*1024))
 		return "EXISTS:" + outputFilename, nil
 	}
 
@@ -697,6 +691,61 @@ type MPD struct {
 	} `xml:"Period"`
 }
 
+var (
+	tidalManifestInitPattern    = regexp.MustCompile(`initialization="([^"]+)"`)
+	tidalManifestMediaPattern   = regexp.MustCompile(`media="([^"]+)"`)
+	tidalManifestSegmentPattern = regexp.MustCompile(`<S\s+[^>]*>`)
+	tidalManifestRepeatPattern  = regexp.MustCompile(`r="(\d+)"`)
+)
+
+type tidalSegment struct {
+	data []byte
+	err  error
+}
+
+// fetchTidalSegments downloads DASH media segments a few at a time instead of
+// one request after another. Results arrive on per-segment channels so the
+// caller can still write them in order; release must be called once each
+// segment has been written, which bounds how many are held in memory.
+// Cancelling ctx stops further requests and aborts those in flight.
+func fetchTidalSegments(ctx context.Context, doRequest func(context.Context, string) (*http.Response, error), mediaURLs []string) ([]chan tidalSegment, func()) {
+	results := make([]chan tidalSegment, len(mediaURLs))
+	for i := range results {
+		results[i] = make(chan tidalSegment, 1)
+	}
+
+	slots := make(chan struct{}, tidalSegmentConcurrency)
+	go func() {
+		for i, mediaURL := range mediaURLs {
+			select {
+			case slots <- struct{}{}:
+			case <-ctx.Done():
+				return
+			}
+			go func(result chan<- tidalSegment, mediaURL string) {
+				data, err := fetchTidalSegment(ctx, doRequest, mediaURL)
+				result <- tidalSegment{data: data, err: err}
+			}(results[i], mediaURL)
+		}
+	}()
+
+	return results, func() { <-slots }
+}
+
+func fetchTidalSegment(ctx context.Context, doRequest func(context.Context, string) (*http.Response, error), mediaURL string) ([]byte, error) {
+	resp, err := doRequest(ctx, mediaURL)
+	if err != nil {
+		return nil, err
+	}
+	body := guardDownloadStall(resp.Body)
+	defer body.Close()
+
+	if resp.StatusCode != 200 {
+		return nil, fmt.Errorf("download failed with status %d", resp.StatusCode)
+	}
+	return io.ReadAll(body)
+}
+
 func parseManifest(manifestB64 string) (directURL string, initURL string, mediaURLs []string, mimeType string, err error) {
 	manifestBytes, err := base64.StdEncoding.DecodeString(manifestB64)
 	if err != nil {
@@ -792,13 +841,10 @@ func parseManifest(manifestB64 string) (directURL string, initURL string, mediaU
 
 	fmt.Println("Using regex fallback for DASH manifest...")
 
-	initRe := regexp.MustCompile(`initialization="([^"]+)"`)
-	mediaRe := regexp.MustCompile(`media="([^"]+)"`)
-
-	if match := initRe.FindStringSubmatch(manifestStr); len(match) > 1 {
+	if match := tidalManifestInitPattern.FindStringSubmatch(manifestStr); len(match) > 1 {
 		initURL = match[1]
 	}
-	if match := mediaRe.FindStringSubmatch(manifestStr); len(match) > 1 {
+	if match := tidalManifestMediaPattern.FindStringSubmatch(manifestStr); len(match) > 1 {
 		mediaTemplate = match[1]
 	}
 
@@ -811,13 +857,11 @@ func parseManifest(manifestB64 string) (directURL string, initURL string, mediaU
 
 	segmentCount = 0
 
-	segTagRe := regexp.MustCompile(`<S\s+[^>]*>`)
-	matches := segTagRe.FindAllString(manifestStr, -1)
+	matches := tidalManifestSegmentPattern.FindAllString(manifestStr, -1)
 
 	for _, match := range matches {
 		repeat := 0
-		rRe := regexp.MustCompile(`r="(\d+)"`)
-		if rMatch := rRe.FindStringSubmatch(match); len(rMatch) > 1 {
+		if rMatch := tidalManifestRepeatPattern.FindStringSubmatch(match); len(rMatch) > 1 {
 			fmt.Sscanf(rMatch[1], "%d", &repeat)
 		}
 		segmentCount += repeat + 1
@@ -878,6 +922,7 @@ func (t *TidalDownloader) tryDownloadAcrossTidalAPIs(trackID int64, outputFilena
 		fmt.Printf("Trying Tidal API: %s\n", apiURL)
 
 		downloader := NewTidalDownloader(apiURL)
+		downloader.SetItemID(t.itemID)
 		downloadURL, err := downloader.GetDownloadURL(trackID, quality)
 		if err != nil {
 			lastErr = err
@@ -933,63 +978,3 @@ func isTidalHiResQuality(quality string) bool {
 	normalized := strings.TrimSpace(strings.ToUpper(quality))
 	return normalized == "HI_RES" || normalized == "HI_RES_LOSSLESS"
 }
-
-func buildTidalFilename(title, artist, album, albumArtist, releaseDate string, trackNumber, discNumber int, format string, includeTrackNumber bool, position int, useAlbumTrackNumber bool, extra ...string) string {
-	var filename string
-	isrc := ""
-	if len(extra) > 0 {
-		isrc = SanitizeOptionalFilename(extra[0])
-	}
-
-	numberToUse := position
-	if useAlbumTrackNumber && trackNumber > 0 {
-		numberToUse = trackNumber
-	}
-
-	year := ""
-	if len(releaseDate) >= 4 {
-		year = releaseDate[:4]
-	}
-
-	if strings.Contains(format, "{") {
-		filename = format
-		filename = strings.ReplaceAll(filename, "{title}", title)
-		filename = strings.ReplaceAll(filename, "{artist}", artist)
-		filename = strings.ReplaceAll(filename, "{album}", album)
-		filename = strings.ReplaceAll(filename, "{album_artist}", albumArtist)
-		filename = strings.ReplaceAll(filename, "{year}", year)
-		filename = strings.ReplaceAll(filename, "{date}", SanitizeFilename(releaseDate))
-		filename = strings.ReplaceAll(filename, "{isrc}", isrc)
-
-		if discNumber > 0 {
-			filename = strings.ReplaceAll(filename, "{disc}", fmt.Sprintf("%d", discNumber))
-		} else {
-			filename = strings.ReplaceAll(filename, "{disc}", "")
-		}
-
-		if numberToUse > 0 {
-			filename = strings.ReplaceAll(filename, "{track}", fmt.Sprintf("%02d", numberToUse))
-		} else {
-
-			filename = regexp.MustCompile(`\{track\}\.\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*-\s*`).ReplaceAllString(filename, "")
-			filename = regexp.MustCompile(`\{track\}\s*`).ReplaceAllString(filename, "")
-		}
-	} else {
-
-		switch format {
-		case "artist-title":
-			filename = fmt.Sprintf("%s - %s", artist, title)
-		case "title":
-			filename = title
-		default:
-			filename = fmt.Sprintf("%s - %s", title, artist)
-		}
-
-		if includeTrackNumber && position > 0 {
-			filename = fmt.Sprintf("%02d. %s", numberToUse, filename)
-		}
-	}
-
-	return filename + ".flac"
-}
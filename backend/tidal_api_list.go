@@ -15,6 +15,8 @@ import (
 const (
 	tidalAPIListGistURL   = "https://gist.githubusercontent.com/afkarxyz/2ce772b943321b9448b454f39403ce25/raw"
 	tidalAPIListCacheFile = "tidal-api-urls.json"
+
+	tidalAPIUsageSaveDelay = 2 * time.Second
 )
 
 type tidalAPIListCache struct {
@@ -25,8 +27,9 @@ type tidalAPIListCache struct {
 }
 
 var (
-	tidalAPIListMu    sync.Mutex
-	tidalAPIListState *tidalAPIListCache
+	tidalAPIListMu         sync.Mutex
+	tidalAPIListState      *tidalAPIListCache
+	tidalAPIUsageSaveTimer *time.Timer
 )
 
 func loadTidalAPIListStateLocked() (*tidalAPIListCache, error) {
@@ -114,7 +117,7 @@ func normalizeTidalAPIURLs(urls []string) []string {
 }
 
 func fetchTidalAPIURLsFromGist() ([]string, error) {
-	client := &http.Client{Timeout: 12 * time.Second}
+	client := NewAPIHTTPClient(12 * time.Second)
 	req, err := NewRequestWithDefaultHeaders(http.MethodGet, tidalAPIListGistURL, nil)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create tidal api gist request: %w", err)
@@ -171,6 +174,17 @@ func PrimeTidalAPIList() error {
 }
 
 func RefreshTidalAPIList(force bool) ([]string, error) {
+	if !force {
+		tidalAPIListMu.Lock()
+		state, err := loadTidalAPIListStateLocked()
+		tidalAPIListMu.Unlock()
+		if err == nil && len(state.URLs) > 0 {
+			return append([]string(nil), state.URLs...), nil
+		}
+	}
+
+	urls, fetchErr := fetchTidalAPIURLsFromGist()
+
 	tidalAPIListMu.Lock()
 	defer tidalAPIListMu.Unlock()
 
@@ -179,11 +193,6 @@ func RefreshTidalAPIList(force bool) ([]string, error) {
 		state = &tidalAPIListCache{}
 	}
 
-	if !force && len(state.URLs) > 0 {
-		return append([]string(nil), state.URLs...), nil
-	}
-
-	urls, fetchErr := fetchTidalAPIURLsFromGist()
 	if fetchErr != nil {
 		if len(state.URLs) > 0 {
 			return append([]string(nil), state.URLs...), fetchErr
@@ -248,12 +257,47 @@ func RememberTidalAPIUsage(apiURL string) error {
 		return err
 	}
 
-	state.LastUsedURL = strings.TrimRight(strings.TrimSpace(apiURL), "/")
+	apiURL = strings.TrimRight(strings.TrimSpace(apiURL), "/")
+	if state.LastUsedURL == apiURL && state.UpdatedAt != 0 {
+		return nil
+	}
+
+	state.LastUsedURL = apiURL
 	if state.UpdatedAt == 0 {
 		state.UpdatedAt = time.Now().Unix()
 	}
 
-	return saveTidalAPIListStateLocked(state)
+	// Rotation only reads the in-memory state, so a batch of downloads shares
+	// one deferred write instead of rewriting the cache file after every track.
+	tidalAPIListState = cloneTidalAPIListState(state)
+	if tidalAPIUsageSaveTimer == nil {
+		tidalAPIUsageSaveTimer = time.AfterFunc(tidalAPIUsageSaveDelay, flushTidalAPIUsage)
+	}
+	return nil
+}
+
+// FlushTidalAPIUsage writes a pending last-used API update immediately.
+func FlushTidalAPIUsage() {
+	tidalAPIListMu.Lock()
+	pending := tidalAPIUsageSaveTimer != nil && tidalAPIUsageSaveTimer.Stop()
+	tidalAPIListMu.Unlock()
+
+	if pending {
+		flushTidalAPIUsage()
+	}
+}
+
+func flushTidalAPIUsage() {
+	tidalAPIListMu.Lock()
+	defer tidalAPIListMu.Unlock()
+
+	tidalAPIUsageSaveTimer = nil
+	if tidalAPIListState == nil {
+		return
+	}
+	if err := saveTidalAPIListStateLocked(tidalAPIListState); err != nil {
+		fmt.Printf("Warning: failed to persist last used Tidal API: %v\n", err)
+	}
 }
 
 func rotateTidalAPIURLs(urls []string, lastUsedURL string) []string {
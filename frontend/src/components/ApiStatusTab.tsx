@@ -31,10 +31,17 @@ function renderPlatformIcon(type: string) {
     return <QobuzIcon className="w-5 h-5 shrink-0 text-muted-foreground"/>;
 }
 export function ApiStatusTab() {
-    const { sources, statuses, nextStatuses, checkingSources, checkOne } = useApiStatus();
+    const { sources, statuses, nextStatuses, checkingSources, checkOne, checkAll } = useApiStatus();
+    const isCheckingAny = sources.some((source) => checkingSources[source.id] === true);
     return (<div className="space-y-6">
       <div className="space-y-4">
-        <h3 className="text-sm font-semibold tracking-tight">SpotiFLAC Services</h3>
+        <div className="flex items-center justify-between gap-3">
+          <h3 className="text-sm font-semibold tracking-tight">SpotiFLAC Services</h3>
+          <Button variant="outline" size="sm" onClick={() => void checkAll()} disabled={isCheckingAny} className="gap-2">
+            {isCheckingAny ? <Loader2 className="h-4 w-4 animate-spin"/> : <SearchCheck className="h-4 w-4"/>}
+            Check All
+          </Button>
+        </div>
 
         <div className="grid grid-cols-1 gap-4 sm:grid-cols-2 lg:grid-cols-4">
           {sources.map((source) => {
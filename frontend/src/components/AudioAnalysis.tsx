@@ -3,6 +3,7 @@ import { Spinner } from "@/components/ui/spinner";
 import { Button } from "@/components/ui/button";
 import { Activity } from "lucide-react";
 import type { AnalysisResult } from "@/types/api";
+import { formatDurationSeconds } from "@/lib/utils";
 interface AudioAnalysisProps {
     result: AnalysisResult | null;
     analyzing: boolean;
@@ -43,11 +44,6 @@ export function AudioAnalysis({ result, analyzing, onAnalyze, showAnalyzeButton
     if (!result) {
         return null;
     }
-    const formatDuration = (seconds: number) => {
-        const mins = Math.floor(seconds / 60);
-        const secs = Math.floor(seconds % 60);
-        return `${mins}:${secs.toString().padStart(2, "0")}`;
-    };
     const formatNumber = (num: number) => {
         return num.toFixed(2);
     };
@@ -94,7 +90,7 @@ export function AudioAnalysis({ result, analyzing, onAnalyze, showAnalyzeButton
                             </li>
                             <li className="flex justify-between">
                                 <span className="text-muted-foreground">Duration:</span>
-                                <span className="font-medium font-mono">{formatDuration(result.duration)}</span>
+                                <span className="font-medium font-mono">{formatDurationSeconds(result.duration)}</span>
                             </li>
                             {result.file_size > 0 && (<li className="flex justify-between">
                                     <span className="text-muted-foreground">Size:</span>
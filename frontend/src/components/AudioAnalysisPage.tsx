@@ -1,4 +1,4 @@
-import { useState, useCallback, useRef, useEffect, type ChangeEvent, type CSSProperties, type DragEvent } from "react";
+import { useState, useCallback, useMemo, useRef, useEffect, type ChangeEvent, type CSSProperties, type DragEvent } from "react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuTrigger } from "@/components/ui/dropdown-menu";
@@ -11,8 +11,10 @@ import { useAudioAnalysis } from "@/hooks/useAudioAnalysis";
 import type { AnalysisResult } from "@/types/api";
 import { loadAudioAnalysisPreferences } from "@/lib/audio-analysis-preferences";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
+import { formatDurationSeconds } from "@/lib/utils";
 import { GetFileSizes, ListAudioFilesInDir, SaveSpectrumImage, SelectAudioFiles, SelectFolder } from "../../wailsjs/go/main/App";
 import { OnFileDrop, OnFileDropOff } from "../../wailsjs/runtime/runtime";
+const DROP_TARGET_STYLE = { "--wails-drop-target": "drop" } as CSSProperties;
 interface AudioAnalysisPageProps {
     onBack?: () => void;
 }
@@ -99,17 +101,12 @@ function formatFileSize(bytes: number): string {
     const index = Math.min(sizes.length - 1, Math.floor(Math.log(bytes) / Math.log(k)));
     return `${parseFloat((bytes / Math.pow(k, index)).toFixed(1))} ${sizes[index]}`;
 }
-function formatDuration(seconds: number): string {
-    const mins = Math.floor(seconds / 60);
-    const secs = Math.floor(seconds % 60);
-    return `${mins}:${secs.toString().padStart(2, "0")}`;
-}
 function itemMetaLine(item: BatchAnalysisItem): string {
     if (item.result) {
         const parts = [
             item.result.file_type ?? "Audio",
             `${(item.result.sample_rate / 1000).toFixed(1)} kHz`,
-            formatDuration(item.result.duration),
+            formatDurationSeconds(item.result.duration),
         ];
         if (typeof item.result.bitrate_kbps === "number" && item.result.bitrate_kbps > 0) {
             parts.push(`${item.result.bitrate_kbps} kbps`);
@@ -164,9 +161,9 @@ export function AudioAnalysisPage({ onBack }: AudioAnalysisPageProps) {
         activeItemIdRef.current = nextId;
         setActiveItemId(nextId);
     }, []);
-    const activeItem = items.find((item) => item.id === activeItemId) ?? null;
-    const successItems = items.filter((item) => item.status === "success" && item.result?.spectrum);
-    const pendingItems = items.filter((item) => item.status === "pending");
+    const activeItem = useMemo(() => items.find((item) => item.id === activeItemId) ?? null, [items, activeItemId]);
+    const successItems = useMemo(() => items.filter((item) => item.status === "success" && item.result?.spectrum), [items]);
+    const pendingItems = useMemo(() => items.filter((item) => item.status === "pending"), [items]);
     const isSingleMode = items.length === 1;
     const isBatchMode = items.length > 1;
     const canResumeBatch = isBatchMode && !isBatchRunning && pendingItems.length > 0;
@@ -763,7 +760,7 @@ export function AudioAnalysisPage({ onBack }: AudioAnalysisPageProps) {
             }} onDragLeave={(event) => {
                 event.preventDefault();
                 setIsDragging(false);
-            }} onDrop={handleHtmlDrop} style={{ "--wails-drop-target": "drop" } as CSSProperties}>
+            }} onDrop={handleHtmlDrop} style={DROP_TARGET_STYLE}>
                     <div className="mb-4 flex h-16 w-16 items-center justify-center rounded-full bg-muted">
                         <Upload className="h-8 w-8 text-primary"/>
                     </div>
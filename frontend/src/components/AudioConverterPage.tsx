@@ -7,6 +7,7 @@ import { Spinner } from "@/components/ui/spinner";
 import { ConvertAudio, SelectAudioFiles, SelectFolder, ListAudioFilesInDir, } from "../../wailsjs/go/main/App";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
 import { OnFileDrop, OnFileDropOff } from "../../wailsjs/runtime/runtime";
+const DROP_TARGET_STYLE = { "--wails-drop-target": "drop" } as React.CSSProperties;
 interface AudioFile {
     path: string;
     name: string;
@@ -344,7 +345,7 @@ export function AudioConverterPage() {
         }} onDrop={(e) => {
             e.preventDefault();
             setIsDragging(false);
-        }} style={{ "--wails-drop-target": "drop" } as React.CSSProperties}>
+        }} style={DROP_TARGET_STYLE}>
             {files.length === 0 ? (<>
                 <div className="mb-4 flex h-16 w-16 items-center justify-center rounded-full bg-muted">
                     <Upload className="h-8 w-8 text-primary"/>
@@ -8,6 +8,7 @@ import { SelectAudioFiles, SelectFolder, ListAudioFilesInDir, ResampleAudio } fr
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
 import { OnFileDrop, OnFileDropOff } from "../../wailsjs/runtime/runtime";
 import { AudioLinesIcon } from "@/components/ui/audio-lines";
+const DROP_TARGET_STYLE = { "--wails-drop-target": "drop" } as React.CSSProperties;
 interface AudioFile {
     path: string;
     name: string;
@@ -356,7 +357,7 @@ export function AudioResamplerPage() {
         }} onDrop={(e) => {
             e.preventDefault();
             setIsDragging(false);
-        }} style={{ "--wails-drop-target": "drop" } as React.CSSProperties}>
+        }} style={DROP_TARGET_STYLE}>
             {files.length === 0 ? (<>
                 <div className="mb-4 flex h-16 w-16 items-center justify-center rounded-full bg-muted">
                     <Upload className="h-8 w-8 text-primary"/>
@@ -1,4 +1,4 @@
-import { useState, useEffect, useRef } from "react";
+import { useState, useEffect, useLayoutEffect, useRef, memo } from "react";
 import { Trash2, Copy, Check, FileDown } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { logger, type LogEntry } from "@/lib/logger";
@@ -12,25 +12,36 @@ const levelColors: Record<string, string> = {
     error: "text-red-500",
     debug: "text-gray-500",
 };
+const timeFormatter = new Intl.DateTimeFormat("en-US", {
+    hour12: false,
+    hour: "2-digit",
+    minute: "2-digit",
+    second: "2-digit",
+});
+const FOLLOW_TAIL_THRESHOLD_PX = 16;
 function formatTime(date: Date): string {
-    return date.toLocaleTimeString("en-US", {
-        hour12: false,
-        hour: "2-digit",
-        minute: "2-digit",
-        second: "2-digit",
-    });
+    return timeFormatter.format(date);
 }
+const LogLine = memo(function LogLine({ log }: {
+    log: LogEntry;
+}) {
+    return (<div className="flex gap-2 py-0.5 [content-visibility:auto] [contain-intrinsic-size:auto_1.25rem]">
+      <span className="text-muted-foreground shrink-0">
+        [{formatTime(log.timestamp)}]
+      </span>
+      <span className={`shrink-0 w-16 ${levelColors[log.level]}`}>
+        [{log.level}]
+      </span>
+      <span className="break-all">{log.message}</span>
+    </div>);
+});
 export function DebugLoggerPage() {
     const [logs, setLogs] = useState<LogEntry[]>([]);
     const [copied, setCopied] = useState(false);
     const scrollRef = useRef<HTMLDivElement>(null);
+    const followTailRef = useRef(true);
     const queueInfo = useDownloadQueueData();
-    const hasDownloadActivity = queueInfo.queue.length > 0 ||
-        queueInfo.queued_count > 0 ||
-        queueInfo.completed_count > 0 ||
-        queueInfo.failed_count > 0 ||
-        queueInfo.skipped_count > 0;
-    const canExportFailed = hasDownloadActivity && queueInfo.failed_count > 0;
+    const canExportFailed = queueInfo.failed_count > 0;
     useEffect(() => {
         const unsubscribe = logger.subscribe(() => {
             setLogs(logger.getLogs());
@@ -40,11 +51,18 @@ export function DebugLoggerPage() {
             unsubscribe();
         };
     }, []);
-    useEffect(() => {
-        if (scrollRef.current) {
-            scrollRef.current.scrollTop = scrollRef.current.scrollHeight;
+    useLayoutEffect(() => {
+        const container = scrollRef.current;
+        if (container && followTailRef.current) {
+            container.scrollTop = container.scrollHeight;
         }
     }, [logs]);
+    const handleScroll = () => {
+        const container = scrollRef.current;
+        if (container) {
+            followTailRef.current = container.scrollHeight - container.scrollTop - container.clientHeight <= FOLLOW_TAIL_THRESHOLD_PX;
+        }
+    };
     const handleClear = () => {
         logger.clear();
     };
@@ -98,16 +116,8 @@ export function DebugLoggerPage() {
         </div>
       </div>
 
-      <div ref={scrollRef} className="h-[calc(100vh-220px)] overflow-y-auto bg-muted/50 rounded-lg p-4 font-mono text-xs">
-        {logs.length === 0 ? (<p className="text-muted-foreground lowercase">no logs yet...</p>) : (logs.map((log, i) => (<div key={i} className="flex gap-2 py-0.5">
-              <span className="text-muted-foreground shrink-0">
-                [{formatTime(log.timestamp)}]
-              </span>
-              <span className={`shrink-0 w-16 ${levelColors[log.level]}`}>
-                [{log.level}]
-              </span>
-              <span className="break-all">{log.message}</span>
-            </div>)))}
+      <div ref={scrollRef} onScroll={handleScroll} className="h-[calc(100vh-220px)] overflow-y-auto bg-muted/50 rounded-lg p-4 font-mono text-xs">
+        {logs.length === 0 ? (<p className="text-muted-foreground lowercase">no logs yet...</p>) : (logs.map((log) => <LogLine key={log.id} log={log}/>))}
       </div>
     </div>);
 }
@@ -8,7 +8,7 @@ interface DownloadProgressToastProps {
 export function DownloadProgressToast({ onClick }: DownloadProgressToastProps) {
     const progress = useDownloadProgress();
     const queueInfo = useDownloadQueueData();
-    const hasActiveDownloads = queueInfo.queue.some(item => item.status === "queued" || item.status === "downloading");
+    const hasActiveDownloads = queueInfo.queued_count > 0 || queueInfo.downloading_count > 0;
     if (!hasActiveDownloads) {
         return null;
     }
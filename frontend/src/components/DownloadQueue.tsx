@@ -1,48 +1,103 @@
 import { useEffect, useState } from "react";
-import { X, Download, CheckCircle2, XCircle, Clock, FileCheck, Trash2, HardDrive, Zap, Timer, FileDown } from "lucide-react";
+import { X, Download, CheckCircle2, XCircle, Clock, FileCheck, Trash2, HardDrive, Zap, Timer, Hourglass, FileDown } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, } from "@/components/ui/dialog";
 import { Badge } from "@/components/ui/badge";
-import { GetDownloadQueue, ClearCompletedDownloads, ClearAllDownloads, ExportFailedDownloads } from "../../wailsjs/go/main/App";
+import { ClearCompletedDownloads, ClearAllDownloads, ExportFailedDownloads } from "../../wailsjs/go/main/App";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
-import { backend } from "../../wailsjs/go/models";
-interface DownloadQueueProps {
-    isOpen: boolean;
-    onClose: () => void;
+import { useDownloadQueueItems } from "@/hooks/useDownloadQueueData";
+function formatSessionDuration(durationSeconds: number): string {
+    const hours = Math.floor(durationSeconds / 3600);
+    const minutes = Math.floor((durationSeconds % 3600) / 60);
+    const seconds = durationSeconds % 60;
+    if (hours > 0) {
+        return `${hours}h ${minutes}m ${seconds}s`;
+    }
+    else if (minutes > 0) {
+        return `${minutes}m ${seconds}s`;
+    }
+    else {
+        return `${seconds}s`;
+    }
 }
-export function DownloadQueue({ isOpen, onClose }: DownloadQueueProps) {
-    const [queueInfo, setQueueInfo] = useState<backend.DownloadQueueInfo>(new backend.DownloadQueueInfo({
-        is_downloading: false,
-        queue: [],
-        current_speed: 0,
-        total_downloaded: 0,
-        session_start_time: 0,
-        queued_count: 0,
-        completed_count: 0,
-        failed_count: 0,
-        skipped_count: 0,
-    }));
+function SessionElapsed({ active, elapsedSeconds }: {
+    active: boolean;
+    elapsedSeconds: number;
+}) {
+    const [displaySeconds, setDisplaySeconds] = useState(elapsedSeconds);
     useEffect(() => {
-        if (!isOpen)
+        if (!active)
             return;
-        const fetchQueue = async () => {
-            try {
-                const info = await GetDownloadQueue();
-                setQueueInfo(info);
-            }
-            catch (error) {
-                console.error("Failed to get download queue:", error);
+        const anchor = performance.now();
+        let timeoutId = 0;
+        const tick = () => {
+            window.clearTimeout(timeoutId);
+            timeoutId = 0;
+            const sinceAnchor = performance.now() - anchor;
+            setDisplaySeconds(elapsedSeconds + Math.floor(sinceAnchor / 1000));
+            if (document.visibilityState === "hidden") {
+                return;
             }
+            timeoutId = window.setTimeout(tick, 1000 - (sinceAnchor % 1000));
+        };
+        tick();
+        document.addEventListener("visibilitychange", tick);
+        return () => {
+            window.clearTimeout(timeoutId);
+            document.removeEventListener("visibilitychange", tick);
         };
-        fetchQueue();
-        const interval = setInterval(fetchQueue, 500);
-        return () => clearInterval(interval);
-    }, [isOpen]);
+    }, [active, elapsedSeconds]);
+    if (!active)
+        return <>—</>;
+    return <>{formatSessionDuration(displaySeconds)}</>;
+}
+const STATUS_BADGE_VARIANTS: Record<string, "default" | "secondary" | "destructive" | "outline"> = {
+    downloading: "default",
+    completed: "outline",
+    failed: "destructive",
+    skipped: "secondary",
+    queued: "outline",
+};
+const FILTER_CHIP_CLASS = "flex items-center gap-1.5 cursor-pointer hover:opacity-80 transition-all select-none";
+const FILTER_CHIP_ACTIVE_CLASSES: Record<string, string> = {
+    queued: `${FILTER_CHIP_CLASS} bg-secondary px-2 py-0.5 rounded-md ring-1 ring-border`,
+    completed: `${FILTER_CHIP_CLASS} bg-green-500/10 px-2 py-0.5 rounded-md ring-1 ring-green-500/20`,
+    skipped: `${FILTER_CHIP_CLASS} bg-yellow-500/10 px-2 py-0.5 rounded-md ring-1 ring-yellow-500/20`,
+    failed: `${FILTER_CHIP_CLASS} bg-red-500/10 px-2 py-0.5 rounded-md ring-1 ring-red-500/20`,
+};
+function getFilterChipClass(status: string, filterStatus: string): string {
+    return filterStatus === status ? FILTER_CHIP_ACTIVE_CLASSES[status] : FILTER_CHIP_CLASS;
+}
+function getStatusIcon(status: string) {
+    switch (status) {
+        case "downloading":
+            return <Download className="h-4 w-4 text-blue-500 animate-bounce"/>;
+        case "completed":
+            return <CheckCircle2 className="h-4 w-4 text-green-500"/>;
+        case "failed":
+            return <XCircle className="h-4 w-4 text-red-500"/>;
+        case "skipped":
+            return <FileCheck className="h-4 w-4 text-yellow-500"/>;
+        case "queued":
+            return <Clock className="h-4 w-4 text-muted-foreground"/>;
+        default:
+            return null;
+    }
+}
+function getStatusBadge(status: string) {
+    return (<Badge variant={STATUS_BADGE_VARIANTS[status] || "outline"} className="text-xs">
+      {status}
+    </Badge>);
+}
+interface DownloadQueueProps {
+    isOpen: boolean;
+    onClose: () => void;
+}
+export function DownloadQueue({ isOpen, onClose }: DownloadQueueProps) {
+    const queueInfo = useDownloadQueueItems(isOpen);
     const handleClearHistory = async () => {
         try {
             await ClearCompletedDownloads();
-            const info = await GetDownloadQueue();
-            setQueueInfo(info);
         }
         catch (error) {
             console.error("Failed to clear history:", error);
@@ -51,8 +106,6 @@ export function DownloadQueue({ isOpen, onClose }: DownloadQueueProps) {
     const handleReset = async () => {
         try {
             await ClearAllDownloads();
-            const info = await GetDownloadQueue();
-            setQueueInfo(info);
             toast.success("Download queue reset");
         }
         catch (error) {
@@ -74,52 +127,6 @@ export function DownloadQueue({ isOpen, onClose }: DownloadQueueProps) {
             toast.error(`Failed to export: ${error}`);
         }
     };
-    const getStatusIcon = (status: string) => {
-        switch (status) {
-            case "downloading":
-                return <Download className="h-4 w-4 text-blue-500 animate-bounce"/>;
-            case "completed":
-                return <CheckCircle2 className="h-4 w-4 text-green-500"/>;
-            case "failed":
-                return <XCircle className="h-4 w-4 text-red-500"/>;
-            case "skipped":
-                return <FileCheck className="h-4 w-4 text-yellow-500"/>;
-            case "queued":
-                return <Clock className="h-4 w-4 text-muted-foreground"/>;
-            default:
-                return null;
-        }
-    };
-    const getStatusBadge = (status: string) => {
-        const variants: Record<string, "default" | "secondary" | "destructive" | "outline"> = {
-            downloading: "default",
-            completed: "outline",
-            failed: "destructive",
-            skipped: "secondary",
-            queued: "outline",
-        };
-        return (<Badge variant={variants[status] || "outline"} className="text-xs">
-      {status}
-    </Badge>);
-    };
-    const formatDuration = (startTimestamp: number) => {
-        if (startTimestamp === 0)
-            return "—";
-        const now = Math.floor(Date.now() / 1000);
-        const durationSeconds = now - startTimestamp;
-        const hours = Math.floor(durationSeconds / 3600);
-        const minutes = Math.floor((durationSeconds % 3600) / 60);
-        const seconds = durationSeconds % 60;
-        if (hours > 0) {
-            return `${hours}h ${minutes}m ${seconds}s`;
-        }
-        else if (minutes > 0) {
-            return `${minutes}m ${seconds}s`;
-        }
-        else {
-            return `${seconds}s`;
-        }
-    };
     const [filterStatus, setFilterStatus] = useState<string>("all");
     const toggleFilter = (status: string) => {
         setFilterStatus(prev => prev === status ? "all" : status);
@@ -151,22 +158,22 @@ export function DownloadQueue({ isOpen, onClose }: DownloadQueueProps) {
 
 
         <div className="flex items-center gap-4 text-sm">
-          <div className={`flex items-center gap-1.5 cursor-pointer hover:opacity-80 transition-all select-none ${filterStatus === 'queued' ? 'bg-secondary px-2 py-0.5 rounded-md ring-1 ring-border' : ''}`} onClick={() => toggleFilter('queued')}>
+          <div className={getFilterChipClass("queued", filterStatus)} onClick={() => toggleFilter('queued')}>
             <Clock className="h-3.5 w-3.5 text-muted-foreground"/>
             <span className="text-muted-foreground">Queued:</span>
             <span className="font-semibold">{queueInfo.queued_count}</span>
           </div>
-          <div className={`flex items-center gap-1.5 cursor-pointer hover:opacity-80 transition-all select-none ${filterStatus === 'completed' ? 'bg-green-500/10 px-2 py-0.5 rounded-md ring-1 ring-green-500/20' : ''}`} onClick={() => toggleFilter('completed')}>
+          <div className={getFilterChipClass("completed", filterStatus)} onClick={() => toggleFilter('completed')}>
             <CheckCircle2 className="h-3.5 w-3.5 text-green-500"/>
             <span className="text-muted-foreground">Completed:</span>
             <span className="font-semibold">{queueInfo.completed_count}</span>
           </div>
-          <div className={`flex items-center gap-1.5 cursor-pointer hover:opacity-80 transition-all select-none ${filterStatus === 'skipped' ? 'bg-yellow-500/10 px-2 py-0.5 rounded-md ring-1 ring-yellow-500/20' : ''}`} onClick={() => toggleFilter('skipped')}>
+          <div className={getFilterChipClass("skipped", filterStatus)} onClick={() => toggleFilter('skipped')}>
             <FileCheck className="h-3.5 w-3.5 text-yellow-500"/>
             <span className="text-muted-foreground">Skipped:</span>
             <span className="font-semibold">{queueInfo.skipped_count}</span>
           </div>
-          <div className={`flex items-center gap-1.5 cursor-pointer hover:opacity-80 transition-all select-none ${filterStatus === 'failed' ? 'bg-red-500/10 px-2 py-0.5 rounded-md ring-1 ring-red-500/20' : ''}`} onClick={() => toggleFilter('failed')}>
+          <div className={getFilterChipClass("failed", filterStatus)} onClick={() => toggleFilter('failed')}>
             <XCircle className="h-3.5 w-3.5 text-red-500"/>
             <span className="text-muted-foreground">Failed:</span>
             <span className="font-semibold">{queueInfo.failed_count}</span>
@@ -195,7 +202,14 @@ export function DownloadQueue({ isOpen, onClose }: DownloadQueueProps) {
             <Timer className="h-3.5 w-3.5 text-muted-foreground"/>
             <span className="text-muted-foreground">Duration:</span>
             <span className="font-semibold font-mono">
-              {queueInfo.session_start_time > 0 ? formatDuration(queueInfo.session_start_time) : "—"}
+              <SessionElapsed active={queueInfo.session_start_time > 0} elapsedSeconds={queueInfo.session_elapsed}/>
+            </span>
+          </div>
+          <div className="flex items-center gap-1.5">
+            <Hourglass className="h-3.5 w-3.5 text-muted-foreground"/>
+            <span className="text-muted-foreground">Remaining:</span>
+            <span className="font-semibold font-mono">
+              {queueInfo.estimated_seconds > 0 ? formatSessionDuration(queueInfo.estimated_seconds) : "—"}
             </span>
           </div>
         </div>
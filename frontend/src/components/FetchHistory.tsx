@@ -70,7 +70,7 @@ export function FetchHistory({ history, onSelect, onRemove }: FetchHistoryProps)
             </button>
             <div className="p-2">
               <div className="aspect-square w-full rounded-md overflow-hidden mb-2 bg-muted">
-                {item.image ? (<img src={item.image} alt={item.name} className="w-full h-full object-cover"/>) : (<div className="w-full h-full flex items-center justify-center text-muted-foreground text-xs">
+                {item.image ? (<img src={item.image} alt={item.name} className="w-full h-full object-cover" loading="lazy" decoding="async"/>) : (<div className="w-full h-full flex items-center justify-center text-muted-foreground text-xs">
                     No Image
                   </div>)}
               </div>
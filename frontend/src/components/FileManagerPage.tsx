@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useMemo, useRef } from "react";
 import { Button } from "@/components/ui/button";
 import { Label } from "@/components/ui/label";
 import { InputWithContext } from "@/components/ui/input-with-context";
@@ -59,6 +59,8 @@ const FORMAT_PRESETS: Record<string, {
     "custom": { label: "Custom...", template: "{title} - {artist}" },
 };
 const STORAGE_KEY = "spotiflac_file_manager_state";
+const STATE_SAVE_DELAY_MS = 500;
+const COVER_PREVIEW_CACHE_LIMIT = 32;
 const DEFAULT_PRESET = "title-artist";
 const DEFAULT_CUSTOM_FORMAT = "{title} - {artist}";
 function formatFileSize(bytes: number): string {
@@ -69,6 +71,37 @@ function formatFileSize(bytes: number): string {
     const i = Math.floor(Math.log(bytes) / Math.log(k));
     return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + " " + sizes[i];
 }
+function filterFilesByType(nodes: FileNode[], type: TabType): FileNode[] {
+    return nodes
+        .map((node) => {
+        if (node.is_dir && node.children) {
+            const filteredChildren = filterFilesByType(node.children, type);
+            if (filteredChildren.length > 0) {
+                return { ...node, children: filteredChildren };
+            }
+            return null;
+        }
+        const ext = node.name.toLowerCase();
+        if (type === "track" && (ext.endsWith(".flac") || ext.endsWith(".mp3") || ext.endsWith(".m4a")))
+            return node;
+        if (type === "lyric" && ext.endsWith(".lrc"))
+            return node;
+        if (type === "cover" && (ext.endsWith(".jpg") || ext.endsWith(".jpeg") || ext.endsWith(".png")))
+            return node;
+        return null;
+    })
+        .filter((node): node is FileNode => node !== null);
+}
+function getAllFilesFlat(nodes: FileNode[]): FileNode[] {
+    const result: FileNode[] = [];
+    for (const node of nodes) {
+        if (!node.is_dir)
+            result.push(node);
+        if (node.children)
+            result.push(...getAllFilesFlat(node.children));
+    }
+    return result;
+}
 export function FileManagerPage() {
     const [rootPath, setRootPath] = useState(() => {
         const settings = getSettings();
@@ -126,12 +159,24 @@ export function FileManagerPage() {
     const [manualRenameFile, setManualRenameFile] = useState("");
     const [manualRenameName, setManualRenameName] = useState("");
     const [manualRenaming, setManualRenaming] = useState(false);
-    useEffect(() => {
+    const pendingStateRef = useRef<string | null>(null);
+    const coverPreviewCacheRef = useRef(new Map<string, string>());
+    const flushPendingState = () => {
+        const state = pendingStateRef.current;
+        if (state === null)
+            return;
+        pendingStateRef.current = null;
         try {
-            localStorage.setItem(STORAGE_KEY, JSON.stringify({ formatPreset, customFormat }));
+            localStorage.setItem(STORAGE_KEY, state);
         }
         catch { }
+    };
+    useEffect(() => {
+        pendingStateRef.current = JSON.stringify({ formatPreset, customFormat });
+        const timeoutId = setTimeout(flushPendingState, STATE_SAVE_DELAY_MS);
+        return () => clearTimeout(timeoutId);
     }, [formatPreset, customFormat]);
+    useEffect(() => flushPendingState, []);
     useEffect(() => {
         const checkFullscreen = () => {
             const isMaximized = window.innerHeight >= window.screen.height * 0.9;
@@ -145,31 +190,11 @@ export function FileManagerPage() {
             window.removeEventListener("focus", checkFullscreen);
         };
     }, []);
-    const filterFilesByType = (nodes: FileNode[], type: TabType): FileNode[] => {
-        return nodes
-            .map((node) => {
-            if (node.is_dir && node.children) {
-                const filteredChildren = filterFilesByType(node.children, type);
-                if (filteredChildren.length > 0) {
-                    return { ...node, children: filteredChildren };
-                }
-                return null;
-            }
-            const ext = node.name.toLowerCase();
-            if (type === "track" && (ext.endsWith(".flac") || ext.endsWith(".mp3") || ext.endsWith(".m4a")))
-                return node;
-            if (type === "lyric" && ext.endsWith(".lrc"))
-                return node;
-            if (type === "cover" && (ext.endsWith(".jpg") || ext.endsWith(".jpeg") || ext.endsWith(".png")))
-                return node;
-            return null;
-        })
-            .filter((node): node is FileNode => node !== null);
-    };
     const loadFiles = useCallback(async () => {
         if (!rootPath)
             return;
         setLoading(true);
+        coverPreviewCacheRef.current.clear();
         try {
             const result = await ListDirectoryFiles(rootPath);
             if (!result || !Array.isArray(result)) {
@@ -196,20 +221,15 @@ export function FileManagerPage() {
         if (rootPath)
             loadFiles();
     }, [rootPath, loadFiles]);
-    const filteredFiles = filterFilesByType(allFiles, activeTab);
-    const getAllFilesFlat = (nodes: FileNode[]): FileNode[] => {
-        const result: FileNode[] = [];
-        for (const node of nodes) {
-            if (!node.is_dir)
-                result.push(node);
-            if (node.children)
-                result.push(...getAllFilesFlat(node.children));
-        }
-        return result;
-    };
-    const allAudioFiles = getAllFilesFlat(filterFilesByType(allFiles, "track"));
-    const allLyricFiles = getAllFilesFlat(filterFilesByType(allFiles, "lyric"));
-    const allCoverFiles = getAllFilesFlat(filterFilesByType(allFiles, "cover"));
+    const { tracks: trackTree, lyrics: lyricTree, covers: coverTree } = useMemo(() => ({
+        tracks: filterFilesByType(allFiles, "track"),
+        lyrics: filterFilesByType(allFiles, "lyric"),
+        covers: filterFilesByType(allFiles, "cover"),
+    }), [allFiles]);
+    const filteredFiles = activeTab === "track" ? trackTree : activeTab === "lyric" ? lyricTree : coverTree;
+    const allAudioFiles = useMemo(() => getAllFilesFlat(trackTree), [trackTree]);
+    const allLyricFiles = useMemo(() => getAllFilesFlat(lyricTree), [lyricTree]);
+    const allCoverFiles = useMemo(() => getAllFilesFlat(coverTree), [coverTree]);
     const handleSelectFolder = async () => {
         try {
             const path = await SelectFolder(rootPath);
@@ -317,7 +337,18 @@ export function FileManagerPage() {
         e.stopPropagation();
         setCoverFile(filePath);
         try {
-            const data = await ReadImageAsBase64(filePath);
+            const cache = coverPreviewCacheRef.current;
+            let data = cache.get(filePath);
+            if (data === undefined) {
+                data = await ReadImageAsBase64(filePath);
+            }
+            else {
+                cache.delete(filePath);
+            }
+            cache.set(filePath, data);
+            if (cache.size > COVER_PREVIEW_CACHE_LIMIT) {
+                cache.delete(cache.keys().next().value as string);
+            }
             setCoverData(data);
             setShowCoverPreview(true);
         }
@@ -708,7 +739,7 @@ export function FileManagerPage() {
           <DialogDescription className="break-all">{coverFile.split(/[/\\]/).pop()}</DialogDescription>
         </DialogHeader>
         <div className="flex items-center justify-center p-4">
-          {coverData ? <img src={coverData} alt="Cover" className="max-w-full max-h-[350px] rounded-lg object-contain"/> : <div className="text-muted-foreground">Loading...</div>}
+          {coverData ? <img src={coverData} alt="Cover" className="max-w-full max-h-[350px] rounded-lg object-contain" decoding="async"/> : <div className="text-muted-foreground">Loading...</div>}
         </div>
         <DialogFooter><Button onClick={() => setShowCoverPreview(false)}>Close</Button></DialogFooter>
       </DialogContent>
@@ -6,22 +6,35 @@ import { Input } from "@/components/ui/input";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, DialogTitle } from "@/components/ui/dialog";
 import { Pagination, PaginationContent, PaginationEllipsis, PaginationItem, PaginationLink, PaginationNext, PaginationPrevious } from "@/components/ui/pagination";
-import { GetDownloadHistory, ClearDownloadHistory, GetPreviewURL, GetFetchHistory, DeleteDownloadHistoryItem, DeleteFetchHistoryItem, ClearFetchHistoryByType } from "../../wailsjs/go/main/App";
+import { GetDownloadHistory, ClearDownloadHistory, GetPreviewURL, GetFetchHistory, DeleteDownloadHistoryItem, DeleteFetchHistoryItem, ClearFetchHistoryByType, WaitForHistoryChange } from "../../wailsjs/go/main/App";
 import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from "@/components/ui/tooltip";
 import { openExternal } from "@/lib/utils";
 import { getPreviewVolume } from "@/lib/preview";
 import { createPreviewPlayback, type PreviewPlayback } from "@/lib/preview-player";
 import { TidalIcon, QobuzIcon, AmazonIcon } from "./PlatformIcons";
-const formatDate = (timestamp: number) => {
+import { useDebouncedValue } from "@/hooks/useDebouncedValue";
+const NO_COVER_PLACEHOLDER = `data:image/svg+xml,${encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" width="40" height="40" viewBox="0 0 40 40"><rect width="40" height="40" fill="#27272a"/><path d="M24 13v11.2a3.6 3.6 0 1 1-2-3.2V16l-6 1.5v8.7a3.6 3.6 0 1 1-2-3.2V15l10-2z" fill="#71717a"/></svg>')}`;
+const SEARCH_DEBOUNCE_MS = 150;
+const HISTORY_WAIT_TIMEOUT_MS = 30000;
+const HISTORY_RETRY_DELAY_MS = 5000;
+const HISTORY_REFRESH_MIN_INTERVAL_MS = 1000;
+const pad2 = (value: number) => (value < 10 ? "0" : "") + value;
+const formatTimestampParts = (timestamp: number) => {
     const date = new Date(timestamp * 1000);
-    const year = date.getFullYear();
-    const month = String(date.getMonth() + 1).padStart(2, '0');
-    const day = String(date.getDate()).padStart(2, '0');
-    const hours = String(date.getHours()).padStart(2, '0');
-    const minutes = String(date.getMinutes()).padStart(2, '0');
-    const seconds = String(date.getSeconds()).padStart(2, '0');
-    return `${year}-${month}-${day} ${hours}:${minutes}:${seconds}`;
+    return {
+        day: `${date.getFullYear()}-${pad2(date.getMonth() + 1)}-${pad2(date.getDate())}`,
+        time: `${pad2(date.getHours())}:${pad2(date.getMinutes())}:${pad2(date.getSeconds())}`,
+    };
 };
+function HistoryTimestamp({ timestamp }: {
+    timestamp: number;
+}) {
+    const { day, time } = formatTimestampParts(timestamp);
+    return (<div className="flex flex-col">
+            <span>{day}</span>
+            <span className="text-[10px] text-muted-foreground">{time}</span>
+        </div>);
+}
 const getHistoryFormatLabel = (item: DownloadHistoryItem) => {
     const normalizedPath = (item.path || "").trim().toLowerCase();
     if (normalizedPath.endsWith(".flac"))
@@ -86,6 +99,7 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
     const [filteredDownloadHistory, setFilteredDownloadHistory] = useState<DownloadHistoryItem[]>([]);
     const [showClearDownloadConfirm, setShowClearDownloadConfirm] = useState(false);
     const [downloadSearchQuery, setDownloadSearchQuery] = useState("");
+    const debouncedDownloadSearchQuery = useDebouncedValue(downloadSearchQuery, SEARCH_DEBOUNCE_MS);
     const [downloadSortBy, setDownloadSortBy] = useState("default");
     const [downloadCurrentPage, setDownloadCurrentPage] = useState(1);
     const [playingPreviewId, setPlayingPreviewId] = useState<string | null>(null);
@@ -95,6 +109,7 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
     const [activeFetchTab, setActiveFetchTab] = useState("track");
     const [showClearFetchConfirm, setShowClearFetchConfirm] = useState(false);
     const [fetchSearchQuery, setFetchSearchQuery] = useState("");
+    const debouncedFetchSearchQuery = useDebouncedValue(fetchSearchQuery, SEARCH_DEBOUNCE_MS);
     const [fetchCurrentPage, setFetchCurrentPage] = useState(1);
     const ITEMS_PER_PAGE = 50;
     const getTrackLink = (spotifyId: string) => {
@@ -141,16 +156,32 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
         }
     };
     useEffect(() => {
-        if (activeTab === "downloads") {
-            fetchDownloadHistory();
-            const interval = setInterval(fetchDownloadHistory, 5000);
-            return () => clearInterval(interval);
-        }
-        else {
-            fetchFetchHistory();
-            const interval = setInterval(fetchFetchHistory, 5000);
-            return () => clearInterval(interval);
-        }
+        let cancelled = false;
+        let version = -1;
+        const refreshHistory = activeTab === "downloads" ? fetchDownloadHistory : fetchFetchHistory;
+        const watchHistory = async () => {
+            while (!cancelled) {
+                try {
+                    const nextVersion = await WaitForHistoryChange(activeTab, version, HISTORY_WAIT_TIMEOUT_MS);
+                    if (cancelled) {
+                        return;
+                    }
+                    if (nextVersion !== version) {
+                        version = nextVersion;
+                        await refreshHistory();
+                        await new Promise((resolve) => setTimeout(resolve, HISTORY_REFRESH_MIN_INTERVAL_MS));
+                    }
+                }
+                catch (error) {
+                    console.error("Failed to watch history:", error);
+                    await new Promise((resolve) => setTimeout(resolve, HISTORY_RETRY_DELAY_MS));
+                }
+            }
+        };
+        watchHistory();
+        return () => {
+            cancelled = true;
+        };
     }, [activeTab]);
     useEffect(() => {
         return () => {
@@ -160,8 +191,8 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
     }, []);
     useEffect(() => {
         let result = [...downloadHistory];
-        if (downloadSearchQuery) {
-            const query = downloadSearchQuery.toLowerCase();
+        if (debouncedDownloadSearchQuery) {
+            const query = debouncedDownloadSearchQuery.toLowerCase();
             result = result.filter(item => item.title.toLowerCase().includes(query) ||
                 item.artists.toLowerCase().includes(query) ||
                 item.album.toLowerCase().includes(query));
@@ -174,6 +205,12 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
                 return parts[0] * 3600 + parts[1] * 60 + parts[2];
             return 0;
         };
+        const durationSeconds = new Map<DownloadHistoryItem, number>();
+        if (downloadSortBy === "duration_asc" || downloadSortBy === "duration_desc") {
+            for (const item of result) {
+                durationSeconds.set(item, parseDuration(item.duration_str));
+            }
+        }
         result.sort((a, b) => {
             switch (downloadSortBy) {
                 case "default":
@@ -183,32 +220,32 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
                 case "title_desc": return b.title.localeCompare(a.title);
                 case "artist_asc": return a.artists.localeCompare(b.artists);
                 case "artist_desc": return b.artists.localeCompare(a.artists);
-                case "duration_asc": return parseDuration(a.duration_str) - parseDuration(b.duration_str);
-                case "duration_desc": return parseDuration(b.duration_str) - parseDuration(a.duration_str);
+                case "duration_asc": return durationSeconds.get(a)! - durationSeconds.get(b)!;
+                case "duration_desc": return durationSeconds.get(b)! - durationSeconds.get(a)!;
                 default: return 0;
             }
         });
         setFilteredDownloadHistory(result);
-    }, [downloadHistory, downloadSearchQuery, downloadSortBy]);
+    }, [downloadHistory, debouncedDownloadSearchQuery, downloadSortBy]);
     useEffect(() => {
         setDownloadCurrentPage(1);
-    }, [downloadSearchQuery, downloadSortBy]);
+    }, [debouncedDownloadSearchQuery, downloadSortBy]);
     useEffect(() => {
         let result = [...fetchHistory];
         if (activeFetchTab !== "all") {
             result = result.filter(item => item.type.toLowerCase() === activeFetchTab.toLowerCase());
         }
-        if (fetchSearchQuery) {
-            const query = fetchSearchQuery.toLowerCase();
+        if (debouncedFetchSearchQuery) {
+            const query = debouncedFetchSearchQuery.toLowerCase();
             result = result.filter(item => item.name.toLowerCase().includes(query) ||
                 item.info.toLowerCase().includes(query));
         }
         result.sort((a, b) => b.timestamp - a.timestamp);
         setFilteredFetchHistory(result);
-    }, [fetchHistory, fetchSearchQuery, activeFetchTab]);
+    }, [fetchHistory, debouncedFetchSearchQuery, activeFetchTab]);
     useEffect(() => {
         setFetchCurrentPage(1);
-    }, [fetchSearchQuery, activeFetchTab]);
+    }, [debouncedFetchSearchQuery, activeFetchTab]);
     const handlePreview = async (id: string, spotifyId: string) => {
         if (playingPreviewId === id) {
             playbackRef.current?.destroy();
@@ -365,7 +402,12 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
                                         </td>
                                         <td className="p-3 align-middle min-w-0">
                                             <div className="flex items-center gap-3 min-w-0">
-                                                <img src={item.cover_url || "https://placehold.co/300?text=No+Cover"} alt={item.album} className="h-10 w-10 rounded shrink-0 bg-secondary object-cover" onError={(e) => { (e.target as HTMLImageElement).src = "https://placehold.co/300?text=No+Cover"; }}/>
+                                                <img src={item.cover_url || NO_COVER_PLACEHOLDER} alt={item.album} className="h-10 w-10 rounded shrink-0 bg-secondary object-cover" loading="lazy" decoding="async" onError={(e) => {
+                                                    const img = e.target as HTMLImageElement;
+                                                    if (img.src !== NO_COVER_PLACEHOLDER) {
+                                                        img.src = NO_COVER_PLACEHOLDER;
+                                                    }
+                                                }}/>
                                                 <div className="flex flex-col min-w-0 flex-1">
                                                     <span className="font-medium text-sm truncate">{item.title}</span>
                                                     <span className="text-xs text-muted-foreground truncate">{item.artists}</span>
@@ -387,10 +429,7 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
                                             {item.duration_str}
                                         </td>
                                          <td className="p-3 align-middle text-xs text-muted-foreground hidden md:table-cell whitespace-nowrap text-left">
-                                            <div className="flex flex-col">
-                                                <span>{formatDate(item.timestamp).split(' ')[0]}</span>
-                                                <span className="text-[10px] text-muted-foreground">{formatDate(item.timestamp).split(' ')[1]}</span>
-                                            </div>
+                                            <HistoryTimestamp timestamp={item.timestamp}/>
                                         </td>
                                         <td className="p-3 align-middle text-center">
                                             <div className="flex items-center justify-center">
@@ -562,7 +601,7 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
                                         <td className="p-3 align-middle min-w-0">
                                             <div className="flex items-center gap-3 min-w-0">
                                                 <div className="h-10 w-10 rounded shrink-0 bg-secondary overflow-hidden">
-                                                    {item.image ? (<img src={item.image} alt={item.name} className="h-full w-full object-cover"/>) : (<div className="h-full w-full flex items-center justify-center text-xs text-muted-foreground font-medium bg-muted">
+                                                    {item.image ? (<img src={item.image} alt={item.name} className="h-full w-full object-cover" loading="lazy" decoding="async"/>) : (<div className="h-full w-full flex items-center justify-center text-xs text-muted-foreground font-medium bg-muted">
                                                             {item.type.slice(0, 2).toUpperCase()}
                                                         </div>)}
                                                 </div>
@@ -573,10 +612,7 @@ export function HistoryPage({ onHistorySelect }: HistoryPageProps) {
                                             <div className="truncate">{item.info}</div>
                                         </td>
                                         <td className="p-3 align-middle text-xs text-muted-foreground hidden lg:table-cell whitespace-nowrap">
-                                            <div className="flex flex-col">
-                                                <span>{formatDate(item.timestamp).split(' ')[0]}</span>
-                                                <span className="text-[10px] text-muted-foreground">{formatDate(item.timestamp).split(' ')[1]}</span>
-                                            </div>
+                                            <HistoryTimestamp timestamp={item.timestamp}/>
                                         </td>
                                         <td className="p-3 align-middle text-center">
                                             <div className="flex items-center justify-center gap-1">
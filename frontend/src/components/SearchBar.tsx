@@ -9,7 +9,7 @@ import { FetchHistory } from "@/components/FetchHistory";
 import type { HistoryItem } from "@/components/FetchHistory";
 import { SearchSpotify, SearchSpotifyByType } from "../../wailsjs/go/main/App";
 import { backend } from "../../wailsjs/go/models";
-import { cn } from "@/lib/utils";
+import { cn, formatDurationMs } from "@/lib/utils";
 import { useTypingEffect } from "@/hooks/useTypingEffect";
 import { getSettings, type Settings } from "@/lib/settings";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue, } from "@/components/ui/select";
@@ -455,11 +455,6 @@ export function SearchBar({ url, loading, onUrlChange, onFetch, onFetchUrl, hist
         onSearchModeChange(false);
         onFetchUrl(externalUrl);
     };
-    const formatDuration = (ms: number) => {
-        const minutes = Math.floor(ms / 60000);
-        const seconds = Math.floor((ms % 60000) / 1000);
-        return `${minutes}:${seconds.toString().padStart(2, "0")}`;
-    };
     const hasAnyResults = searchResults &&
         (searchResults.tracks.length > 0 ||
             searchResults.albums.length > 0 ||
@@ -717,7 +712,7 @@ export function SearchBar({ url, loading, onUrlChange, onFetch, onFetchUrl, hist
               <div className="grid gap-2">
                 {activeTab === "tracks" &&
                     sortedResults.tracks.map((track) => (<button key={track.id} type="button" className="flex items-center gap-3 p-3 rounded-lg bg-card hover:bg-accent border cursor-pointer text-left transition-colors" onClick={() => handleResultClick(track.external_urls)}>
-                      {track.images ? (<img src={track.images} alt="" className="w-12 h-12 rounded object-cover shrink-0"/>) : (<div className="w-12 h-12 rounded bg-muted shrink-0"/>)}
+                      {track.images ? (<img src={track.images} alt="" className="w-12 h-12 rounded object-cover shrink-0" loading="lazy" decoding="async"/>) : (<div className="w-12 h-12 rounded bg-muted shrink-0"/>)}
                       <div className="flex-1 min-w-0">
                         <div className="flex items-center gap-1.5 min-w-0">
                           <p className="font-medium truncate">{track.name}</p>
@@ -730,13 +725,13 @@ export function SearchBar({ url, loading, onUrlChange, onFetch, onFetchUrl, hist
                         </p>
                       </div>
                       <span className="text-sm text-muted-foreground shrink-0">
-                        {formatDuration(track.duration_ms || 0)}
+                        {formatDurationMs(track.duration_ms || 0)}
                       </span>
                     </button>))}
 
                 {activeTab === "albums" &&
                     sortedResults.albums.map((album) => (<button key={album.id} type="button" className="flex items-center gap-3 p-3 rounded-lg bg-card hover:bg-accent border cursor-pointer text-left transition-colors" onClick={() => handleResultClick(album.external_urls)}>
-                      {album.images ? (<img src={album.images} alt="" className="w-12 h-12 rounded object-cover shrink-0"/>) : (<div className="w-12 h-12 rounded bg-muted shrink-0"/>)}
+                      {album.images ? (<img src={album.images} alt="" className="w-12 h-12 rounded object-cover shrink-0" loading="lazy" decoding="async"/>) : (<div className="w-12 h-12 rounded bg-muted shrink-0"/>)}
                       <div className="flex-1 min-w-0">
                         <p className="font-medium truncate">{album.name}</p>
                         <p className="text-sm text-muted-foreground truncate">
@@ -750,7 +745,7 @@ export function SearchBar({ url, loading, onUrlChange, onFetch, onFetchUrl, hist
 
                 {activeTab === "artists" &&
                     sortedResults.artists.map((artist) => (<button key={artist.id} type="button" className="flex items-center gap-3 p-3 rounded-lg bg-card hover:bg-accent border cursor-pointer text-left transition-colors" onClick={() => handleResultClick(artist.external_urls)}>
-                      {artist.images ? (<img src={artist.images} alt="" className="w-12 h-12 rounded-full object-cover shrink-0"/>) : (<div className="w-12 h-12 rounded-full bg-muted shrink-0"/>)}
+                      {artist.images ? (<img src={artist.images} alt="" className="w-12 h-12 rounded-full object-cover shrink-0" loading="lazy" decoding="async"/>) : (<div className="w-12 h-12 rounded-full bg-muted shrink-0"/>)}
                       <div className="flex-1 min-w-0">
                         <p className="font-medium truncate">{artist.name}</p>
                         <p className="text-sm text-muted-foreground">Artist</p>
@@ -759,7 +754,7 @@ export function SearchBar({ url, loading, onUrlChange, onFetch, onFetchUrl, hist
 
                 {activeTab === "playlists" &&
                     sortedResults.playlists.map((playlist) => (<button key={playlist.id} type="button" className="flex items-center gap-3 p-3 rounded-lg bg-card hover:bg-accent border cursor-pointer text-left transition-colors" onClick={() => handleResultClick(playlist.external_urls)}>
-                      {playlist.images ? (<img src={playlist.images} alt="" className="w-12 h-12 rounded object-cover shrink-0"/>) : (<div className="w-12 h-12 rounded bg-muted shrink-0"/>)}
+                      {playlist.images ? (<img src={playlist.images} alt="" className="w-12 h-12 rounded object-cover shrink-0" loading="lazy" decoding="async"/>) : (<div className="w-12 h-12 rounded bg-muted shrink-0"/>)}
                       <div className="flex-1 min-w-0">
                         <p className="font-medium truncate">{playlist.name}</p>
                         <p className="text-sm text-muted-foreground truncate">
@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useRef } from "react";
 import { flushSync } from "react-dom";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -6,16 +6,18 @@ import { InputWithContext } from "@/components/ui/input-with-context";
 import { Label } from "@/components/ui/label";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue, } from "@/components/ui/select";
 import { Tooltip, TooltipContent, TooltipTrigger, } from "@/components/ui/tooltip";
-import { FolderOpen, Save, RotateCcw, Info, ArrowRight, MonitorCog, FolderCog, Router, FolderLock, Plus, Trash2, ExternalLink } from "lucide-react";
+import { FolderOpen, Save, RotateCcw, Info, ArrowRight, MonitorCog, FolderCog, Router, FolderLock, Plus, Trash2, ExternalLink, Eraser } from "lucide-react";
 import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, DialogTitle, } from "@/components/ui/dialog";
 import { Switch } from "@/components/ui/switch";
 import { getSettings, getSettingsWithDefaults, saveSettings, resetToDefaultSettings, applyThemeMode, applyFont, getFontOptions, parseGoogleFontUrl, loadGoogleFontUrl, loadCustomFonts, saveCustomFonts, FOLDER_PRESETS, FILENAME_PRESETS, TEMPLATE_VARIABLES, type Settings as SettingsType, type FontFamily, type CustomFontFamily, type FolderPreset, type FilenamePreset, type ExistingFileCheckMode, } from "@/lib/settings";
+import { MAX_DOWNLOAD_CONCURRENCY } from "@/lib/concurrency";
 import { themes, applyTheme } from "@/lib/themes";
-import { SelectFolder, OpenConfigFolder, CheckCustomTidalAPI } from "../../wailsjs/go/main/App";
+import { SelectFolder, OpenConfigFolder, CheckCustomTidalAPI, ClearMetadataCache } from "../../wailsjs/go/main/App";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
 import { openExternal } from "@/lib/utils";
 import { ApiStatusTab } from "./ApiStatusTab";
 import { AmazonIcon, QobuzIcon, SonglinkIcon, SongstatsIcon, TidalIcon } from "./PlatformIcons";
+const CUSTOM_TIDAL_API_SAVE_DELAY_MS = 500;
 interface SettingsPageProps {
     onUnsavedChangesChange?: (hasUnsavedChanges: boolean) => void;
     onResetRequest?: (resetFn: () => void) => void;
@@ -81,7 +83,6 @@ export function SettingsPage({ onUnsavedChangesChange, onResetRequest, }: Settin
                 const settingsWithDefaults = await getSettingsWithDefaults();
                 setSavedSettings(settingsWithDefaults);
                 setTempSettings(settingsWithDefaults);
-                await saveSettings(settingsWithDefaults);
             }
         };
         loadDefaults();
@@ -176,14 +177,23 @@ export function SettingsPage({ onUnsavedChangesChange, onResetRequest, }: Settin
     const handleAutoQualityChange = async (value: "16" | "24") => {
         setTempSettings((prev) => ({ ...prev, autoQuality: value }));
     };
-    const persistCustomTidalApi = useCallback(async (nextValue: string) => {
+    const pendingCustomTidalApiRef = useRef<string | null>(null);
+    const customTidalApiSaveTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+    const flushCustomTidalApi = useCallback(() => {
+        if (customTidalApiSaveTimerRef.current !== null) {
+            clearTimeout(customTidalApiSaveTimerRef.current);
+            customTidalApiSaveTimerRef.current = null;
+        }
+        const pendingValue = pendingCustomTidalApiRef.current;
+        if (pendingValue === null) {
+            return;
+        }
+        pendingCustomTidalApiRef.current = null;
+        void saveSettings({ ...getSettings(), customTidalApi: pendingValue });
+    }, []);
+    useEffect(() => flushCustomTidalApi, [flushCustomTidalApi]);
+    const persistCustomTidalApi = useCallback((nextValue: string) => {
         const normalizedValue = nextValue.trim().replace(/\/+$/g, "");
-        const persistedSettings = getSettings();
-        const nextSavedSettings: SettingsType = {
-            ...persistedSettings,
-            customTidalApi: normalizedValue,
-        };
-        await saveSettings(nextSavedSettings);
         setSavedSettings((prev) => ({
             ...prev,
             customTidalApi: normalizedValue,
@@ -192,7 +202,12 @@ export function SettingsPage({ onUnsavedChangesChange, onResetRequest, }: Settin
             ...prev,
             customTidalApi: normalizedValue,
         }));
-    }, []);
+        pendingCustomTidalApiRef.current = normalizedValue;
+        if (customTidalApiSaveTimerRef.current !== null) {
+            clearTimeout(customTidalApiSaveTimerRef.current);
+        }
+        customTidalApiSaveTimerRef.current = setTimeout(flushCustomTidalApi, CUSTOM_TIDAL_API_SAVE_DELAY_MS);
+    }, [flushCustomTidalApi]);
     const handleCheckCustomTidalApi = async () => {
         const normalizedCustomTidalApi = (tempSettings.customTidalApi || "").trim().replace(/\/+$/g, "");
         if (!normalizedCustomTidalApi.startsWith("https://")) {
@@ -232,6 +247,18 @@ export function SettingsPage({ onUnsavedChangesChange, onResetRequest, }: Settin
             <FolderLock className="h-4 w-4"/>
             Open Config Folder
           </Button>
+          <Button variant="outline" onClick={async () => {
+            try {
+                await ClearMetadataCache();
+                toast.success("Metadata cache cleared");
+            }
+            catch (e) {
+                toast.error(`Failed to clear metadata cache: ${e}`);
+            }
+        }} className="gap-1.5">
+            <Eraser className="h-4 w-4"/>
+            Clear Metadata Cache
+          </Button>
           <Button variant="outline" onClick={() => setShowResetConfirm(true)} className="gap-1.5">
             <RotateCcw className="h-4 w-4"/>
             Reset to Default
@@ -783,6 +810,23 @@ export function SettingsPage({ onUnsavedChangesChange, onResetRequest, }: Settin
                 </Select>
               </div>
 
+              <div className="space-y-2">
+                <Label htmlFor="download-concurrency">Parallel Downloads</Label>
+                <Select value={String(tempSettings.downloadConcurrency)} onValueChange={(value) => setTempSettings((prev) => ({
+                ...prev,
+                downloadConcurrency: Number(value),
+            }))}>
+                  <SelectTrigger id="download-concurrency">
+                    <SelectValue placeholder="Select parallel downloads"/>
+                  </SelectTrigger>
+                  <SelectContent>
+                    {Array.from({ length: MAX_DOWNLOAD_CONCURRENCY }, (_, i) => i + 1).map((count) => (<SelectItem key={count} value={String(count)}>
+                        {count}
+                      </SelectItem>))}
+                  </SelectContent>
+                </Select>
+              </div>
+
               <div className="space-y-2">
               <div className="flex items-center gap-2">
                 <Label className="text-sm">Filename Format</Label>
@@ -930,14 +974,14 @@ export function SettingsPage({ onUnsavedChangesChange, onResetRequest, }: Settin
                 <Input id="custom-tidal-api" type="url" value={tempSettings.customTidalApi || ""} onChange={(e) => {
             const nextValue = e.target.value.replace(/\/+$/g, "");
             setCustomTidalApiStatus("idle");
-            void persistCustomTidalApi(nextValue);
+            persistCustomTidalApi(nextValue);
         }} placeholder="https://your-hifi-api.example"/>
                 <Button type="button" variant="outline" onClick={() => void handleCheckCustomTidalApi()} disabled={!((tempSettings.customTidalApi || "").trim().startsWith("https://")) || customTidalApiStatus === "checking"}>
                   {customTidalApiStatus === "checking" ? "Checking..." : "Check"}
                 </Button>
                 {tempSettings.customTidalApi && (<Button type="button" variant="outline" size="icon" onClick={() => {
                 setCustomTidalApiStatus("idle");
-                void persistCustomTidalApi("");
+                persistCustomTidalApi("");
             }}>
                     <Trash2 className="h-4 w-4 text-destructive"/>
                   </Button>)}
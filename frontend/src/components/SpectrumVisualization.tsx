@@ -438,10 +438,24 @@ export async function renderSpectrogramToCanvas(canvas: HTMLCanvasElement, optio
     }
     await renderSpectrogram(ctx, options.spectrumData, options.sampleRate, options.duration, options.freqScale, options.colorScheme, options.fileName, options.shouldCancel ?? (() => false));
 }
+function encodeCanvasAsDataURL(canvas: HTMLCanvasElement): Promise<string> {
+    return new Promise((resolve, reject) => {
+        canvas.toBlob((blob) => {
+            if (!blob) {
+                reject(new Error("Failed to encode spectrogram image"));
+                return;
+            }
+            const reader = new FileReader();
+            reader.onload = () => resolve(reader.result as string);
+            reader.onerror = () => reject(reader.error ?? new Error("Failed to read spectrogram image"));
+            reader.readAsDataURL(blob);
+        }, "image/png");
+    });
+}
 export async function createSpectrogramDataURL(options: SpectrogramRenderOptions): Promise<string> {
     const canvas = document.createElement("canvas");
     await renderSpectrogramToCanvas(canvas, options);
-    return canvas.toDataURL("image/png");
+    return encodeCanvasAsDataURL(canvas);
 }
 const COLOR_SCHEMES: {
     value: ColorScheme;
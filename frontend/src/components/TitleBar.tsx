@@ -9,6 +9,10 @@ import type { CurrentIPInfo } from "@/types/api";
 import { openExternal } from "@/lib/utils";
 import { useEffect, useRef, useState } from "react";
 const IP_INFO_REFRESH_INTERVAL_MS = 30000;
+const DRAG_REGION_STYLE = { "--wails-draggable": "drag" } as React.CSSProperties;
+const NO_DRAG_STYLE = { "--wails-draggable": "no-drag" } as React.CSSProperties;
+const WINDOW_BUTTON_CLASS = "w-8 h-7 flex items-center justify-center hover:bg-muted transition-colors rounded";
+const CLOSE_BUTTON_CLASS = "w-8 h-7 flex items-center justify-center hover:bg-destructive hover:text-white transition-colors rounded";
 const SPOTIFY_BLOCKED_COUNTRY_CODES = new Set([
     "AF",
     "IO",
@@ -81,6 +85,9 @@ export function TitleBar() {
     }, []);
     useEffect(() => {
         const intervalId = window.setInterval(() => {
+            if (document.visibilityState === "hidden") {
+                return;
+            }
             void loadCurrentIPInfo({ silent: true });
         }, IP_INFO_REFRESH_INTERVAL_MS);
         const handleFocus = () => {
@@ -127,11 +134,11 @@ export function TitleBar() {
     const isSpotifyBlockedCountry = detectedCountryCode !== "" && SPOTIFY_BLOCKED_COUNTRY_CODES.has(detectedCountryCode);
     return (<>
 
-      <div className="fixed top-0 left-14 right-0 h-10 z-40 bg-background/80 backdrop-blur-sm" style={{ "--wails-draggable": "drag" } as React.CSSProperties} onDoubleClick={handleMaximize}/>
+      <div className="fixed top-0 left-14 right-0 h-10 z-40 bg-background/80 backdrop-blur-sm" style={DRAG_REGION_STYLE} onDoubleClick={handleMaximize}/>
 
 
       <div className="fixed top-1.5 right-2 z-50 flex h-7 gap-0.5 items-center">
-        <Menubar className="border-none bg-transparent shadow-none px-0 mr-1" style={{ "--wails-draggable": "no-drag" } as React.CSSProperties}>
+        <Menubar className="border-none bg-transparent shadow-none px-0 mr-1" style={NO_DRAG_STYLE}>
             <MenubarMenu>
                 <MenubarTrigger className="cursor-pointer w-8 h-7 p-0 flex items-center justify-center hover:bg-muted transition-colors rounded data-[state=open]:bg-muted">
                     <SlidersHorizontal className="w-3.5 h-3.5"/>
@@ -183,13 +190,13 @@ export function TitleBar() {
                 </MenubarContent>
             </MenubarMenu>
         </Menubar>
-        <button onClick={handleMinimize} className="w-8 h-7 flex items-center justify-center hover:bg-muted transition-colors rounded" style={{ "--wails-draggable": "no-drag" } as React.CSSProperties} aria-label="Minimize">
+        <button onClick={handleMinimize} className={WINDOW_BUTTON_CLASS} style={NO_DRAG_STYLE} aria-label="Minimize">
           <Minus className="w-3.5 h-3.5"/>
         </button>
-        <button onClick={handleMaximize} className="w-8 h-7 flex items-center justify-center hover:bg-muted transition-colors rounded" style={{ "--wails-draggable": "no-drag" } as React.CSSProperties} aria-label="Maximize">
+        <button onClick={handleMaximize} className={WINDOW_BUTTON_CLASS} style={NO_DRAG_STYLE} aria-label="Maximize">
           <Maximize className="w-3.5 h-3.5"/>
         </button>
-        <button onClick={handleClose} className="w-8 h-7 flex items-center justify-center hover:bg-destructive hover:text-white transition-colors rounded" style={{ "--wails-draggable": "no-drag" } as React.CSSProperties} aria-label="Close">
+        <button onClick={handleClose} className={CLOSE_BUTTON_CLASS} style={NO_DRAG_STYLE} aria-label="Close">
           <X className="w-3.5 h-3.5"/>
         </button>
       </div>
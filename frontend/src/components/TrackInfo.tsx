@@ -7,13 +7,14 @@ import type { TrackMetadata, TrackAvailability } from "@/types/api";
 import { usePreview } from "@/hooks/usePreview";
 import { AvailabilityLinks, hasAvailabilityLinks } from "./AvailabilityLinks";
 import { buildClickableArtists } from "@/lib/artist-links";
+import { formatDurationMs } from "@/lib/utils";
 interface TrackInfoProps {
     track: TrackMetadata & {
         album_name: string;
         release_date: string;
     };
     isDownloading: boolean;
-    downloadingTrack: string | null;
+    downloadingTracks: Set<string>;
     isDownloaded: boolean;
     isFailed: boolean;
     isSkipped: boolean;
@@ -44,15 +45,10 @@ interface TrackInfoProps {
     }) => void;
     onBack?: () => void;
 }
-export function TrackInfo({ track, isDownloading, downloadingTrack, isDownloaded, isFailed, isSkipped, downloadingLyricsTrack, downloadedLyrics, failedLyrics, skippedLyrics, checkingAvailability, availability, downloadingCover, downloadedCover, failedCover, skippedCover, onDownload, onDownloadLyrics, onCheckAvailability, onDownloadCover, onOpenFolder, onAlbumClick, onArtistClick, onBack, }: TrackInfoProps) {
+export function TrackInfo({ track, isDownloading, downloadingTracks, isDownloaded, isFailed, isSkipped, downloadingLyricsTrack, downloadedLyrics, failedLyrics, skippedLyrics, checkingAvailability, availability, downloadingCover, downloadedCover, failedCover, skippedCover, onDownload, onDownloadLyrics, onCheckAvailability, onDownloadCover, onOpenFolder, onAlbumClick, onArtistClick, onBack, }: TrackInfoProps) {
     const { playPreview, loadingPreview, playingTrack } = usePreview();
     const hasAlbumClick = !!(onAlbumClick && track.album_id && track.album_url);
     const clickableArtists = buildClickableArtists(track.artists, track.artists_data, track.artist_id, track.artist_url);
-    const formatDuration = (ms: number) => {
-        const minutes = Math.floor(ms / 60000);
-        const seconds = Math.floor((ms % 60000) / 1000);
-        return `${minutes}:${seconds.toString().padStart(2, "0")}`;
-    };
     const formatPlays = (plays: string) => {
         const num = parseInt(plays, 10);
         if (isNaN(num))
@@ -69,9 +65,9 @@ export function TrackInfo({ track, isDownloading, downloadingTrack, isDownloaded
       <div className="flex gap-6 items-start">
         <div className="shrink-0">
           {track.images && (<div className="relative w-48 h-48 rounded-md shadow-lg overflow-hidden">
-            <img src={track.images} alt={track.name} className="w-full h-full object-cover"/>
+            <img src={track.images} alt={track.name} className="w-full h-full object-cover" decoding="async"/>
             <div className="absolute bottom-1 right-1 bg-black/80 text-white px-1.5 py-0.5 text-xs font-medium rounded">
-              {formatDuration(track.duration_ms)}
+              {formatDurationMs(track.duration_ms)}
             </div>
           </div>)}
         </div>
@@ -126,8 +122,8 @@ export function TrackInfo({ track, isDownloading, downloadingTrack, isDownloaded
             </div>
           </div>
           {track.spotify_id && (<div className="flex gap-2 flex-wrap">
-            <Button onClick={() => onDownload(track.spotify_id || "", track.name, track.artists, track.album_name, track.spotify_id, undefined, track.duration_ms, track.track_number, track.album_artist, track.release_date, track.images, track.track_number, track.disc_number, track.total_tracks, track.total_discs, track.copyright, track.publisher)} disabled={isDownloading || downloadingTrack === track.spotify_id}>
-              {downloadingTrack === track.spotify_id ? (<Spinner />) : (<>
+            <Button onClick={() => onDownload(track.spotify_id || "", track.name, track.artists, track.album_name, track.spotify_id, undefined, track.duration_ms, track.track_number, track.album_artist, track.release_date, track.images, track.track_number, track.disc_number, track.total_tracks, track.total_discs, track.copyright, track.publisher)} disabled={isDownloading || downloadingTracks.has(track.spotify_id)}>
+              {downloadingTracks.has(track.spotify_id) ? (<Spinner />) : (<>
                 <Download className="h-4 w-4"/>
                 Download
               </>)}
@@ -1,3 +1,4 @@
+import { useMemo } from "react";
 import { Button } from "@/components/ui/button";
 import { Checkbox } from "@/components/ui/checkbox";
 import { Download, CheckCircle, XCircle, FileCheck, FileText, Globe, ImageDown, Play, Pause } from "lucide-react";
@@ -6,8 +7,10 @@ import { Tooltip, TooltipContent, TooltipTrigger, } from "@/components/ui/toolti
 import { Pagination, PaginationContent, PaginationEllipsis, PaginationItem, PaginationLink, PaginationNext, PaginationPrevious, } from "@/components/ui/pagination";
 import type { TrackMetadata, TrackAvailability } from "@/types/api";
 import { usePreview } from "@/hooks/usePreview";
+import { useDebouncedValue } from "@/hooks/useDebouncedValue";
 import { AvailabilityLinks, hasAvailabilityLinks } from "./AvailabilityLinks";
 import { buildClickableArtists } from "@/lib/artist-links";
+import { formatDurationMs } from "@/lib/utils";
 interface TrackListProps {
     tracks: TrackMetadata[];
     searchQuery: string;
@@ -16,7 +19,7 @@ interface TrackListProps {
     downloadedTracks: Set<string>;
     failedTracks: Set<string>;
     skippedTracks: Set<string>;
-    downloadingTrack: string | null;
+    downloadingTracks: Set<string>;
     isDownloading: boolean;
     currentPage: number;
     itemsPerPage: number;
@@ -53,36 +56,37 @@ interface TrackListProps {
     }) => void;
     onTrackClick?: (track: TrackMetadata) => void;
 }
-export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloadedTracks, failedTracks, skippedTracks, downloadingTrack, isDownloading, currentPage, itemsPerPage, showCheckboxes = false, hideAlbumColumn = false, folderName, isArtistDiscography = false, downloadedLyrics, failedLyrics, skippedLyrics, downloadingLyricsTrack, checkingAvailabilityTrack, availabilityMap, downloadedCovers, failedCovers, skippedCovers, downloadingCoverTrack, onToggleTrack, onToggleSelectAll, onDownloadTrack, onDownloadLyrics, onCheckAvailability, onDownloadCover, onPageChange, onAlbumClick, onArtistClick, onTrackClick, }: TrackListProps) {
-    const { playPreview, loadingPreview, playingTrack } = usePreview();
-    let filteredTracks = tracks.filter((track) => {
-        if (!searchQuery)
-            return true;
-        const query = searchQuery.toLowerCase();
-        return (track.name.toLowerCase().includes(query) ||
-            track.artists.toLowerCase().includes(query) ||
-            track.album_name.toLowerCase().includes(query));
-    });
+const playsFormatter = new Intl.NumberFormat();
+function formatPlays(plays: string | undefined) {
+    if (!plays)
+        return "";
+    const num = parseInt(plays, 10);
+    if (isNaN(num))
+        return plays;
+    return playsFormatter.format(num);
+}
+const SEARCH_DEBOUNCE_MS = 150;
+function sortTracks(tracks: TrackMetadata[], sortBy: string, downloadedTracks: Set<string>, failedTracks: Set<string>): TrackMetadata[] {
     if (sortBy === "title-asc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => a.name.localeCompare(b.name));
+        return [...tracks].sort((a, b) => a.name.localeCompare(b.name));
     }
     else if (sortBy === "title-desc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => b.name.localeCompare(a.name));
+        return [...tracks].sort((a, b) => b.name.localeCompare(a.name));
     }
     else if (sortBy === "artist-asc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => a.artists.localeCompare(b.artists));
+        return [...tracks].sort((a, b) => a.artists.localeCompare(b.artists));
     }
     else if (sortBy === "artist-desc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => b.artists.localeCompare(a.artists));
+        return [...tracks].sort((a, b) => b.artists.localeCompare(a.artists));
     }
     else if (sortBy === "duration-asc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => a.duration_ms - b.duration_ms);
+        return [...tracks].sort((a, b) => a.duration_ms - b.duration_ms);
     }
     else if (sortBy === "duration-desc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => b.duration_ms - a.duration_ms);
+        return [...tracks].sort((a, b) => b.duration_ms - a.duration_ms);
     }
     else if (sortBy === "plays-asc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => {
+        return [...tracks].sort((a, b) => {
             const aPlays = a.plays ? parseInt(a.plays, 10) : 0;
             const bPlays = b.plays ? parseInt(b.plays, 10) : 0;
             if (isNaN(aPlays))
@@ -93,7 +97,7 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
         });
     }
     else if (sortBy === "plays-desc") {
-        filteredTracks = [...filteredTracks].sort((a, b) => {
+        return [...tracks].sort((a, b) => {
             const aPlays = a.plays ? parseInt(a.plays, 10) : 0;
             const bPlays = b.plays ? parseInt(b.plays, 10) : 0;
             if (isNaN(aPlays))
@@ -104,26 +108,39 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
         });
     }
     else if (sortBy === "downloaded") {
-        filteredTracks = [...filteredTracks].sort((a, b) => {
+        return [...tracks].sort((a, b) => {
             const aDownloaded = a.spotify_id ? downloadedTracks.has(a.spotify_id) : false;
             const bDownloaded = b.spotify_id ? downloadedTracks.has(b.spotify_id) : false;
             return (bDownloaded ? 1 : 0) - (aDownloaded ? 1 : 0);
         });
     }
     else if (sortBy === "not-downloaded") {
-        filteredTracks = [...filteredTracks].sort((a, b) => {
+        return [...tracks].sort((a, b) => {
             const aDownloaded = a.spotify_id ? downloadedTracks.has(a.spotify_id) : false;
             const bDownloaded = b.spotify_id ? downloadedTracks.has(b.spotify_id) : false;
             return (aDownloaded ? 1 : 0) - (bDownloaded ? 1 : 0);
         });
     }
     else if (sortBy === "failed") {
-        filteredTracks = [...filteredTracks].sort((a, b) => {
+        return [...tracks].sort((a, b) => {
             const aFailed = a.spotify_id ? failedTracks.has(a.spotify_id) : false;
             const bFailed = b.spotify_id ? failedTracks.has(b.spotify_id) : false;
             return (bFailed ? 1 : 0) - (aFailed ? 1 : 0);
         });
     }
+    return tracks;
+}
+export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloadedTracks, failedTracks, skippedTracks, downloadingTracks, isDownloading, currentPage, itemsPerPage, showCheckboxes = false, hideAlbumColumn = false, folderName, isArtistDiscography = false, downloadedLyrics, failedLyrics, skippedLyrics, downloadingLyricsTrack, checkingAvailabilityTrack, availabilityMap, downloadedCovers, failedCovers, skippedCovers, downloadingCoverTrack, onToggleTrack, onToggleSelectAll, onDownloadTrack, onDownloadLyrics, onCheckAvailability, onDownloadCover, onPageChange, onAlbumClick, onArtistClick, onTrackClick, }: TrackListProps) {
+    const { playPreview, loadingPreview, playingTrack } = usePreview();
+    const debouncedSearchQuery = useDebouncedValue(searchQuery, SEARCH_DEBOUNCE_MS);
+    const searchBlobs = useMemo(() => tracks.map((track) => `${track.name}\x1f${track.artists}\x1f${track.album_name}`.toLowerCase()), [tracks]);
+    const matchingTracks = useMemo(() => {
+        if (!debouncedSearchQuery)
+            return tracks;
+        const query = debouncedSearchQuery.toLowerCase();
+        return tracks.filter((_, index) => searchBlobs[index].includes(query));
+    }, [tracks, searchBlobs, debouncedSearchQuery]);
+    const filteredTracks = useMemo(() => sortTracks(matchingTracks, sortBy, downloadedTracks, failedTracks), [matchingTracks, sortBy, downloadedTracks, failedTracks]);
     const totalPages = Math.ceil(filteredTracks.length / itemsPerPage);
     const startIndex = (currentPage - 1) * itemsPerPage;
     const endIndex = startIndex + itemsPerPage;
@@ -158,21 +175,9 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
         return pages;
     };
     const tracksWithId = filteredTracks.filter((track) => track.spotify_id);
+    const selectedTrackIds = new Set(selectedTracks);
     const allSelected = tracksWithId.length > 0 &&
-        tracksWithId.every((track) => selectedTracks.includes(track.spotify_id!));
-    const formatDuration = (ms: number) => {
-        const minutes = Math.floor(ms / 60000);
-        const seconds = Math.floor((ms % 60000) / 1000);
-        return `${minutes}:${seconds.toString().padStart(2, "0")}`;
-    };
-    const formatPlays = (plays: string | undefined) => {
-        if (!plays)
-            return "";
-        const num = parseInt(plays, 10);
-        if (isNaN(num))
-            return plays;
-        return num.toLocaleString();
-    };
+        tracksWithId.every((track) => selectedTrackIds.has(track.spotify_id!));
     const getAvailabilityButtonIcon = (spotifyId?: string) => {
         if (!spotifyId) {
             return <Globe className="h-4 w-4"/>;
@@ -221,7 +226,7 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
           <tbody>
             {paginatedTracks.map((track, index) => (<tr key={index} className="border-b transition-colors hover:bg-muted/50">
               {showCheckboxes && (<td className="p-4 align-middle">
-                {track.spotify_id && (<Checkbox checked={selectedTracks.includes(track.spotify_id)} onCheckedChange={() => onToggleTrack(track.spotify_id!)}/>)}
+                {track.spotify_id && (<Checkbox checked={selectedTrackIds.has(track.spotify_id)} onCheckedChange={() => onToggleTrack(track.spotify_id!)}/>)}
               </td>)}
               <td className="p-4 align-middle text-sm text-muted-foreground">
                 <div className="flex flex-col items-center gap-0.5">
@@ -239,7 +244,7 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
               </td>
               <td className="p-4 align-middle">
                 <div className="flex items-center gap-3">
-                  {track.images && (<img src={track.images} alt={track.name} className="w-10 h-10 rounded object-cover"/>)}
+                  {track.images && (<img src={track.images} alt={track.name} className="w-10 h-10 rounded object-cover" loading="lazy" decoding="async"/>)}
                   <div className="flex flex-col">
                     <div className="flex items-center gap-2">
                       {onTrackClick ? (<span className="font-medium cursor-pointer hover:underline" onClick={() => onTrackClick(track)}>
@@ -280,7 +285,7 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
                 </span>) : (track.album_name)}
               </td>)}
               <td className="p-4 align-middle text-sm text-muted-foreground hidden lg:table-cell">
-                {formatDuration(track.duration_ms)}
+                {formatDurationMs(track.duration_ms)}
               </td>
               <td className="p-4 align-middle text-sm text-muted-foreground hidden xl:table-cell">
                 {track.plays ? formatPlays(track.plays) : ""}
@@ -289,12 +294,12 @@ export function TrackList({ tracks, searchQuery, sortBy, selectedTracks, downloa
                 <div className="flex items-center justify-center gap-1">
                   {track.spotify_id && (<Tooltip>
                     <TooltipTrigger asChild>
-                      <Button onClick={() => onDownloadTrack(track.spotify_id!, track.name, track.artists, track.album_name, track.spotify_id, folderName, track.duration_ms, startIndex + index + 1, track.album_artist, track.release_date, track.images, track.track_number, track.disc_number, track.total_tracks, track.total_discs, track.copyright, track.publisher)} size="icon" disabled={isDownloading || downloadingTrack === track.spotify_id}>
-                        {downloadingTrack === track.spotify_id ? (<Spinner />) : skippedTracks.has(track.spotify_id) ? (<FileCheck className="h-4 w-4"/>) : downloadedTracks.has(track.spotify_id) ? (<CheckCircle className="h-4 w-4"/>) : failedTracks.has(track.spotify_id) ? (<XCircle className="h-4 w-4"/>) : (<Download className="h-4 w-4"/>)}
+                      <Button onClick={() => onDownloadTrack(track.spotify_id!, track.name, track.artists, track.album_name, track.spotify_id, folderName, track.duration_ms, startIndex + index + 1, track.album_artist, track.release_date, track.images, track.track_number, track.disc_number, track.total_tracks, track.total_discs, track.copyright, track.publisher)} size="icon" disabled={isDownloading || downloadingTracks.has(track.spotify_id)}>
+                        {downloadingTracks.has(track.spotify_id) ? (<Spinner />) : skippedTracks.has(track.spotify_id) ? (<FileCheck className="h-4 w-4"/>) : downloadedTracks.has(track.spotify_id) ? (<CheckCircle className="h-4 w-4"/>) : failedTracks.has(track.spotify_id) ? (<XCircle className="h-4 w-4"/>) : (<Download className="h-4 w-4"/>)}
                       </Button>
                     </TooltipTrigger>
                     <TooltipContent>
-                      {downloadingTrack === track.spotify_id ? (<p>Downloading...</p>) : skippedTracks.has(track.spotify_id) ? (<p>Already exists</p>) : downloadedTracks.has(track.spotify_id) ? (<p>Downloaded</p>) : failedTracks.has(track.spotify_id) ? (<p>Failed</p>) : (<p>Download Track</p>)}
+                      {downloadingTracks.has(track.spotify_id) ? (<p>Downloading...</p>) : skippedTracks.has(track.spotify_id) ? (<p>Already exists</p>) : downloadedTracks.has(track.spotify_id) ? (<p>Downloaded</p>) : failedTracks.has(track.spotify_id) ? (<p>Failed</p>) : (<p>Download Track</p>)}
                     </TooltipContent>
                   </Tooltip>)}
                   {track.spotify_id && (<Tooltip>
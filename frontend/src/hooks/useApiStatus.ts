@@ -1,5 +1,5 @@
 import { useEffect, useState } from "react";
-import { API_SOURCES, checkApiStatus, getApiStatusState, subscribeApiStatus, } from "@/lib/api-status";
+import { API_SOURCES, checkAllApiStatuses, checkApiStatus, getApiStatusState, subscribeApiStatus, } from "@/lib/api-status";
 export function useApiStatus() {
     const [state, setState] = useState(getApiStatusState);
     useEffect(() => {
@@ -11,5 +11,6 @@ export function useApiStatus() {
         ...state,
         sources: API_SOURCES,
         checkOne: (sourceId: string) => checkApiStatus(sourceId),
+        checkAll: () => checkAllApiStatuses(),
     };
 }
@@ -2,8 +2,9 @@ import { useState, useRef } from "react";
 import { downloadCover } from "@/lib/api";
 import { getSettings, parseTemplate, type TemplateData } from "@/lib/settings";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
-import { joinPath, sanitizePath, getFirstArtist } from "@/lib/utils";
+import { joinPath, sanitizePath, SLASH_PLACEHOLDER_PATTERN, getFirstArtist } from "@/lib/utils";
 import { logger } from "@/lib/logger";
+import { runWithConcurrency } from "@/lib/concurrency";
 import type { TrackMetadata } from "@/types/api";
 export function useCover() {
     const [downloadingCover, setDownloadingCover] = useState(false);
@@ -51,7 +52,7 @@ export function useCover() {
                 if (folderPath) {
                     const parts = folderPath.split("/").filter((p: string) => p.trim());
                     for (const part of parts) {
-                        const sanitizedPart = part.replace(new RegExp(placeholder, "g"), " ");
+                        const sanitizedPart = part.replace(SLASH_PLACEHOLDER_PATTERN, " ");
                         outputDir = joinPath(os, outputDir, sanitizePath(sanitizedPart, os));
                     }
                 }
@@ -111,16 +112,11 @@ export function useCover() {
         let success = 0;
         let skipped = 0;
         let failed = 0;
-        for (let i = 0; i < tracks.length; i++) {
-            if (stopBulkDownloadRef.current) {
-                toast.info("Cover download stopped");
-                break;
-            }
-            const track = tracks[i];
+        const downloadOne = async (track: TrackMetadata, i: number) => {
             if (!track.images) {
                 completed++;
                 setCoverDownloadProgress(Math.round((completed / tracks.length) * 100));
-                continue;
+                return;
             }
             const id = track.spotify_id || `${track.name}-${track.artists}`;
             setDownloadingCoverTrack(id);
@@ -153,7 +149,7 @@ export function useCover() {
                     if (folderPath) {
                         const parts = folderPath.split("/").filter((p: string) => p.trim());
                         for (const part of parts) {
-                            const sanitizedPart = part.replace(new RegExp(placeholder, "g"), " ");
+                            const sanitizedPart = part.replace(SLASH_PLACEHOLDER_PATTERN, " ");
                             outputDir = joinPath(os, outputDir, sanitizePath(sanitizedPart, os));
                         }
                     }
@@ -192,6 +188,10 @@ export function useCover() {
             }
             completed++;
             setCoverDownloadProgress(Math.round((completed / tracks.length) * 100));
+        };
+        const startedCount = await runWithConcurrency(tracks, settings.downloadConcurrency, downloadOne, () => stopBulkDownloadRef.current);
+        if (stopBulkDownloadRef.current && startedCount < tracks.length) {
+            toast.info("Cover download stopped");
         }
         setDownloadingCoverTrack(null);
         setIsBulkDownloadingCovers(false);
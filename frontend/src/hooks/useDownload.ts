@@ -2,9 +2,11 @@ import { useState, useRef } from "react";
 import { downloadTrack, fetchSpotifyMetadata } from "@/lib/api";
 import { getSettings, parseTemplate, type TemplateData } from "@/lib/settings";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
-import { joinPath, sanitizePath, getFirstArtist } from "@/lib/utils";
+import { joinPath, sanitizePath, SLASH_PLACEHOLDER_PATTERN, getFirstArtist } from "@/lib/utils";
 import { logger } from "@/lib/logger";
+import { runWithConcurrency } from "@/lib/concurrency";
 import type { TrackMetadata } from "@/types/api";
+import { AddToDownloadQueue, AddToDownloadQueueBatch, CancelAllQueuedItems, GetStreamingURLs, MarkDownloadItemFailed } from "../../wailsjs/go/main/App";
 interface CheckFileExistenceRequest {
     spotify_id: string;
     track_name: string;
@@ -30,7 +32,7 @@ interface FileExistenceResult {
     artist_name?: string;
 }
 const CheckFilesExistence = (outputDir: string, rootDir: string, tracks: CheckFileExistenceRequest[]): Promise<FileExistenceResult[]> => (window as any)["go"]["main"]["App"]["CheckFilesExistence"](outputDir, rootDir, tracks);
-const SkipDownloadItem = (itemID: string, filePath: string): Promise<void> => (window as any)["go"]["main"]["App"]["SkipDownloadItem"](itemID, filePath);
+const SkipDownloadItems = (filePaths: Record<string, string>): Promise<void> => (window as any)["go"]["main"]["App"]["SkipDownloadItems"](filePaths);
 const CreateM3U8File = (playlistName: string, outputDir: string, filePaths: string[]): Promise<void> => (window as any)["go"]["main"]["App"]["CreateM3U8File"](playlistName, outputDir, filePaths);
 const GetTrackISRC = (spotifyId: string): Promise<string> => (window as any)["go"]["main"]["App"]["GetTrackISRC"](spotifyId);
 async function resolveTemplateISRC(settings: {
@@ -65,11 +67,21 @@ function getTidalAudioFormat(settings: any, mode: "single" | "auto"): "LOSSLESS"
 function shouldFetchStreamingURLs(order: string[]): boolean {
     return order.includes("amazon") || order.includes("tidal");
 }
+async function fetchStreamingURLs(spotifyId: string, region: string): Promise<any> {
+    try {
+        const urlsJson = await GetStreamingURLs(spotifyId, region);
+        return JSON.parse(urlsJson);
+    }
+    catch (err) {
+        console.error("Failed to get streaming URLs:", err);
+        return null;
+    }
+}
 export function useDownload(region: string) {
     const [downloadProgress, setDownloadProgress] = useState<number>(0);
     const [downloadRemainingCount, setDownloadRemainingCount] = useState<number>(0);
     const [isDownloading, setIsDownloading] = useState(false);
-    const [downloadingTrack, setDownloadingTrack] = useState<string | null>(null);
+    const [downloadingTracks, setDownloadingTracks] = useState<Set<string>>(new Set());
     const [bulkDownloadType, setBulkDownloadType] = useState<"all" | "selected" | null>(null);
     const [downloadedTracks, setDownloadedTracks] = useState<Set<string>>(new Set());
     const [failedTracks, setFailedTracks] = useState<Set<string>>(new Set());
@@ -97,6 +109,7 @@ export function useDownload(region: string) {
         const placeholder = "__SLASH_PLACEHOLDER__";
         let finalReleaseDate = releaseDate;
         let finalTrackNumber = spotifyTrackNumber || 0;
+        const templateISRCPromise = resolveTemplateISRC(settings, spotifyId || id);
         if (spotifyId) {
             try {
                 const trackURL = `https://open.spotify.com/track/${spotifyId}`;
@@ -125,7 +138,7 @@ export function useDownload(region: string) {
         const displayAlbumArtist = settings.useFirstArtistOnly && albumArtist
             ? getFirstArtist(albumArtist)
             : albumArtist;
-        const resolvedTemplateISRC = await resolveTemplateISRC(settings, spotifyId || id);
+        const resolvedTemplateISRC = await templateISRCPromise;
         const templateData: TemplateData = {
             artist: displayArtist?.replace(/\//g, placeholder),
             album: albumName?.replace(/\//g, placeholder),
@@ -147,7 +160,7 @@ export function useDownload(region: string) {
             if (folderPath) {
                 const parts = folderPath.split("/").filter((p: string) => p.trim());
                 for (const part of parts) {
-                    const sanitizedPart = part.replace(new RegExp(placeholder, "g"), " ");
+                    const sanitizedPart = part.replace(SLASH_PLACEHOLDER_PATTERN, " ");
                     outputDir = joinPath(os, outputDir, sanitizePath(sanitizedPart, os));
                 }
             }
@@ -187,7 +200,6 @@ export function useDownload(region: string) {
                 console.warn("File existence check failed:", err);
             }
         }
-        const { AddToDownloadQueue } = await import("../../wailsjs/go/main/App");
         let itemID: string | undefined;
         if (!fileExists) {
             itemID = await AddToDownloadQueue(id, trackName || "", displayArtist || "", albumName || "");
@@ -196,14 +208,7 @@ export function useDownload(region: string) {
             const order = (settings.autoOrder || "tidal-amazon-qobuz").split("-");
             let streamingURLs: any = null;
             if (spotifyId && shouldFetchStreamingURLs(order)) {
-                try {
-                    const { GetStreamingURLs } = await import("../../wailsjs/go/main/App");
-                    const urlsJson = await GetStreamingURLs(spotifyId, region);
-                    streamingURLs = JSON.parse(urlsJson);
-                }
-                catch (err) {
-                    console.error("Failed to get streaming URLs:", err);
-                }
+                streamingURLs = await fetchStreamingURLs(spotifyId, region);
             }
             const durationSeconds = durationMs ? Math.round(durationMs / 1000) : undefined;
             let lastResponse: any = { success: false, error: "No matching services found" };
@@ -359,7 +364,6 @@ export function useDownload(region: string) {
                 }
             }
             if (itemID) {
-                const { MarkDownloadItemFailed } = await import("../../wailsjs/go/main/App");
                 const finalError = fallbackErrors.length > 0 ? fallbackErrors.join(" | ") : (lastResponse.error || "All services failed");
                 await MarkDownloadItemFailed(itemID, finalError);
             }
@@ -410,7 +414,6 @@ export function useDownload(region: string) {
             embed_genre: settings.embedGenre,
         });
         if (!singleServiceResponse.success && itemID) {
-            const { MarkDownloadItemFailed } = await import("../../wailsjs/go/main/App");
             await MarkDownloadItemFailed(itemID, singleServiceResponse.error || "Download failed");
         }
         return singleServiceResponse;
@@ -424,6 +427,11 @@ export function useDownload(region: string) {
         const placeholder = "__SLASH_PLACEHOLDER__";
         let finalReleaseDate = releaseDate;
         let finalTrackNumber = spotifyTrackNumber || 0;
+        const templateISRCPromise = resolveTemplateISRC(settings, spotifyId);
+        const autoOrder = (settings.autoOrder || "tidal-amazon-qobuz").split("-");
+        const streamingURLsPromise = service === "auto" && spotifyId && shouldFetchStreamingURLs(autoOrder)
+            ? fetchStreamingURLs(spotifyId, region)
+            : null;
         if (spotifyId) {
             try {
                 const trackURL = `https://open.spotify.com/track/${spotifyId}`;
@@ -449,7 +457,7 @@ export function useDownload(region: string) {
         const displayAlbumArtist = settings.useFirstArtistOnly && albumArtist
             ? getFirstArtist(albumArtist)
             : albumArtist;
-        const resolvedTemplateISRC = await resolveTemplateISRC(settings, spotifyId);
+        const resolvedTemplateISRC = await templateISRCPromise;
         const templateData: TemplateData = {
             artist: displayArtist?.replace(/\//g, placeholder),
             album: albumName?.replace(/\//g, placeholder),
@@ -471,24 +479,14 @@ export function useDownload(region: string) {
             if (folderPath) {
                 const parts = folderPath.split("/").filter(p => p.trim());
                 for (const part of parts) {
-                    const sanitizedPart = part.replace(new RegExp(placeholder, "g"), " ");
+                    const sanitizedPart = part.replace(SLASH_PLACEHOLDER_PATTERN, " ");
                     outputDir = joinPath(os, outputDir, sanitizePath(sanitizedPart, os));
                 }
             }
         }
         if (service === "auto") {
-            const order = (settings.autoOrder || "tidal-amazon-qobuz").split("-");
-            let streamingURLs: any = null;
-            if (spotifyId && shouldFetchStreamingURLs(order)) {
-                try {
-                    const { GetStreamingURLs } = await import("../../wailsjs/go/main/App");
-                    const urlsJson = await GetStreamingURLs(spotifyId, region);
-                    streamingURLs = JSON.parse(urlsJson);
-                }
-                catch (err) {
-                    console.error("Failed to get streaming URLs:", err);
-                }
-            }
+            const order = autoOrder;
+            const streamingURLs = streamingURLsPromise ? await streamingURLsPromise : null;
             const durationSeconds = durationMs ? Math.round(durationMs / 1000) : undefined;
             let lastResponse: any = { success: false, error: "No matching services found" };
             const fallbackErrors: string[] = [];
@@ -645,7 +643,6 @@ export function useDownload(region: string) {
                 }
             }
             if (!lastResponse.success && itemID) {
-                const { MarkDownloadItemFailed } = await import("../../wailsjs/go/main/App");
                 const finalError = fallbackErrors.length > 0 ? fallbackErrors.join(" | ") : (lastResponse.error || "All services failed");
                 await MarkDownloadItemFailed(itemID, finalError);
             }
@@ -691,11 +688,20 @@ export function useDownload(region: string) {
             embed_genre: settings.embedGenre,
         });
         if (!singleServiceResponse.success && itemID) {
-            const { MarkDownloadItemFailed } = await import("../../wailsjs/go/main/App");
             await MarkDownloadItemFailed(itemID, singleServiceResponse.error || "Download failed");
         }
         return singleServiceResponse;
     };
+    const addDownloadingTrack = (id: string) => {
+        setDownloadingTracks((prev) => new Set(prev).add(id));
+    };
+    const removeDownloadingTrack = (id: string) => {
+        setDownloadingTracks((prev) => {
+            const newSet = new Set(prev);
+            newSet.delete(id);
+            return newSet;
+        });
+    };
     const handleDownloadTrack = async (id: string, trackName?: string, artistName?: string, albumName?: string, spotifyId?: string, playlistName?: string, durationMs?: number, position?: number, albumArtist?: string, releaseDate?: string, coverUrl?: string, spotifyTrackNumber?: number, spotifyDiscNumber?: number, spotifyTotalTracks?: number, spotifyTotalDiscs?: number, copyright?: string, publisher?: string) => {
         if (!id) {
             toast.error("No ID found for this track");
@@ -704,7 +710,7 @@ export function useDownload(region: string) {
         const settings = getSettings();
         const displayArtist = settings.useFirstArtistOnly && artistName ? getFirstArtist(artistName) : artistName;
         logger.info(`starting download: ${trackName} - ${displayArtist}`);
-        setDownloadingTrack(id);
+        addDownloadingTrack(id);
         try {
             const releaseYear = releaseDate?.substring(0, 4);
             const response = await downloadWithAutoFallback(id, settings, trackName, artistName, albumName, playlistName, position, spotifyId, durationMs, releaseYear, albumArtist || "", releaseDate, coverUrl, spotifyTrackNumber, spotifyDiscNumber, spotifyTotalTracks, spotifyTotalDiscs, copyright, publisher);
@@ -733,9 +739,22 @@ export function useDownload(region: string) {
             setFailedTracks((prev) => new Set(prev).add(id));
         }
         finally {
-            setDownloadingTrack(null);
+            removeDownloadingTrack(id);
         }
     };
+    const markTracksExisting = (ids: string[], skippedItemPaths: Record<string, string>) => {
+        if (ids.length === 0)
+            return;
+        setTimeout(() => SkipDownloadItems(skippedItemPaths), 10);
+        const addAll = (prev: Set<string>) => {
+            const next = new Set(prev);
+            for (const id of ids)
+                next.add(id);
+            return next;
+        };
+        setSkippedTracks(addAll);
+        setDownloadedTracks(addAll);
+    };
     const handleDownloadSelected = async (selectedTracks: string[], allTracks: TrackMetadata[], folderName?: string, isAlbum?: boolean) => {
         if (selectedTracks.length === 0) {
             toast.error("No tracks selected");
@@ -754,8 +773,20 @@ export function useDownload(region: string) {
         if (settings.createPlaylistFolder && folderName && (!isAlbum || !useAlbumTag)) {
             outputDir = joinPath(os, outputDir, sanitizePath(folderName.replace(/\//g, " "), os));
         }
+        const tracksById = new Map<string, TrackMetadata>();
+        for (const track of allTracks) {
+            if (track.spotify_id && !tracksById.has(track.spotify_id)) {
+                tracksById.set(track.spotify_id, track);
+            }
+        }
+        const selectedIndexById = new Map<string, number>();
+        selectedTracks.forEach((id, index) => {
+            if (!selectedIndexById.has(id)) {
+                selectedIndexById.set(id, index);
+            }
+        });
         const selectedTrackObjects = selectedTracks
-            .map((id) => allTracks.find((t) => t.spotify_id === id))
+            .map((id) => tracksById.get(id))
             .filter((t): t is TrackMetadata => t !== undefined);
         logger.info(`checking existing files in parallel...`);
         const useAlbumTrackNumber = settings.folderTemplate?.includes("{album}") || false;
@@ -791,23 +822,26 @@ export function useDownload(region: string) {
             }
         }
         logger.info(`found ${existingSpotifyIDs.size} existing files`);
-        const { AddToDownloadQueue } = await import("../../wailsjs/go/main/App");
-        const itemIDs: string[] = [];
-        for (const id of selectedTracks) {
-            const track = allTracks.find((t) => t.spotify_id === id);
-            if (!track)
-                continue;
-            const trackID = track.spotify_id || id;
-            const displayArtist = settings.useFirstArtistOnly && track.artists ? getFirstArtist(track.artists) : track.artists;
-            const itemID = await AddToDownloadQueue(trackID, track.name || "", displayArtist || "", track.album_name || "");
-            itemIDs.push(itemID);
+        const queuedTracks = selectedTracks.flatMap((id) => {
+            const track = tracksById.get(id);
+            return track ? [{ id, track, trackID: track.spotify_id || id }] : [];
+        });
+        const itemIDs = await AddToDownloadQueueBatch(queuedTracks.map(({ track, trackID }) => ({
+            spotify_id: trackID,
+            track_name: track.name || "",
+            artist_name: (settings.useFirstArtistOnly && track.artists ? getFirstArtist(track.artists) : track.artists) || "",
+            album_name: track.album_name || "",
+        })));
+        const existingIDs: string[] = [];
+        const skippedItemPaths: Record<string, string> = {};
+        for (let i = 0; i < queuedTracks.length; i++) {
+            const { id, trackID } = queuedTracks[i];
             if (existingSpotifyIDs.has(trackID)) {
-                const filePath = existingFilePaths.get(trackID) || "";
-                setTimeout(() => SkipDownloadItem(itemID, filePath), 10);
-                setSkippedTracks((prev) => new Set(prev).add(id));
-                setDownloadedTracks((prev) => new Set(prev).add(id));
+                skippedItemPaths[itemIDs[i]] = existingFilePaths.get(trackID) || "";
+                existingIDs.push(id);
             }
         }
+        markTracksExisting(existingIDs, skippedItemPaths);
         const tracksToDownload = selectedTrackObjects.filter((track) => {
             const trackID = track.spotify_id || "";
             return !existingSpotifyIDs.has(trackID);
@@ -817,16 +851,11 @@ export function useDownload(region: string) {
         let skippedCount = existingSpotifyIDs.size;
         const total = selectedTracks.length;
         updateBatchProgress(skippedCount, total);
-        for (let i = 0; i < tracksToDownload.length; i++) {
-            if (shouldStopDownloadRef.current) {
-                toast.info(`Download stopped. ${successCount} tracks downloaded, ${tracksToDownload.length - i} remaining.`);
-                break;
-            }
-            const track = tracksToDownload[i];
+        const downloadOne = async (track: TrackMetadata) => {
             const id = track.spotify_id || "";
-            const originalIndex = selectedTracks.indexOf(id);
+            const originalIndex = selectedIndexById.get(id) ?? -1;
             const itemID = itemIDs[originalIndex];
-            setDownloadingTrack(id);
+            addDownloadingTrack(id);
             const displayArtist = settings.useFirstArtistOnly && track.artists ? getFirstArtist(track.artists) : track.artists;
             setCurrentDownloadInfo({ name: track.name, artists: displayArtist || "" });
             try {
@@ -864,20 +893,23 @@ export function useDownload(region: string) {
                 logger.error(`error: ${track.name} - ${err}`);
                 setFailedTracks((prev) => new Set(prev).add(id));
                 if (itemID) {
-                    const { MarkDownloadItemFailed } = await import("../../wailsjs/go/main/App");
                     await MarkDownloadItemFailed(itemID, err instanceof Error ? err.message : String(err));
                 }
             }
+            removeDownloadingTrack(id);
             const completedCount = skippedCount + successCount + errorCount;
             updateBatchProgress(completedCount, total);
+        };
+        const startedCount = await runWithConcurrency(tracksToDownload, settings.downloadConcurrency, downloadOne, () => shouldStopDownloadRef.current);
+        if (shouldStopDownloadRef.current && startedCount < tracksToDownload.length) {
+            toast.info(`Download stopped. ${successCount} tracks downloaded, ${tracksToDownload.length - startedCount} remaining.`);
         }
-        setDownloadingTrack(null);
+        setDownloadingTracks(new Set());
         setCurrentDownloadInfo(null);
         setIsDownloading(false);
         setBulkDownloadType(null);
         updateBatchProgress(0, 0);
         shouldStopDownloadRef.current = false;
-        const { CancelAllQueuedItems } = await import("../../wailsjs/go/main/App");
         await CancelAllQueuedItems();
         if (settings.createM3u8File && folderName) {
             const paths = selectedTrackObjects.map((t) => finalFilePaths.get(t.spotify_id || "") || "").filter((p) => p !== "");
@@ -967,20 +999,22 @@ export function useDownload(region: string) {
             }
         }
         logger.info(`found ${existingSpotifyIDs.size} existing files`);
-        const { AddToDownloadQueue } = await import("../../wailsjs/go/main/App");
-        const itemIDs: string[] = [];
-        for (const track of tracksWithId) {
-            const displayArtist = settings.useFirstArtistOnly && track.artists ? getFirstArtist(track.artists) : track.artists;
-            const itemID = await AddToDownloadQueue(track.spotify_id || "", track.name || "", displayArtist || "", track.album_name || "");
-            itemIDs.push(itemID);
-            const trackID = track.spotify_id || "";
+        const itemIDs = await AddToDownloadQueueBatch(tracksWithId.map((track) => ({
+            spotify_id: track.spotify_id || "",
+            track_name: track.name || "",
+            artist_name: (settings.useFirstArtistOnly && track.artists ? getFirstArtist(track.artists) : track.artists) || "",
+            album_name: track.album_name || "",
+        })));
+        const existingIDs: string[] = [];
+        const skippedItemPaths: Record<string, string> = {};
+        for (let i = 0; i < tracksWithId.length; i++) {
+            const trackID = tracksWithId[i].spotify_id || "";
             if (existingSpotifyIDs.has(trackID)) {
-                const filePath = existingFilePaths.get(trackID) || "";
-                setTimeout(() => SkipDownloadItem(itemID, filePath), 10);
-                setSkippedTracks((prev: Set<string>) => new Set(prev).add(trackID));
-                setDownloadedTracks((prev: Set<string>) => new Set(prev).add(trackID));
+                skippedItemPaths[itemIDs[i]] = existingFilePaths.get(trackID) || "";
+                existingIDs.push(trackID);
             }
         }
+        markTracksExisting(existingIDs, skippedItemPaths);
         const tracksToDownload = tracksWithId.filter((track) => {
             const trackID = track.spotify_id || "";
             return !existingSpotifyIDs.has(trackID);
@@ -990,16 +1024,18 @@ export function useDownload(region: string) {
         let skippedCount = existingSpotifyIDs.size;
         const total = tracksWithId.length;
         updateBatchProgress(skippedCount, total);
-        for (let i = 0; i < tracksToDownload.length; i++) {
-            if (shouldStopDownloadRef.current) {
-                toast.info(`Download stopped. ${successCount} tracks downloaded, ${tracksToDownload.length - i} remaining.`);
-                break;
+        const indexById = new Map<string, number>();
+        tracksWithId.forEach((track, index) => {
+            const trackID = track.spotify_id || "";
+            if (!indexById.has(trackID)) {
+                indexById.set(trackID, index);
             }
-            const track = tracksToDownload[i];
-            const originalIndex = tracksWithId.findIndex((t) => t.spotify_id === track.spotify_id);
+        });
+        const downloadOne = async (track: TrackMetadata) => {
+            const originalIndex = indexById.get(track.spotify_id || "") ?? -1;
             const itemID = itemIDs[originalIndex];
             const trackId = track.spotify_id || "";
-            setDownloadingTrack(trackId);
+            addDownloadingTrack(trackId);
             const displayArtist = settings.useFirstArtistOnly && track.artists ? getFirstArtist(track.artists) : track.artists;
             setCurrentDownloadInfo({ name: track.name || "", artists: displayArtist || "" });
             try {
@@ -1035,20 +1071,23 @@ export function useDownload(region: string) {
                 errorCount++;
                 logger.error(`error: ${track.name} - ${err}`);
                 setFailedTracks((prev) => new Set(prev).add(trackId));
-                const { MarkDownloadItemFailed } = await import("../../wailsjs/go/main/App");
                 await MarkDownloadItemFailed(itemID, err instanceof Error ? err.message : String(err));
             }
+            removeDownloadingTrack(trackId);
             const completedCount = skippedCount + successCount + errorCount;
             updateBatchProgress(completedCount, total);
+        };
+        const startedCount = await runWithConcurrency(tracksToDownload, settings.downloadConcurrency, downloadOne, () => shouldStopDownloadRef.current);
+        if (shouldStopDownloadRef.current && startedCount < tracksToDownload.length) {
+            toast.info(`Download stopped. ${successCount} tracks downloaded, ${tracksToDownload.length - startedCount} remaining.`);
         }
-        setDownloadingTrack(null);
+        setDownloadingTracks(new Set());
         setCurrentDownloadInfo(null);
         setIsDownloading(false);
         setBulkDownloadType(null);
         updateBatchProgress(0, 0);
         shouldStopDownloadRef.current = false;
-        const { CancelAllQueuedItems: CancelQueued } = await import("../../wailsjs/go/main/App");
-        await CancelQueued();
+        await CancelAllQueuedItems();
         if (settings.createM3u8File && folderName) {
             try {
                 logger.info(`creating m3u8 playlist: ${folderName}`);
@@ -1094,7 +1133,7 @@ export function useDownload(region: string) {
         downloadProgress,
         downloadRemainingCount,
         isDownloading,
-        downloadingTrack,
+        downloadingTracks,
         bulkDownloadType,
         downloadedTracks,
         failedTracks,
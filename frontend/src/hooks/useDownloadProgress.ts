@@ -1,34 +1,21 @@
-import { useState, useEffect, useRef } from "react";
+import { useSyncExternalStore } from "react";
 import { GetDownloadProgress } from "../../wailsjs/go/main/App";
+import { createQueueChangeStore } from "@/lib/queue-change-store";
 export interface DownloadProgressInfo {
     is_downloading: boolean;
     mb_downloaded: number;
     speed_mbps: number;
 }
+function isSameDisplayedProgress(a: DownloadProgressInfo, b: DownloadProgressInfo): boolean {
+    return a.is_downloading === b.is_downloading &&
+        a.mb_downloaded.toFixed(2) === b.mb_downloaded.toFixed(2) &&
+        a.speed_mbps.toFixed(2) === b.speed_mbps.toFixed(2);
+}
+const progressStore = createQueueChangeStore<DownloadProgressInfo>(GetDownloadProgress, {
+    is_downloading: false,
+    mb_downloaded: 0,
+    speed_mbps: 0,
+}, isSameDisplayedProgress, "download progress");
 export function useDownloadProgress() {
-    const [progress, setProgress] = useState<DownloadProgressInfo>({
-        is_downloading: false,
-        mb_downloaded: 0,
-        speed_mbps: 0,
-    });
-    const intervalRef = useRef<number | null>(null);
-    useEffect(() => {
-        const pollProgress = async () => {
-            try {
-                const progressInfo = await GetDownloadProgress();
-                setProgress(progressInfo);
-            }
-            catch (error) {
-                console.error("Failed to get download progress:", error);
-            }
-        };
-        intervalRef.current = window.setInterval(pollProgress, 200);
-        pollProgress();
-        return () => {
-            if (intervalRef.current) {
-                clearInterval(intervalRef.current);
-            }
-        };
-    }, []);
-    return progress;
+    return useSyncExternalStore(progressStore.subscribe, progressStore.getSnapshot);
 }
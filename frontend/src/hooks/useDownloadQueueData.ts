@@ -1,31 +1,56 @@
-import { useEffect, useState } from "react";
-import { GetDownloadQueue } from "../../wailsjs/go/main/App";
+import { useSyncExternalStore } from "react";
+import { GetDownloadQueue, GetDownloadQueueSummary } from "../../wailsjs/go/main/App";
 import { backend } from "../../wailsjs/go/models";
+import { createQueueChangeStore } from "@/lib/queue-change-store";
+function isSameQueueSummary(a: backend.DownloadQueueInfo, b: backend.DownloadQueueInfo): boolean {
+    return a.is_downloading === b.is_downloading &&
+        a.current_speed === b.current_speed &&
+        a.total_downloaded === b.total_downloaded &&
+        a.session_start_time === b.session_start_time &&
+        a.session_elapsed === b.session_elapsed &&
+        a.queued_count === b.queued_count &&
+        a.downloading_count === b.downloading_count &&
+        a.completed_count === b.completed_count &&
+        a.failed_count === b.failed_count &&
+        a.skipped_count === b.skipped_count &&
+        a.estimated_seconds === b.estimated_seconds;
+}
+function isSameQueueItem(a: backend.DownloadItem, b: backend.DownloadItem): boolean {
+    return a.id === b.id &&
+        a.status === b.status &&
+        a.progress === b.progress &&
+        a.speed === b.speed &&
+        a.end_time === b.end_time &&
+        a.error_message === b.error_message &&
+        a.file_path === b.file_path;
+}
+function isSameQueue(a: backend.DownloadQueueInfo, b: backend.DownloadQueueInfo): boolean {
+    return isSameQueueSummary(a, b) &&
+        a.queue.length === b.queue.length &&
+        a.queue.every((item, i) => isSameQueueItem(item, b.queue[i]));
+}
+const emptyQueueInfo = new backend.DownloadQueueInfo({
+    is_downloading: false,
+    queue: [],
+    current_speed: 0,
+    total_downloaded: 0,
+    session_start_time: 0,
+    session_elapsed: 0,
+    queued_count: 0,
+    downloading_count: 0,
+    completed_count: 0,
+    failed_count: 0,
+    skipped_count: 0,
+    estimated_seconds: 0,
+});
+const queueSummaryStore = createQueueChangeStore<backend.DownloadQueueInfo>(GetDownloadQueueSummary, emptyQueueInfo, isSameQueueSummary, "download queue");
+const queueStore = createQueueChangeStore<backend.DownloadQueueInfo>(GetDownloadQueue, emptyQueueInfo, isSameQueue, "download queue");
+const subscribeNone = () => () => { };
 export function useDownloadQueueData() {
-    const [queueInfo, setQueueInfo] = useState<backend.DownloadQueueInfo>(new backend.DownloadQueueInfo({
-        is_downloading: false,
-        queue: [],
-        current_speed: 0,
-        total_downloaded: 0,
-        session_start_time: 0,
-        queued_count: 0,
-        completed_count: 0,
-        failed_count: 0,
-        skipped_count: 0,
-    }));
-    useEffect(() => {
-        const fetchQueue = async () => {
-            try {
-                const info = await GetDownloadQueue();
-                setQueueInfo(info);
-            }
-            catch (error) {
-                console.error("Failed to get download queue:", error);
-            }
-        };
-        fetchQueue();
-        const interval = setInterval(fetchQueue, 200);
-        return () => clearInterval(interval);
-    }, []);
-    return queueInfo;
+    return useSyncExternalStore(queueSummaryStore.subscribe, queueSummaryStore.getSnapshot);
+}
+// useDownloadQueueItems includes the per-item list, so it only watches the
+// queue while active (the queue dialog is open).
+export function useDownloadQueueItems(active: boolean) {
+    return useSyncExternalStore(active ? queueStore.subscribe : subscribeNone, queueStore.getSnapshot);
 }
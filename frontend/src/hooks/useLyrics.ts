@@ -2,8 +2,9 @@ import { useState, useRef } from "react";
 import { downloadLyrics } from "@/lib/api";
 import { getSettings, parseTemplate, type TemplateData } from "@/lib/settings";
 import { toastWithSound as toast } from "@/lib/toast-with-sound";
-import { joinPath, sanitizePath, getFirstArtist } from "@/lib/utils";
+import { joinPath, sanitizePath, SLASH_PLACEHOLDER_PATTERN, getFirstArtist } from "@/lib/utils";
 import { logger } from "@/lib/logger";
+import { runWithConcurrency } from "@/lib/concurrency";
 import type { TrackMetadata } from "@/types/api";
 const GetTrackISRC = (spotifyId: string): Promise<string> => (window as any)["go"]["main"]["App"]["GetTrackISRC"](spotifyId);
 async function resolveTemplateISRC(settings: {
@@ -74,7 +75,7 @@ export function useLyrics() {
                 if (folderPath) {
                     const parts = folderPath.split("/").filter((p: string) => p.trim());
                     for (const part of parts) {
-                        const sanitizedPart = part.replace(new RegExp(placeholder, "g"), " ");
+                        const sanitizedPart = part.replace(SLASH_PLACEHOLDER_PATTERN, " ");
                         outputDir = joinPath(os, outputDir, sanitizePath(sanitizedPart, os));
                     }
                 }
@@ -138,12 +139,7 @@ export function useLyrics() {
         let failed = 0;
         let skipped = 0;
         const total = tracksWithSpotifyId.length;
-        for (let i = 0; i < tracksWithSpotifyId.length; i++) {
-            const track = tracksWithSpotifyId[i];
-            if (stopBulkDownloadRef.current) {
-                toast.info("Lyrics download stopped by user");
-                break;
-            }
+        const downloadOne = async (track: TrackMetadata, i: number) => {
             const id = track.spotify_id!;
             setDownloadingLyricsTrack(id);
             setLyricsDownloadProgress(Math.round((completed / total) * 100));
@@ -178,7 +174,7 @@ export function useLyrics() {
                     if (folderPath) {
                         const parts = folderPath.split("/").filter((p: string) => p.trim());
                         for (const part of parts) {
-                            const sanitizedPart = part.replace(new RegExp(placeholder, "g"), " ");
+                            const sanitizedPart = part.replace(SLASH_PLACEHOLDER_PATTERN, " ");
                             outputDir = joinPath(os, outputDir, sanitizePath(sanitizedPart, os));
                         }
                     }
@@ -224,6 +220,10 @@ export function useLyrics() {
                 setFailedLyrics((prev) => new Set(prev).add(id));
             }
             completed++;
+        };
+        const startedCount = await runWithConcurrency(tracksWithSpotifyId, settings.downloadConcurrency, downloadOne, () => stopBulkDownloadRef.current);
+        if (stopBulkDownloadRef.current && startedCount < total) {
+            toast.info("Lyrics download stopped by user");
         }
         setDownloadingLyricsTrack(null);
         setIsBulkDownloadingLyrics(false);
@@ -5,6 +5,7 @@ import { logger } from "@/lib/logger";
 import { AddFetchHistory, SearchSpotifyByType } from "../../wailsjs/go/main/App";
 import { EventsOff, EventsOn } from "../../wailsjs/runtime/runtime";
 import type { SpotifyMetadataResponse } from "@/types/api";
+const METADATA_STREAM_FLUSH_INTERVAL_MS = 100;
 export function useMetadata() {
     const [loading, setLoading] = useState(false);
     const [metadata, setMetadata] = useState<SpotifyMetadataResponse | null>(null);
@@ -13,6 +14,8 @@ export function useMetadata() {
     const loadingToastId = useRef<string | number | null>(null);
     const fetchedCount = useRef(0);
     const currentName = useRef("");
+    const pendingStreamTracks = useRef<any[]>([]);
+    const streamFlushTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
     const [showAlbumDialog, setShowAlbumDialog] = useState(false);
     const [selectedAlbum, setSelectedAlbum] = useState<{
         id: string;
@@ -52,49 +55,68 @@ export function useMetadata() {
             loadingToastId.current = null;
         }
     }, [loading]);
+    const discardPendingStreamTracks = () => {
+        if (streamFlushTimer.current !== null) {
+            clearTimeout(streamFlushTimer.current);
+            streamFlushTimer.current = null;
+        }
+        pendingStreamTracks.current = [];
+    };
     useEffect(() => {
+        const flushPendingTracks = () => {
+            const tracks = pendingStreamTracks.current;
+            discardPendingStreamTracks();
+            if (tracks.length === 0) {
+                return;
+            }
+            if (loadingToastId.current && currentName.current) {
+                toast.silentInfo(`fetching tracks for ${currentName.current.toLowerCase()}...`, {
+                    id: loadingToastId.current,
+                    description: `${fetchedCount.current.toLocaleString()} tracks fetched`
+                });
+            }
+            setMetadata(prev => {
+                if (!prev || !("track_list" in prev)) {
+                    return prev;
+                }
+                return {
+                    ...prev,
+                    track_list: prev.track_list.concat(tracks)
+                };
+            });
+        };
         const handler = (data: any) => {
             if (!data) {
                 return;
             }
             if (Array.isArray(data)) {
                 fetchedCount.current += data.length;
-                if (loadingToastId.current && currentName.current) {
-                    toast.silentInfo(`fetching tracks for ${currentName.current.toLowerCase()}...`, {
+                for (const track of data) {
+                    pendingStreamTracks.current.push(track);
+                }
+                if (streamFlushTimer.current === null) {
+                    streamFlushTimer.current = setTimeout(flushPendingTracks, METADATA_STREAM_FLUSH_INTERVAL_MS);
+                }
+                return;
+            }
+            flushPendingTracks();
+            const baseInfo = data;
+            const name = "artist_info" in baseInfo ? baseInfo.artist_info.name :
+                "album_info" in baseInfo ? baseInfo.album_info.name :
+                    "playlist_info" in baseInfo ? (baseInfo.playlist_info.name || baseInfo.playlist_info.owner.name) : "";
+            if (name) {
+                currentName.current = name;
+                if (loadingToastId.current) {
+                    toast.silentInfo(`fetching tracks for ${name.toLowerCase()}...`, {
                         id: loadingToastId.current,
                         description: `${fetchedCount.current.toLocaleString()} tracks fetched`
                     });
                 }
             }
-            else {
-                const baseInfo = data;
-                const name = "artist_info" in baseInfo ? baseInfo.artist_info.name :
-                    "album_info" in baseInfo ? baseInfo.album_info.name :
-                        "playlist_info" in baseInfo ? (baseInfo.playlist_info.name || baseInfo.playlist_info.owner.name) : "";
-                if (name) {
-                    currentName.current = name;
-                    if (loadingToastId.current) {
-                        toast.silentInfo(`fetching tracks for ${name.toLowerCase()}...`, {
-                            id: loadingToastId.current,
-                            description: `${fetchedCount.current.toLocaleString()} tracks fetched`
-                        });
-                    }
-                }
-            }
             setMetadata(prev => {
-                if (Array.isArray(data)) {
-                    if (!prev || !("track_list" in prev)) {
-                        return prev;
-                    }
-                    return {
-                        ...prev,
-                        track_list: [...prev.track_list, ...data]
-                    };
-                }
                 if (prev && "track_list" in prev && prev.track_list.length > 0) {
                     return prev;
                 }
-                const baseInfo = data;
                 if (!("track_list" in baseInfo)) {
                     baseInfo.track_list = [];
                 }
@@ -102,7 +124,10 @@ export function useMetadata() {
             });
         };
         EventsOn("metadata-stream", handler);
-        return () => EventsOff("metadata-stream");
+        return () => {
+            EventsOff("metadata-stream");
+            discardPendingStreamTracks();
+        };
     }, []);
     const getUrlType = (url: string): string => {
         if (url.includes("/track/"))
@@ -171,6 +196,7 @@ export function useMetadata() {
         logger.info(`fetching ${urlType} metadata...`);
         logger.debug(`url: ${url}`);
         setLoading(true);
+        discardPendingStreamTracks();
         setMetadata(null);
         try {
             const startTime = Date.now();
@@ -195,6 +221,7 @@ export function useMetadata() {
                     return;
                 }
             }
+            discardPendingStreamTracks();
             setMetadata(data);
             saveToHistory(url, data);
             if ("track" in data) {
@@ -229,6 +256,7 @@ export function useMetadata() {
     const loadFromCache = (cachedData: string) => {
         try {
             const data = JSON.parse(cachedData);
+            discardPendingStreamTracks();
             setMetadata(data);
             toast.success("Loaded from cache");
         }
@@ -238,12 +266,12 @@ export function useMetadata() {
         }
     };
     const handleFetchMetadata = async (url: string) => {
-        if (!url.trim()) {
+        let urlToFetch = url.trim();
+        if (!urlToFetch) {
             logger.warning("empty url provided");
             toast.error("Please enter a Spotify URL");
             return;
         }
-        let urlToFetch = url.trim();
         const isArtistUrl = urlToFetch.includes("/artist/");
         if (isArtistUrl && !urlToFetch.includes("/discography")) {
             urlToFetch = urlToFetch.replace(/\/$/, "") + "/discography/all";
@@ -294,6 +322,7 @@ export function useMetadata() {
         logger.debug(`url: ${albumUrl}`);
         setShowAlbumDialog(false);
         setLoading(true);
+        discardPendingStreamTracks();
         setMetadata(null);
         try {
             const startTime = Date.now();
@@ -309,6 +338,7 @@ export function useMetadata() {
                     return albumUrl;
                 }
             }
+            discardPendingStreamTracks();
             setMetadata(data);
             saveToHistory(albumUrl, data);
             if ("album_info" in data) {
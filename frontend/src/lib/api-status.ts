@@ -1,4 +1,4 @@
-import { CheckAPIStatus } from "../../wailsjs/go/main/App";
+import { CheckAPIStatus, CheckAPIStatuses } from "../../wailsjs/go/main/App";
 import { CHECK_TIMEOUT_MS, withTimeout } from "@/lib/async-timeout";
 export type ApiCheckStatus = "checking" | "online" | "offline" | "idle";
 export interface ApiSource {
@@ -41,12 +41,21 @@ let apiStatusState: ApiStatusState = {
     nextStatuses: {},
 };
 let activeCheckNextOnly: Promise<void> | null = null;
+let activeCheckAll: Promise<void> | null = null;
 const activeSourceChecks = new Map<string, Promise<void>>();
 const listeners = new Set<() => void>();
+let apiStatusChangeScheduled = false;
 function emitApiStatusChange() {
-    for (const listener of listeners) {
-        listener();
+    if (apiStatusChangeScheduled) {
+        return;
     }
+    apiStatusChangeScheduled = true;
+    queueMicrotask(() => {
+        apiStatusChangeScheduled = false;
+        for (const listener of listeners) {
+            listener();
+        }
+    });
 }
 function setApiStatusState(updater: (current: ApiStatusState) => ApiStatusState) {
     apiStatusState = updater(apiStatusState);
@@ -151,10 +160,6 @@ export async function checkSpotiFLACNextStatusesOnly(): Promise<void> {
             },
         }));
         try {
-            setApiStatusState((current) => ({
-                ...current,
-                nextStatuses: { ...current.nextStatuses },
-            }));
             const nextStatuses = await checkSpotiFLACNextStatuses();
             setApiStatusState((current) => ({
                 ...current,
@@ -202,27 +207,67 @@ export async function checkApiStatus(sourceId: string): Promise<void> {
                 [sourceId]: "checking",
             },
         }));
+        let status: ApiCheckStatus = "offline";
         try {
-            const status = await checkSourceStatus(source);
+            status = await checkSourceStatus(source);
+        }
+        finally {
             setApiStatusState((current) => ({
                 ...current,
+                checkingSources: {
+                    ...current.checkingSources,
+                    [sourceId]: false,
+                },
                 statuses: {
                     ...current.statuses,
                     [sourceId]: status,
                 },
             }));
+            activeSourceChecks.delete(sourceId);
+        }
+    })();
+    activeSourceChecks.set(sourceId, task);
+    return task;
+}
+export async function checkAllApiStatuses(): Promise<void> {
+    if (activeCheckAll) {
+        return activeCheckAll;
+    }
+    activeCheckAll = (async () => {
+        const checkingSources = Object.fromEntries(API_SOURCES.map((source) => [source.id, true]));
+        const checkingStatuses = Object.fromEntries(API_SOURCES.map((source) => [source.id, "checking" as ApiCheckStatus]));
+        setApiStatusState((current) => ({
+            ...current,
+            checkingSources: {
+                ...current.checkingSources,
+                ...checkingSources,
+            },
+            statuses: {
+                ...current.statuses,
+                ...checkingStatuses,
+            },
+        }));
+        let results: Record<string, boolean> = {};
+        try {
+            results = await withTimeout(CheckAPIStatuses(Object.fromEntries(API_SOURCES.map((source) => [source.type, source.url]))), CHECK_TIMEOUT_MS, "API status check timed out after 10 seconds");
+        }
+        catch {
+            results = {};
         }
         finally {
             setApiStatusState((current) => ({
                 ...current,
                 checkingSources: {
                     ...current.checkingSources,
-                    [sourceId]: false,
+                    ...Object.fromEntries(API_SOURCES.map((source) => [source.id, false])),
+                },
+                statuses: {
+                    ...current.statuses,
+                    ...Object.fromEntries(API_SOURCES.map((source) => [source.id, (results[source.type] ? "online" : "offline") as ApiCheckStatus])),
                 },
             }));
-            activeSourceChecks.delete(sourceId);
+            activeCheckAll = null;
         }
     })();
-    activeSourceChecks.set(sourceId, task);
-    return task;
+    return activeCheckAll;
 }
@@ -0,0 +1,17 @@
+export const DEFAULT_DOWNLOAD_CONCURRENCY = 4;
+export const MAX_DOWNLOAD_CONCURRENCY = 8;
+export async function runWithConcurrency<T>(items: T[], limit: number, worker: (item: T, index: number) => Promise<void>, shouldStop?: () => boolean): Promise<number> {
+    let nextIndex = 0;
+    const workerCount = Math.max(1, Math.min(Math.floor(limit) || 1, items.length));
+    const runNext = async (): Promise<void> => {
+        while (nextIndex < items.length) {
+            if (shouldStop?.()) {
+                return;
+            }
+            const index = nextIndex++;
+            await worker(items[index], index);
+        }
+    };
+    await Promise.all(Array.from({ length: workerCount }, () => runNext()));
+    return nextIndex;
+}
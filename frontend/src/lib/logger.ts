@@ -1,23 +1,32 @@
 export type LogLevel = "info" | "success" | "warning" | "error" | "debug";
 export interface LogEntry {
+    id: number;
     timestamp: Date;
     level: LogLevel;
     message: string;
 }
+const LOG_NOTIFY_INTERVAL_MS = 100;
+const LOG_TRIM_SLACK = 100;
+const LOG_MESSAGE_MAX_LENGTH = 1000;
 class Logger {
     private logs: LogEntry[] = [];
     private maxLogs = 500;
+    private snapshot: LogEntry[] | null = null;
+    private nextId = 0;
     private listeners: Set<() => void> = new Set();
+    private notifyTimer: ReturnType<typeof setTimeout> | null = null;
     private addLog(level: LogLevel, message: string) {
         const entry: LogEntry = {
+            id: this.nextId++,
             timestamp: new Date(),
             level,
-            message: message,
+            message: message.length > LOG_MESSAGE_MAX_LENGTH ? message.slice(0, LOG_MESSAGE_MAX_LENGTH - 3) + "..." : message,
         };
         this.logs.push(entry);
-        if (this.logs.length > this.maxLogs) {
-            this.logs.shift();
+        if (this.logs.length >= this.maxLogs + LOG_TRIM_SLACK) {
+            this.logs.splice(0, this.logs.length - this.maxLogs);
         }
+        this.snapshot = null;
         this.notifyListeners();
     }
     info(message: string) {
@@ -36,17 +45,34 @@ class Logger {
         this.addLog("debug", message);
     }
     getLogs(): LogEntry[] {
-        return [...this.logs];
+        if (!this.snapshot) {
+            this.snapshot = this.logs.slice(-this.maxLogs);
+        }
+        return this.snapshot;
     }
     clear() {
         this.logs = [];
-        this.notifyListeners();
+        this.snapshot = null;
+        this.flushListeners();
     }
     subscribe(listener: () => void) {
         this.listeners.add(listener);
         return () => this.listeners.delete(listener);
     }
     private notifyListeners() {
+        if (this.notifyTimer !== null) {
+            return;
+        }
+        this.notifyTimer = setTimeout(() => {
+            this.notifyTimer = null;
+            this.listeners.forEach((listener) => listener());
+        }, LOG_NOTIFY_INTERVAL_MS);
+    }
+    private flushListeners() {
+        if (this.notifyTimer !== null) {
+            clearTimeout(this.notifyTimer);
+            this.notifyTimer = null;
+        }
         this.listeners.forEach((listener) => listener());
     }
 }
@@ -0,0 +1,44 @@
+import { WaitForDownloadQueueChange } from "../../wailsjs/go/main/App";
+const REFRESH_MIN_INTERVAL_MS = 200;
+const WAIT_TIMEOUT_MS = 5000;
+export interface QueueChangeStore<T> {
+    subscribe: (listener: () => void) => () => void;
+    getSnapshot: () => T;
+}
+export function createQueueChangeStore<T>(load: () => Promise<T>, initial: T, isSame: (a: T, b: T) => boolean, label: string): QueueChangeStore<T> {
+    let snapshot = initial;
+    let watching = false;
+    const listeners = new Set<() => void>();
+    const watch = async () => {
+        let version = 0;
+        while (listeners.size > 0) {
+            try {
+                const next = await load();
+                if (!isSame(snapshot, next)) {
+                    snapshot = next;
+                    listeners.forEach((listener) => listener());
+                }
+                await new Promise((resolve) => setTimeout(resolve, REFRESH_MIN_INTERVAL_MS));
+                version = await WaitForDownloadQueueChange(version, WAIT_TIMEOUT_MS);
+            }
+            catch (error) {
+                console.error(`Failed to get ${label}:`, error);
+                await new Promise((resolve) => setTimeout(resolve, WAIT_TIMEOUT_MS));
+            }
+        }
+        watching = false;
+    };
+    return {
+        subscribe(listener) {
+            listeners.add(listener);
+            if (!watching) {
+                watching = true;
+                void watch();
+            }
+            return () => {
+                listeners.delete(listener);
+            };
+        },
+        getSnapshot: () => snapshot,
+    };
+}
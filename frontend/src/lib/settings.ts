@@ -1,4 +1,5 @@
 import { GetDefaults, LoadFonts as LoadFontsFromBackend, LoadSettings, SaveFonts as SaveFontsToBackend, SaveSettings as SaveToBackend, } from "../../wailsjs/go/main/App";
+import { DEFAULT_DOWNLOAD_CONCURRENCY, MAX_DOWNLOAD_CONCURRENCY } from "./concurrency";
 export type BuiltInFontFamily = "google-sans" | "inter" | "poppins" | "roboto" | "dm-sans" | "plus-jakarta-sans" | "manrope" | "space-grotesk" | "noto-sans" | "nunito-sans" | "figtree" | "raleway" | "public-sans" | "outfit" | "jetbrains-mono" | "geist-sans" | "bricolage-grotesque";
 export type CustomFontFamily = `custom-${string}`;
 export type FontFamily = BuiltInFontFamily | CustomFontFamily;
@@ -55,6 +56,7 @@ export interface Settings {
     embedGenre: boolean;
     redownloadWithSuffix: boolean;
     separator: "comma" | "semicolon";
+    downloadConcurrency: number;
 }
 export const FOLDER_PRESETS: Record<FolderPreset, {
     label: string;
@@ -198,6 +200,7 @@ export const DEFAULT_SETTINGS: Settings = {
     embedGenre: false,
     redownloadWithSuffix: false,
     separator: "semicolon",
+    downloadConcurrency: DEFAULT_DOWNLOAD_CONCURRENCY,
 };
 export const FONT_OPTIONS: FontOption[] = [
     {
@@ -292,6 +295,7 @@ const GOOGLE_FONTS_CSS_HOST = "fonts.googleapis.com";
 const GOOGLE_FONTS_SPECIMEN_HOST = "fonts.google.com";
 const SETTINGS_KEY = "spotiflac-settings";
 let cachedSettings: Settings | null = null;
+let lastPersistedSettingsJSON: string | null = null;
 type SettingsPayload = Partial<Settings> & {
     darkMode?: boolean;
     [key: string]: unknown;
@@ -464,7 +468,8 @@ async function persistCustomFontsInternal(customFonts: CustomFontOption[]): Prom
             ...cachedSettings,
             customFonts: normalizedFonts,
         });
-        localStorage.setItem(SETTINGS_KEY, JSON.stringify(cachedSettings));
+        lastPersistedSettingsJSON = JSON.stringify(cachedSettings);
+        localStorage.setItem(SETTINGS_KEY, lastPersistedSettingsJSON);
         window.dispatchEvent(new CustomEvent("settingsUpdated", { detail: cachedSettings }));
     }
     return normalizedFonts;
@@ -516,6 +521,17 @@ function normalizePreviewVolume(volume: unknown): number {
     }
     return Math.min(100, Math.max(0, Math.round(parsed)));
 }
+function normalizeDownloadConcurrency(value: unknown): number {
+    const parsed = typeof value === "number"
+        ? value
+        : typeof value === "string"
+            ? Number.parseInt(value, 10)
+            : Number.NaN;
+    if (!Number.isFinite(parsed)) {
+        return DEFAULT_SETTINGS.downloadConcurrency;
+    }
+    return Math.min(MAX_DOWNLOAD_CONCURRENCY, Math.max(1, Math.round(parsed)));
+}
 function normalizeCustomTidalApi(value: unknown): string {
     return typeof value === "string"
         ? value.trim().replace(/\/+$/g, "")
@@ -608,6 +624,7 @@ function normalizeSettingsPayload(settings: SettingsPayload): SettingsPayload {
         normalized.createM3u8File = false;
     }
     normalized.previewVolume = normalizePreviewVolume(normalized.previewVolume);
+    normalized.downloadConcurrency = normalizeDownloadConcurrency(normalized.downloadConcurrency);
     normalized.existingFileCheckMode = normalizeExistingFileCheckMode(normalized.existingFileCheckMode);
     if (!("useFirstArtistOnly" in normalized)) {
         normalized.useFirstArtistOnly = false;
@@ -638,10 +655,15 @@ function toNormalizedSettings(settings: SettingsPayload): Settings {
 }
 async function persistSettingsInternal(settings: Settings, notify = true): Promise<void> {
     cachedSettings = settings;
-    localStorage.setItem(SETTINGS_KEY, JSON.stringify(settings));
+    const serialized = JSON.stringify(settings);
+    if (serialized === lastPersistedSettingsJSON) {
+        return;
+    }
+    localStorage.setItem(SETTINGS_KEY, serialized);
     const settingsForBackend = { ...settings } as Record<string, unknown>;
     delete settingsForBackend.customFonts;
     await SaveToBackend(settingsForBackend);
+    lastPersistedSettingsJSON = serialized;
     if (notify) {
         window.dispatchEvent(new CustomEvent("settingsUpdated", { detail: settings }));
     }
@@ -669,10 +691,10 @@ function getSettingsFromLocalStorage(): Settings {
     return DEFAULT_SETTINGS;
 }
 export function getSettings(): Settings {
-    if (cachedSettings) {
-        return cachedSettings;
+    if (!cachedSettings) {
+        cachedSettings = getSettingsFromLocalStorage();
     }
-    return getSettingsFromLocalStorage();
+    return cachedSettings;
 }
 export async function loadSettings(): Promise<Settings> {
     try {
@@ -722,21 +744,49 @@ export interface TemplateData {
     date?: string;
     playlist?: string;
 }
+const TEMPLATE_FIELD_PATTERN = /\{(title|artist|album_artist|album|isrc|track|disc|year|date|playlist)\}/;
+const compiledTemplates = new Map<string, string[]>();
+function compileTemplate(template: string): string[] {
+    let parts = compiledTemplates.get(template);
+    if (!parts) {
+        parts = template.split(TEMPLATE_FIELD_PATTERN);
+        compiledTemplates.set(template, parts);
+    }
+    return parts;
+}
+function templateFieldValue(field: string, data: TemplateData): string {
+    switch (field) {
+        case "title":
+            return data.title || "Unknown Title";
+        case "artist":
+            return data.artist || "Unknown Artist";
+        case "album":
+            return data.album || "Unknown Album";
+        case "album_artist":
+            return data.album_artist || data.artist || "Unknown Artist";
+        case "isrc":
+            return data.isrc || "";
+        case "track":
+            return data.track ? String(data.track).padStart(2, "0") : "00";
+        case "disc":
+            return data.disc ? String(data.disc) : "1";
+        case "year":
+            return data.year || "0000";
+        case "date":
+            return data.date || "0000-00-00";
+        default:
+            return data.playlist || "";
+    }
+}
 export function parseTemplate(template: string, data: TemplateData): string {
     if (!template) {
         return "";
     }
-    let result = template;
-    result = result.replace(/\{title\}/g, data.title || "Unknown Title");
-    result = result.replace(/\{artist\}/g, data.artist || "Unknown Artist");
-    result = result.replace(/\{album\}/g, data.album || "Unknown Album");
-    result = result.replace(/\{album_artist\}/g, data.album_artist || data.artist || "Unknown Artist");
-    result = result.replace(/\{isrc\}/g, data.isrc || "");
-    result = result.replace(/\{track\}/g, data.track ? String(data.track).padStart(2, "0") : "00");
-    result = result.replace(/\{disc\}/g, data.disc ? String(data.disc) : "1");
-    result = result.replace(/\{year\}/g, data.year || "0000");
-    result = result.replace(/\{date\}/g, data.date || "0000-00-00");
-    result = result.replace(/\{playlist\}/g, data.playlist || "");
+    const parts = compileTemplate(template);
+    let result = parts[0];
+    for (let i = 1; i < parts.length; i += 2) {
+        result += templateFieldValue(parts[i], data) + parts[i + 1];
+    }
     return result;
 }
 export async function getSettingsWithDefaults(): Promise<Settings> {
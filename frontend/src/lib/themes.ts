@@ -264,10 +264,16 @@ export const themes: Theme[] = [
     createTheme("violet", "Violet", primaryColors.violet),
     createTheme("yellow", "Yellow", primaryColors.yellow),
 ].sort((a, b) => a.name.localeCompare(b.name));
+let appliedThemeKey: string | null = null;
 export function applyTheme(themeName: string) {
     const theme = themes.find((t) => t.name === themeName) || themes[0];
     const root = document.documentElement;
     const isDark = root.classList.contains("dark");
+    const themeKey = `${theme.name}:${isDark ? "dark" : "light"}`;
+    if (themeKey === appliedThemeKey) {
+        return;
+    }
+    appliedThemeKey = themeKey;
     const vars = isDark ? theme.cssVars.dark : theme.cssVars.light;
     Object.entries(vars).forEach(([key, value]) => {
         root.style.setProperty(`--${key}`, value);
@@ -5,6 +5,7 @@ import type { Settings } from "./settings";
 export function cn(...inputs: ClassValue[]) {
     return twMerge(clsx(inputs));
 }
+export const SLASH_PLACEHOLDER_PATTERN = /__SLASH_PLACEHOLDER__/g;
 export function sanitizePath(input: string, os: string): string {
     const sanitized = input.trim();
     if (os === "Windows") {
@@ -53,3 +54,22 @@ export function getFirstArtist(artistString: string): string {
     const parts = artistString.split(delimiters);
     return parts[0].trim();
 }
+const MAX_DURATION_LABEL_CACHE_SIZE = 4096;
+const durationLabelCache = new Map<number, string>();
+export function formatDurationSeconds(seconds: number): string {
+    const totalSeconds = Math.floor(seconds);
+    let label = durationLabelCache.get(totalSeconds);
+    if (label === undefined) {
+        const mins = Math.floor(totalSeconds / 60);
+        const secs = totalSeconds % 60;
+        label = `${mins}:${secs.toString().padStart(2, "0")}`;
+        if (durationLabelCache.size >= MAX_DURATION_LABEL_CACHE_SIZE) {
+            durationLabelCache.clear();
+        }
+        durationLabelCache.set(totalSeconds, label);
+    }
+    return label;
+}
+export function formatDurationMs(ms: number): string {
+    return formatDurationSeconds(ms / 1000);
+}
@@ -20,6 +20,7 @@ var assets embed.FS
 var wailsJSON []byte
 
 func main() {
+	backend.StartAsyncConsole()
 
 	type wailsInfo struct {
 		Info struct {